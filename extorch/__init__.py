@@ -1,3 +1,9 @@
 from .conv1d import Conv1dEx
 from .convt1d import ConvT1dEx
+from .conv2d import Conv2dEx
+from .convt2d import ConvT2dEx
 from .transpose import Transpose
+from .depthwise import DepthwiseConv1dEx, SeparableConv1dEx
+from .antialias import AntiAliasConv1dEx
+from .winograd import WinogradConv1dEx
+from .gated import GatedConv1dEx
@@ -0,0 +1,116 @@
+"Anti-aliased strided Conv1dEx"
+
+from math import comb
+from typing import Literal, Any, Sequence
+import weakref
+
+import torch
+from torch import Tensor, nn
+import torch.nn.functional as F
+
+from .conv1d import Conv1dEx
+from .padding import kernel_lr
+from .precision import accumulation_dtype
+
+
+# Fused kernels, recomputed when the weight/lowpass is replaced or modified in place
+_FUSED: "weakref.WeakKeyDictionary[nn.Module, tuple[tuple[Any, ...], Tensor]]" = weakref.WeakKeyDictionary()
+
+
+def binomial_lowpass(size: int) -> list[float]:
+    """Normalized binomial lowpass filter, e.g. size3 -> [1/4, 2/4, 1/4]."""
+    coeffs = [comb(size - 1, k) for k in range(size)]
+    return [coeff / sum(coeffs) for coeff in coeffs]
+
+
+class AntiAliasConv1dEx(Conv1dEx):
+    """Conv1dEx with fused fixed lowpass, equivalent to `lowpass -> strided Conv1dEx` pair.
+
+    Fixed lowpass is convolved into the learned kernel, then only kept phases (strided outputs) are evaluated.
+    The unfused pair computes full-rate filtered signal and drops `stride - 1` of every `stride` samples,
+    the fused one costs a single strided conv with `kernel_size + lowpass_size - 1` taps.
+
+        unfused:  x -> lowpass(stride1, same) -> Conv1dEx(stride s) -> y
+        fused:    x -> Conv1dEx(kernel ⊛ lowpass, stride s)          -> y
+
+    Lowpass alignment follows the `causal` option (causal: ◢ shape, normal: centered),
+    conv alignment follows `stride_lr` as Conv1dEx (causal: stride tail, normal: stride center).
+    Output is identical to the unfused pair, except for the right-padded non-fulfilled last stride of `padding='scale_ceil'`
+    and the zero-padded edges of normal conv (unfused pair pads the filtered signal, fused one pads the input).
+    """
+    def __init__(self,
+        in_channels:  int,
+        out_channels: int,
+        kernel_size:  int,
+        *args:        Any,
+        causal:       bool = False,
+        stride:       int  = 1,
+        padding:      Literal["same", "valid", "scale", "scale_drop", "scale_ceil"] | int | tuple[int] = 0,
+        dilation:     int  = 1,
+        groups:       int  = 1,
+        bias:         bool = True,
+        padding_mode: str  = "zeros",
+        lowpass:      int | Sequence[float] = 3,
+        device             = None,
+        dtype              = None,
+    ):
+        """All arguments of `Conv1dEx`, and new option.
+
+        Args:
+            lowpass - Fixed lowpass filter, size of binomial filter or explicit filter coefficients
+        """
+        if len(args) > 0:
+            raise RuntimeError("AntiAliasConv1dEx needs named arguments for stride and subsequents.")
+        if padding_mode != "zeros":
+            raise RuntimeError("Currently AntiAliasConv1dEx support only `padding_mode='zeros'`.")
+
+        super().__init__(in_channels, out_channels, kernel_size, causal=causal, stride=stride, padding=padding, dilation=dilation,
+            groups=groups, bias=bias, padding_mode=padding_mode, device=device, dtype=dtype)
+
+        coeffs = binomial_lowpass(lowpass) if isinstance(lowpass, int) else list(lowpass)
+        self.register_buffer("lowpass", torch.tensor(coeffs, device=device, dtype=self.weight.dtype), persistent=False)
+
+        # Padding = conv padding (all explicit) + lowpass 'same' padding
+        conv_l, conv_r = self._padding_total()
+        lowpass_l, lowpass_r = kernel_lr(len(coeffs), "causal" if causal else "delta")
+        self._input_padding = (conv_l + lowpass_l, conv_r + lowpass_r)
+        self.padding = (0,)
+
+    def _effective_kernel(self) -> int:
+        """Effective kernel size of fused `kernel ⊛ lowpass`."""
+        return super()._effective_kernel() + self.lowpass.size(0) - 1
+
+    def fused_weight(self) -> Tensor:
+        """Fused kernel `kernel ⊛ lowpass`, (C_out, C_in/groups, K_eff + K_lp - 1).
+
+        It is cached while the weight/lowpass is unchanged and autograd does not record the weight (e.g. inference).
+        Inference tensor weight (created in inference mode) has no version counter, so it is not cached.
+        """
+        tensors = (self.weight, self.lowpass)
+        if (torch.is_grad_enabled() and self.weight.requires_grad) or any(tensor.is_inference() for tensor in tensors):
+            return self._fuse()
+        versions = (tuple((tensor.data_ptr(), tensor._version) for tensor in tensors), torch.is_inference_mode_enabled()) # pylint: disable=protected-access
+        cached = _FUSED.get(self)
+        if cached is not None and cached[0] == versions:
+            return cached[1]
+        fused = self._fuse()
+        _FUSED[self] = (versions, fused)
+        return fused
+
+    def _fuse(self) -> Tensor:
+        """Build the fused kernel `kernel ⊛ lowpass`."""
+        c_out, c_in, _ = self.weight.shape
+        kernel_eff, lowpass_size = super()._effective_kernel(), self.lowpass.size(0)
+        # Convolution as shifted sum, fused[m] = Σ_b lowpass[b] * kernel[m - b], accumulated in fp32 for reduced precision
+        fused = self.weight.new_zeros(c_out, c_in, kernel_eff + lowpass_size - 1, dtype=accumulation_dtype(self.weight.dtype))
+        for tap in range(lowpass_size):
+            fused[..., tap : tap + kernel_eff : self.dilation[0]] += self.lowpass[tap] * self.weight
+        return fused.to(self.weight.dtype)
+
+    def _forward_valid(self, x: Tensor) -> Tensor:
+        """Forward strided conv with the fused kernel, without any padding."""
+        return F.conv1d(x, self.fused_weight(), self.bias, self.stride, 0, 1, self.groups)
+
+    def forward(self, x: Tensor):
+        """Forward strided conv with the fused kernel."""
+        return self._forward_valid(F.pad(x, self._input_padding))
@@ -0,0 +1,98 @@
+"""Test of AntiAliasConv1dEx"""
+
+import torch
+from torch import nn, tensor, allclose, no_grad # pylint: disable=no-name-in-module
+
+from .conv1d import Conv1dEx
+from .antialias import AntiAliasConv1dEx, binomial_lowpass
+
+
+def _unfused_pair(conv: AntiAliasConv1dEx, causal: bool) -> nn.Sequential:
+    """Build `lowpass -> strided Conv1dEx` pair equivalent to the fused conv."""
+    channels, lowpass_size = conv.in_channels, conv.lowpass.size(0)
+    lowpass = Conv1dEx(channels, channels, lowpass_size, causal=causal, padding="same", groups=channels, bias=False)
+    lowpass.weight.copy_(conv.lowpass.expand(channels, 1, lowpass_size))
+    strided = Conv1dEx(channels, conv.out_channels, conv.kernel_size[0], causal=causal, stride=conv.stride[0], padding="scale_drop", dilation=conv.dilation[0], groups=conv.groups)
+    strided.load_state_dict(conv.state_dict())
+    return nn.Sequential(lowpass, strided)
+
+
+def test_binomial_lowpass():
+    """binomial_lowpass should yield normalized binomial coefficients."""
+    assert binomial_lowpass(1) == [1.]
+    assert binomial_lowpass(3) == [0.25, 0.5, 0.25]
+
+
+def test_antialias_conv1dex_fused_kernel():
+    """AntiAliasConv1dEx should fuse kernel and lowpass by convolution.
+
+    kernel (2,3,5) ⊛ lowpass (1,2,1)
+                   2   3   5
+                       4   6  10
+                           2   3   5
+     ---------------------------------
+    fused          2   7  13  13   5
+    """
+
+    with no_grad():
+        conv = AntiAliasConv1dEx(1, 1, 3, causal=True, stride=2, padding="scale_drop", lowpass=[1., 2., 1.], bias=False)
+        conv.weight[0][0] = tensor([2., 3., 5.])
+
+        assert allclose(conv.fused_weight(), tensor([[[2., 7., 13., 13., 5.]]]))
+
+
+def test_antialias_conv1dex_fused_cache():
+    """AntiAliasConv1dEx should reuse the fused kernel, and rebuild it after in-place weight update or under autograd."""
+
+    conv = AntiAliasConv1dEx(1, 1, 3, causal=True, stride=2, padding="scale_drop", lowpass=[1., 2., 1.], bias=False)
+    with no_grad():
+        conv.weight[0][0] = tensor([2., 3., 5.])
+        fused = conv.fused_weight()
+        assert conv.fused_weight() is fused
+        conv.weight.mul_(2.)
+        assert allclose(conv.fused_weight(), tensor([[[4., 14., 26., 26., 10.]]]))
+
+    # Fresh kernel tracked by autograd
+    conv(torch.randn(1, 1, 8)).sum().backward()
+    assert conv.weight.grad is not None
+
+
+def test_antialias_conv1dex_equivalence_causal():
+    """Causal AntiAliasConv1dEx should be identical to causal `lowpass -> strided conv` pair."""
+
+    torch.manual_seed(0)
+    with no_grad():
+        for stride, kernel, dilation, lowpass in ((2, 3, 1, 3), (3, 4, 1, 5), (2, 3, 2, 4), (4, 1, 1, 7)):
+            conv = AntiAliasConv1dEx(3, 5, kernel, causal=True, stride=stride, padding="scale_drop", dilation=dilation, lowpass=lowpass)
+            pair = _unfused_pair(conv, causal=True)
+            for length in (16, 17, 30):
+                ipt = torch.randn(2, 3, length)
+                opt, opt_gt = conv(ipt), pair(ipt)
+                assert opt.shape == opt_gt.shape
+                assert allclose(opt, opt_gt, atol=1e-5), f"s{stride}/k{kernel}/d{dilation}/lp{lowpass}/L{length}"
+
+
+def test_antialias_conv1dex_equivalence_normal():
+    """Normal AntiAliasConv1dEx should be identical to `lowpass -> strided conv` pair except for padded edges."""
+
+    torch.manual_seed(0)
+    with no_grad():
+        conv = AntiAliasConv1dEx(3, 5, 3, stride=2, padding="scale_drop", lowpass=3)
+        pair = _unfused_pair(conv, causal=False)
+        ipt = torch.randn(2, 3, 32)
+        opt, opt_gt = conv(ipt), pair(ipt)
+
+        assert opt.shape == opt_gt.shape
+        assert allclose(opt[..., 1:-1], opt_gt[..., 1:-1], atol=1e-5)
+
+
+def test_antialias_conv1dex_length():
+    """AntiAliasConv1dEx should keep the output length of Conv1dEx."""
+
+    for causal in (False, True):
+        for padding in ("scale_drop", "scale_ceil"):
+            conv    = AntiAliasConv1dEx(1, 1, 4, causal=causal, stride=3, padding=padding, lowpass=5)
+            conv_gt =          Conv1dEx(1, 1, 4, causal=causal, stride=3, padding=padding)
+            for length in (9, 10, 11):
+                ipt = torch.randn(1, 1, length)
+                assert conv(ipt).shape == conv_gt(ipt).shape
@@ -0,0 +1,528 @@
+"""Micro benchmarks of extorch modules."""
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable
+import os
+import tempfile
+
+import numpy as np
+import torch
+from torch import nn
+from torch.profiler import profile, ProfilerActivity
+import torch.nn.functional as F
+
+from .conv1d import Conv1dEx
+from .convt1d import ConvT1dEx
+from .antialias import AntiAliasConv1dEx
+from .parallel import forward_blocked
+from .pipeline import StreamPipeline, forward_stream_pipelined
+from .stream import init_states, forward_stream
+from .silence import forward_stream_skip
+from .dilation import forward_space_to_batch
+from .gated import GatedConv1dEx
+from .ensemble import stack_modules, forward_stacked
+from .prefix import PrefixCache
+from . import padding, padding_vec
+from .precision import accuracy_report
+from .storage import save_model, load_model
+from .depthwise import DepthwiseConv1dEx
+from .winograd import WinogradConv1dEx
+from .bucket import length_multiple, BucketBatchSampler, PadCollator, padding_waste
+from .timing import measure
+
+
+def bench_depthwise(
+        channels:    tuple[int, ...] = (64, 128, 256, 512),
+        length:      int  = 4000,
+        kernel_size: int  = 3,
+        stride:      int  = 1,
+        dilation:    int  = 1,
+        causal:      bool = True,
+        batch_size:  int  = 1,
+        n_repeat:    int  = 10,
+    ) -> list[dict[str, Any]]:
+    """Benchmark DepthwiseConv1dEx against the generic `Conv1dEx(groups=in_channels)` path.
+
+    Returns:
+        - Rows of {channels, generic [sec], depthwise [sec], speedup}
+    """
+    padding = "same" if stride == 1 else "scale_ceil"
+    rows = []
+    with torch.inference_mode():
+        for channel in channels:
+            generic = Conv1dEx(channel, channel, kernel_size, causal=causal, stride=stride, padding=padding, dilation=dilation, groups=channel)
+            depthwise = DepthwiseConv1dEx(channel, channel, kernel_size, causal=causal, stride=stride, padding=padding, dilation=dilation)
+            depthwise.load_state_dict(generic.state_dict())
+            ipt = torch.randn(batch_size, channel, length)
+            time_generic   = measure(lambda: generic(ipt),   n_repeat=n_repeat) # pylint: disable=cell-var-from-loop
+            time_depthwise = measure(lambda: depthwise(ipt), n_repeat=n_repeat) # pylint: disable=cell-var-from-loop
+            rows.append({"channels": channel, "generic": time_generic, "depthwise": time_depthwise, "speedup": time_generic / time_depthwise})
+    return rows
+
+
+def bench_antialias(
+        strides:     tuple[int, ...] = (2, 4, 8),
+        channels:    int  = 256,
+        length:      int  = 16000,
+        kernel_size: int  = 4,
+        lowpass:     int  = 5,
+        lowpass_groups: int | None = None,
+        causal:      bool = True,
+        batch_size:  int  = 1,
+        n_repeat:    int  = 10,
+    ) -> list[dict[str, Any]]:
+    """Benchmark AntiAliasConv1dEx against the unfused `lowpass Conv1dEx -> strided Conv1dEx` pair.
+
+    Args:
+        lowpass_groups - `groups` of the unfused lowpass Conv1dEx, `None` for depthwise (`channels`)
+
+    Returns:
+        - Rows of {stride, unfused [sec], fused [sec], speedup}
+    """
+    rows = []
+    with torch.inference_mode():
+        for stride in strides:
+            fused = AntiAliasConv1dEx(channels, channels, kernel_size, causal=causal, stride=stride, padding="scale_drop", lowpass=lowpass)
+            unfused = nn.Sequential(
+                Conv1dEx(channels, channels, lowpass,     causal=causal,                padding="same",       groups=lowpass_groups or channels, bias=False),
+                Conv1dEx(channels, channels, kernel_size, causal=causal, stride=stride, padding="scale_drop"),
+            )
+            ipt = torch.randn(batch_size, channels, length)
+            time_unfused = measure(lambda: unfused(ipt), n_repeat=n_repeat) # pylint: disable=cell-var-from-loop
+            time_fused   = measure(lambda: fused(ipt),   n_repeat=n_repeat) # pylint: disable=cell-var-from-loop
+            rows.append({"stride": stride, "unfused": time_unfused, "fused": time_fused, "speedup": time_unfused / time_fused})
+    return rows
+
+
+def bench_parallel_scaling(
+        max_workers: int | None = None,
+        channels:    int  = 64,
+        length:      int  = 160000,
+        kernel_size: int  = 3,
+        dilation:    int  = 1,
+        causal:      bool = True,
+        batch_size:  int  = 1,
+        n_repeat:    int  = 10,
+    ) -> list[dict[str, Any]]:
+    """Benchmark scaling of time-block parallel Conv1dEx from 1 to N workers.
+
+    Args:
+        max_workers - Maximum number of workers, `os.cpu_count()` if None
+    Returns:
+        - Rows of {workers, time [sec], speedup (vs 1 worker), single_call [sec] (plain `conv(x)`)}
+    """
+    conv = Conv1dEx(channels, channels, kernel_size, causal=causal, padding="same", dilation=dilation)
+    ipt = torch.randn(batch_size, channels, length)
+    rows = []
+    with torch.inference_mode():
+        time_single = measure(lambda: conv(ipt), n_repeat=n_repeat)
+        for n_workers in range(1, (max_workers or os.cpu_count() or 1) + 1):
+            with ThreadPoolExecutor(max_workers=n_workers) as pool:
+                time_blocked = measure(lambda: forward_blocked(conv, ipt, n_workers, pool), n_repeat=n_repeat) # pylint: disable=cell-var-from-loop
+            rows.append({"workers": n_workers, "time": time_blocked, "single_call": time_single})
+    for row in rows:
+        row["speedup"] = rows[0]["time"] / row["time"]
+    return rows
+
+
+def bench_padding_vec(n_configs: tuple[int, ...] = (1000, 100000), n_repeat: int = 3) -> list[dict[str, Any]]:
+    """Benchmark vectorized `padding_vec.padding_lr` against the scalar `padding.padding_lr` loop.
+
+    Returns:
+        - Rows of {configs, scalar [sec], vectorized [sec], speedup}
+    """
+    rng = np.random.default_rng(0)
+    rows = []
+    for n_config in n_configs:
+        kernel, stride = rng.integers(1, 16, n_config), rng.integers(1, 8, n_config)
+        shape, align, drop_last = rng.integers(0, 3, n_config), rng.integers(0, 3, n_config), rng.integers(0, 2, n_config).astype(bool)
+        configs = list(zip(kernel.tolist(), [padding_vec.SHAPES[code] for code in shape], stride.tolist(), [padding_vec.ALIGNS[code] for code in align], drop_last.tolist()))
+        time_scalar     = measure(lambda: [padding.padding_lr(*config) for config in configs],         n_warmup=1, n_repeat=n_repeat) # pylint: disable=cell-var-from-loop
+        time_vectorized = measure(lambda: padding_vec.padding_lr(kernel, shape, stride, align, drop_last), n_warmup=1, n_repeat=n_repeat) # pylint: disable=cell-var-from-loop
+        rows.append({"configs": n_config, "scalar": time_scalar, "vectorized": time_vectorized, "speedup": time_scalar / time_vectorized})
+    return rows
+
+
+def bench_reduced_precision(
+        configs: tuple[tuple[str, bool, int, int], ...] = (
+            # module      causal stride dilation
+            ("Conv1dEx",  False, 1,     1),
+            ("Conv1dEx",  True,  1,     1),
+            ("Conv1dEx",  True,  1,     8),
+            ("Conv1dEx",  True,  2,     1),
+            ("ConvT1dEx", False, 2,     1),
+            ("ConvT1dEx", True,  2,     1),
+            ("ConvT1dEx", True,  4,     2),
+        ),
+        channels:    int = 256,
+        length:      int = 8000,
+        kernel_size: int = 4,
+        dtype:       torch.dtype = torch.bfloat16,
+        batch_size:  int = 1,
+        n_repeat:    int = 10,
+    ) -> list[dict[str, Any]]:
+    """Benchmark speed and accuracy of reduced-precision CPU autocast against fp32.
+
+    Returns:
+        - Rows of {module, causal, stride, dilation, fp32 [sec], reduced [sec], speedup, max_abs, rel, snr_db}
+    """
+    rows = []
+    with torch.inference_mode():
+        for module, causal, stride, dilation in configs:
+            padding = "same" if stride == 1 else "scale_drop"
+            cls = Conv1dEx if module == "Conv1dEx" else ConvT1dEx
+            conv = cls(channels, channels, kernel_size, causal=causal, stride=stride, padding=padding, dilation=dilation)
+            ipt = torch.randn(batch_size, channels, length)
+
+            def forward_reduced():
+                with torch.autocast("cpu", dtype=dtype):
+                    return conv(ipt) # pylint: disable=cell-var-from-loop
+
+            time_fp32    = measure(lambda: conv(ipt), n_repeat=n_repeat) # pylint: disable=cell-var-from-loop
+            time_reduced = measure(forward_reduced,   n_repeat=n_repeat)
+            report = accuracy_report(forward_reduced(), conv(ipt))
+            rows.append({"module": module, "causal": causal, "stride": stride, "dilation": dilation,
+                "fp32": time_fp32, "reduced": time_reduced, "speedup": time_fp32 / time_reduced, **report})
+    return rows
+
+
+def bench_pipeline(
+        n_stages:   tuple[int, ...] = (1, 2, 4),
+        n_layers:   int = 8,
+        channels:   int = 256,
+        chunk_size: int = 160,
+        n_chunks:   int = 50,
+        n_repeat:   int = 3,
+    ) -> list[dict[str, Any]]:
+    """Benchmark throughput and end-to-end latency of `StreamPipeline` over the number of stages, with a deep causal stack.
+
+    Returns:
+        - Rows of {stages, throughput [samples/sec], latency [sec]}, latency is the put-to-get time of a single chunk in idle pipeline
+    """
+    layers = [Conv1dEx(channels, channels, 3, causal=True, padding="same", dilation=2**(idx % 4)) for idx in range(n_layers)]
+    model = nn.Sequential(*[module for layer in layers for module in (layer, nn.ReLU())])
+    chunks = list(torch.randn(1, channels, chunk_size * n_chunks).split(chunk_size, dim=-1))
+
+    rows = []
+    for n_stage in n_stages:
+        time_total = measure(lambda: list(forward_stream_pipelined(model, chunks, n_stage)), n_warmup=1, n_repeat=n_repeat) # pylint: disable=cell-var-from-loop
+        with StreamPipeline(model, n_stage) as pipe:
+            def roundtrip():
+                pipe.put(chunks[0]) # pylint: disable=cell-var-from-loop
+                pipe.get()          # pylint: disable=cell-var-from-loop
+            latency = measure(roundtrip, n_repeat=n_chunks)
+        rows.append({"stages": n_stage, "throughput": chunk_size * n_chunks / time_total, "latency": latency})
+    return rows
+
+
+def bench_model_load(
+        n_layers:    int = 16,
+        channels:    int = 512,
+        kernel_size: int = 5,
+        length:      int = 160,
+        n_repeat:    int = 5,
+    ) -> list[dict[str, Any]]:
+    """Benchmark time-to-first-inference (load + first forward) of `storage.load_model` against `torch.load` of state_dict.
+
+    Files are in the page cache after the first load, so this measures deserialization/construction cost, not disk I/O.
+
+    Returns:
+        - Rows of {method, time [sec]}
+    """
+    def build() -> nn.Sequential:
+        return nn.Sequential(*[Conv1dEx(channels, channels, kernel_size, causal=True, padding="same") for _ in range(n_layers)])
+
+    model, ipt = build(), torch.randn(1, channels, length)
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path_torch, path_exmd = Path(tmp_dir) / "model.pt", Path(tmp_dir) / "model.exmd"
+        torch.save(model.state_dict(), path_torch)
+        save_model(model, path_exmd)
+
+        def load_torch():
+            loaded = build()
+            loaded.load_state_dict(torch.load(path_torch))
+            with torch.inference_mode():
+                loaded(ipt)
+
+        def load_exmd(use_mmap: bool):
+            loaded = load_model(path_exmd, use_mmap=use_mmap)
+            with torch.inference_mode():
+                loaded(ipt)
+
+        for method, fn in (("torch_load", load_torch), ("read", lambda: load_exmd(False)), ("mmap", lambda: load_exmd(True))):
+            rows.append({"method": method, "time": measure(fn, n_warmup=1, n_repeat=n_repeat)})
+    return rows
+
+
+def bench_winograd(
+        channels:     tuple[int, ...] = (64, 128, 256, 512),
+        kernel_sizes: tuple[int, ...] = (3, 5),
+        tile:         int  = 4,
+        length:       int  = 4000,
+        causal:       bool = True,
+        batch_size:   int  = 1,
+        n_repeat:     int  = 10,
+    ) -> list[dict[str, Any]]:
+    """Benchmark `WinogradConv1dEx` against the direct Conv1dEx path.
+
+    Returns:
+        - Rows of {channels, kernel_size, direct [sec], winograd [sec], speedup, max_abs}
+    """
+    rows = []
+    with torch.inference_mode():
+        for channel in channels:
+            for kernel_size in kernel_sizes:
+                conv = Conv1dEx(channel, channel, kernel_size, causal=causal, padding="same")
+                conv_winograd = WinogradConv1dEx(channel, channel, kernel_size, causal=causal, padding="same", tile=tile)
+                conv_winograd.load_state_dict(conv.state_dict())
+                ipt = torch.randn(batch_size, channel, length)
+
+                time_direct   = measure(lambda: conv(ipt),          n_repeat=n_repeat) # pylint: disable=cell-var-from-loop
+                time_winograd = measure(lambda: conv_winograd(ipt), n_repeat=n_repeat) # pylint: disable=cell-var-from-loop
+                max_abs = (conv_winograd(ipt) - conv(ipt)).abs().max().item()
+                rows.append({"channels": channel, "kernel_size": kernel_size, "direct": time_direct, "winograd": time_winograd,
+                    "speedup": time_direct / time_winograd, "max_abs": max_abs})
+    return rows
+
+
+def bench_bucketing(
+        n_sequences: int = 256,
+        batch_size:  int = 16,
+        min_length:  int = 1000,
+        max_length:  int = 16000,
+        channels:    int = 64,
+        seed:        int = 0,
+    ) -> list[dict[str, Any]]:
+    """Benchmark a training epoch (forward + backward) of a strided causal stack with random batching vs `BucketBatchSampler`.
+
+    Returns:
+        - Rows of {method, waste (ratio of padded samples), time [sec/epoch], throughput [samples/sec], speedup}
+    """
+    model = nn.Sequential(
+        Conv1dEx(1, channels, 5, causal=True, padding="same"), nn.ReLU(),
+        Conv1dEx(channels, channels, 4, causal=True, stride=2, padding="scale_ceil"), nn.ReLU(),
+        Conv1dEx(channels, channels, 6, causal=True, stride=3, padding="scale_ceil"), nn.ReLU(),
+        Conv1dEx(channels, 1, 3, causal=True, padding="same"),
+    )
+    generator = torch.Generator().manual_seed(seed)
+    lengths = torch.randint(min_length, max_length + 1, (n_sequences,), generator=generator).tolist()
+    dataset = [torch.randn(1, length, generator=generator) for length in lengths]
+    collator = PadCollator(length_multiple(model))
+
+    batches_random = [list(range(start, min(start + batch_size, n_sequences))) for start in range(0, n_sequences, batch_size)]
+    batches_bucket = BucketBatchSampler(lengths, batch_size, seed=seed).batches()
+
+    rows = []
+    for method, batches in (("random", batches_random), ("bucket", batches_bucket)):
+        def epoch():
+            for batch in batches: # pylint: disable=cell-var-from-loop
+                ipt, _ = collator([dataset[idx] for idx in batch])
+                model(ipt).sum().backward()
+        time_epoch = measure(epoch, n_warmup=1, n_repeat=1)
+        rows.append({"method": method, "waste": padding_waste(lengths, batches, collator.multiple), "time": time_epoch,
+            "throughput": sum(lengths) / time_epoch, "speedup": rows[0]["time"] / time_epoch if rows else 1.})
+    return rows
+
+
+def bench_silence(
+        silence_ratios: tuple[float, ...] = (0., 0.5, 0.9),
+        n_layers:       int = 6,
+        channels:       int = 128,
+        chunk_size:     int = 160,
+        n_chunks:       int = 100,
+        n_repeat:       int = 3,
+    ) -> list[dict[str, Any]]:
+    """Benchmark silence-aware streaming (`silence.forward_stream_skip`) against `stream.forward_stream`, over ratio of silent chunks.
+
+    Returns:
+        - Rows of {silence, normal [sec], skip [sec], speedup, skipped (ratio of skipped MACs)}
+    """
+    layers = [Conv1dEx(1, channels, 5, causal=True, padding="same")]
+    layers += [Conv1dEx(channels, channels, 3, causal=True, padding="same", dilation=2**idx) for idx in range(n_layers - 2)]
+    layers += [Conv1dEx(channels, 1, 3, causal=True, padding="same")]
+    model = nn.Sequential(*[module for layer in layers for module in (layer, nn.ReLU())][:-1])
+
+    rows = []
+    with torch.inference_mode():
+        for ratio in silence_ratios:
+            # Silence as a contiguous segment at the end, as in utterances followed by pauses
+            n_voiced = round(n_chunks * (1. - ratio))
+            chunks = [torch.randn(1, 1, chunk_size) if idx < n_voiced else torch.zeros(1, 1, chunk_size) for idx in range(n_chunks)]
+            stats: dict[str, int] = {}
+
+            def run_normal():
+                states = init_states(model)
+                for chunk in chunks: # pylint: disable=cell-var-from-loop
+                    _, states = forward_stream(model, chunk, states)
+
+            def run_skip():
+                states = init_states(model)
+                stats.clear() # pylint: disable=cell-var-from-loop
+                for chunk in chunks: # pylint: disable=cell-var-from-loop
+                    _, states = forward_stream_skip(model, chunk, states, stats=stats) # pylint: disable=cell-var-from-loop
+
+            time_normal = measure(run_normal, n_warmup=1, n_repeat=n_repeat)
+            time_skip   = measure(run_skip,   n_warmup=1, n_repeat=n_repeat)
+            rows.append({"silence": ratio, "normal": time_normal, "skip": time_skip, "speedup": time_normal / time_skip,
+                "skipped": stats["skipped_macs"] / stats["macs"]})
+    return rows
+
+
+def bench_space_to_batch(
+        channels:     tuple[int, ...] = (64, 128),
+        dilations:    tuple[int, ...] = (32, 128, 512),
+        n_cycles:     int = 2,
+        min_dilation: int = 32,
+        length:       int = 16384,
+        batch_size:   int = 1,
+        n_repeat:     int = 5,
+    ) -> list[dict[str, Any]]:
+    """Benchmark space-to-batch execution (`dilation.forward_space_to_batch`) against native dilation.
+
+    Single causal layers of each dilation, and a WaveNet-style stack (dilations 1, 2, ..., 512 x `n_cycles`) as `dilation=0`.
+
+    Returns:
+        - Rows of {channels, dilation, native [sec], folded [sec], speedup, max_abs}
+    """
+    rows = []
+    with torch.inference_mode():
+        for channel in channels:
+            stack = nn.Sequential(*[module for _ in range(n_cycles) for idx in range(10)
+                for module in (Conv1dEx(channel, channel, 3, causal=True, padding="same", dilation=2**idx), nn.Tanh())])
+            models = [(dilation, Conv1dEx(channel, channel, 3, causal=True, padding="same", dilation=dilation)) for dilation in dilations]
+            ipt = torch.randn(batch_size, channel, length)
+            for dilation, model in models + [(0, stack)]:
+                time_native = measure(lambda: model(ipt), n_repeat=n_repeat) # pylint: disable=cell-var-from-loop
+                time_folded = measure(lambda: forward_space_to_batch(model, ipt, min_dilation), n_repeat=n_repeat) # pylint: disable=cell-var-from-loop
+                max_abs = (forward_space_to_batch(model, ipt, min_dilation) - model(ipt)).abs().max().item()
+                rows.append({"channels": channel, "dilation": dilation, "native": time_native, "folded": time_folded,
+                    "speedup": time_native / time_folded, "max_abs": max_abs})
+    return rows
+
+
+def allocated_bytes(fn: Callable[[], Any]) -> int:
+    """Total bytes of CPU tensors allocated during a `fn()` call, as a measure of materialized intermediates (memory traffic)."""
+    with profile(activities=[ProfilerActivity.CPU], profile_memory=True) as prof:
+        fn()
+    return sum(event.self_cpu_memory_usage for event in prof.events() if event.self_cpu_memory_usage > 0)
+
+
+def bench_gated(
+        channels:      tuple[int, ...] = (64, 128, 256),
+        cond_channels: int  = 80,
+        activation:    str  = "tanh",
+        kernel_size:   int  = 3,
+        length:        int  = 16000,
+        batch_size:    int  = 1,
+        n_repeat:      int  = 10,
+    ) -> list[dict[str, Any]]:
+    """Benchmark `GatedConv1dEx` against the unfused `conv(C, 2C) + 1x1 conditioning -> split -> tanh * sigmoid` path.
+
+    Returns:
+        - Rows of {channels, unfused [sec], fused [sec], speedup, allocated_unfused [bytes], allocated_fused [bytes]}
+    """
+    rows = []
+    with torch.inference_mode():
+        for channel in channels:
+            gated = GatedConv1dEx(channel, channel, kernel_size, causal=True, padding="same", activation=activation, cond_channels=cond_channels)
+            conv = Conv1dEx(channel, 2 * channel, kernel_size, causal=True, padding="same")
+            conv.load_state_dict({"weight": gated.weight, "bias": gated.bias})
+            cond_weight = gated.cond_weight.unsqueeze(-1)
+            ipt, cond = torch.randn(batch_size, channel, length), torch.randn(batch_size, cond_channels, length)
+
+            def unfused():
+                filt, gate = (conv(ipt) + F.conv1d(cond, cond_weight)).chunk(2, dim=-2) # pylint: disable=cell-var-from-loop
+                return (torch.tanh(filt) if activation == "tanh" else filt) * torch.sigmoid(gate)
+
+            def fused():
+                return gated(ipt, cond) # pylint: disable=cell-var-from-loop
+
+            time_unfused = measure(unfused, n_repeat=n_repeat)
+            time_fused   = measure(fused,   n_repeat=n_repeat)
+            rows.append({"channels": channel, "unfused": time_unfused, "fused": time_fused, "speedup": time_unfused / time_fused,
+                "allocated_unfused": allocated_bytes(unfused), "allocated_fused": allocated_bytes(fused)})
+    return rows
+
+
+def bench_ensemble(
+        n_models:   tuple[int, ...] = (1, 2, 4, 8),
+        channels:   int = 64,
+        lengths:    tuple[int, ...] = (1600, 16000),
+        batch_size: int = 1,
+        n_repeat:   int = 5,
+    ) -> list[dict[str, Any]]:
+    """Benchmark stacked execution (`ensemble.stack_modules`) of N identical models against the sequential loop over them.
+
+    Returns:
+        - Rows of {length, models, sequential [sec], stacked [sec], speedup, throughput (samples/sec of all models, stacked)}
+    """
+    def build() -> nn.Module:
+        return nn.Sequential(
+            Conv1dEx(1, channels, 5, causal=True, padding="same"), nn.ReLU(),
+            Conv1dEx(channels, channels, 4, causal=True, stride=2, padding="scale_drop"), nn.ReLU(),
+            Conv1dEx(channels, channels, 3, causal=True, padding="same", dilation=2), nn.ReLU(),
+            ConvT1dEx(channels, channels, 4, causal=True, stride=2, padding="scale_drop"), nn.ReLU(),
+            Conv1dEx(channels, 1, 3, causal=True, padding="same"),
+        )
+
+    rows = []
+    with torch.inference_mode():
+        for length in lengths:
+            for n_model in n_models:
+                models = [build() for _ in range(n_model)]
+                stacked = stack_modules(models)
+                ipts = [torch.randn(batch_size, 1, length) for _ in range(n_model)]
+                time_sequential = measure(lambda: [model(ipt) for model, ipt in zip(models, ipts)], n_repeat=n_repeat) # pylint: disable=cell-var-from-loop
+                time_stacked    = measure(lambda: forward_stacked(stacked, ipts), n_repeat=n_repeat) # pylint: disable=cell-var-from-loop
+                rows.append({"length": length, "models": n_model, "sequential": time_sequential, "stacked": time_stacked,
+                    "speedup": time_sequential / time_stacked, "throughput": n_model * batch_size * length / time_stacked})
+    return rows
+
+
+def bench_prefix_cache(
+        budgets:        tuple[int, ...] = (0, 2, 4),
+        n_prefixes:     int = 4,
+        n_requests:     int = 32,
+        prefix_length:  int = 48000,
+        content_length: int = 16000,
+        n_layers:       int = 6,
+        channels:       int = 64,
+        seed:           int = 0,
+    ) -> list[dict[str, Any]]:
+    """Benchmark streaming requests with shared prefixes, resumed by `prefix.PrefixCache` against streaming the whole input.
+
+    Requests pick one of `n_prefixes` prefixes at random. Budgets are in the number of entries (states after a prefix).
+
+    Returns:
+        - Rows of {budget [entries], time [sec/request], hit_rate, evictions, speedup}
+    """
+    layers = [Conv1dEx(1, channels, 5, causal=True, padding="same")]
+    layers += [Conv1dEx(channels, channels, 3, causal=True, padding="same", dilation=2**idx) for idx in range(n_layers - 2)]
+    layers += [Conv1dEx(channels, 1, 3, causal=True, padding="same")]
+    model = nn.Sequential(*[module for layer in layers for module in (layer, nn.ReLU())][:-1])
+    generator = torch.Generator().manual_seed(seed)
+    prefixes = [torch.randn(1, 1, prefix_length, generator=generator) for _ in range(n_prefixes)]
+    requests = [(int(torch.randint(n_prefixes, (1,), generator=generator)), torch.randn(1, 1, content_length, generator=generator))
+        for _ in range(n_requests)]
+    nbytes = sum(state.numel() * state.element_size() for state in PrefixCache(1 << 40).prefill(model, prefixes[0]))
+
+    rows = []
+    with torch.inference_mode():
+        def run_nocache():
+            for idx, content in requests:
+                _, states = forward_stream(model, prefixes[idx], init_states(model))
+                forward_stream(model, content, states)
+        time_nocache = measure(run_nocache, n_warmup=1, n_repeat=1) / n_requests
+        rows.append({"budget": None, "time": time_nocache, "hit_rate": 0., "evictions": 0, "speedup": 1.})
+
+        for budget in budgets:
+            cache = PrefixCache(max_bytes=budget * nbytes)
+            def run_cache():
+                for idx, content in requests:
+                    forward_stream(model, content, cache.prefill(model, prefixes[idx])) # pylint: disable=cell-var-from-loop
+            time_cache = measure(run_cache, n_warmup=0, n_repeat=1) / n_requests
+            rows.append({"budget": budget, "time": time_cache, "hit_rate": cache.hits / (cache.hits + cache.misses),
+                "evictions": cache.evictions, "speedup": time_nocache / time_cache})
+    return rows
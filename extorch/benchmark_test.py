@@ -0,0 +1,98 @@
+"""Test of benchmarks"""
+
+from .benchmark import bench_depthwise, bench_antialias, bench_parallel_scaling, bench_padding_vec, bench_reduced_precision, bench_pipeline, bench_model_load, bench_winograd, bench_bucketing, bench_silence, bench_space_to_batch, bench_gated, bench_ensemble, bench_prefix_cache
+
+
+def test_bench_depthwise():
+    """`bench_depthwise` should report all channel configs."""
+    rows = bench_depthwise(channels=(2, 4), length=32, n_repeat=2)
+    assert [row["channels"] for row in rows] == [2, 4]
+    assert all(row["speedup"] > 0. for row in rows)
+
+
+def test_bench_antialias():
+    """`bench_antialias` should report all stride configs."""
+    rows = bench_antialias(strides=(2, 4), channels=2, length=64, n_repeat=2)
+    assert [row["stride"] for row in rows] == [2, 4]
+    assert all(row["speedup"] > 0. for row in rows)
+
+
+def test_bench_parallel_scaling():
+    """`bench_parallel_scaling` should report from 1 to N workers."""
+    rows = bench_parallel_scaling(max_workers=2, channels=2, length=64, n_repeat=2)
+    assert [row["workers"] for row in rows] == [1, 2]
+    assert rows[0]["speedup"] == 1.
+
+
+def test_bench_padding_vec():
+    """`bench_padding_vec` should report all config sizes."""
+    rows = bench_padding_vec(n_configs=(10, 20), n_repeat=1)
+    assert [row["configs"] for row in rows] == [10, 20]
+
+
+def test_bench_reduced_precision():
+    """`bench_reduced_precision` should report speed and accuracy of all configs."""
+    rows = bench_reduced_precision(configs=(("Conv1dEx", True, 2, 1), ("ConvT1dEx", True, 2, 1)), channels=2, length=32, n_repeat=2)
+    assert [row["module"] for row in rows] == ["Conv1dEx", "ConvT1dEx"]
+    assert all(row["rel"] < 5e-2 for row in rows)
+
+
+def test_bench_pipeline():
+    """`bench_pipeline` should report all stage configs."""
+    rows = bench_pipeline(n_stages=(1, 2), n_layers=2, channels=2, chunk_size=4, n_chunks=3, n_repeat=1)
+    assert [row["stages"] for row in rows] == [1, 2]
+    assert all(row["throughput"] > 0. for row in rows)
+
+
+def test_bench_model_load():
+    """`bench_model_load` should report all load methods."""
+    rows = bench_model_load(n_layers=2, channels=2, length=8, n_repeat=1)
+    assert [row["method"] for row in rows] == ["torch_load", "read", "mmap"]
+
+
+def test_bench_winograd():
+    """`bench_winograd` should report all channel/kernel configs."""
+    rows = bench_winograd(channels=(2, 4), kernel_sizes=(3,), length=32, n_repeat=2)
+    assert [(row["channels"], row["kernel_size"]) for row in rows] == [(2, 3), (4, 3)]
+    assert all(row["max_abs"] < 1e-4 for row in rows)
+
+
+def test_bench_bucketing():
+    """`bench_bucketing` should report random and bucketed batching."""
+    rows = bench_bucketing(n_sequences=8, batch_size=2, min_length=10, max_length=100, channels=2)
+    assert [row["method"] for row in rows] == ["random", "bucket"]
+    assert rows[1]["waste"] <= rows[0]["waste"]
+
+
+def test_bench_silence():
+    """`bench_silence` should report all silence ratios."""
+    rows = bench_silence(silence_ratios=(0., 0.5), n_layers=3, channels=2, chunk_size=8, n_chunks=8, n_repeat=1)
+    assert [row["silence"] for row in rows] == [0., 0.5]
+    assert rows[1]["skipped"] > rows[0]["skipped"]
+
+
+def test_bench_space_to_batch():
+    """`bench_space_to_batch` should report single layers and the stack."""
+    rows = bench_space_to_batch(channels=(2,), dilations=(4,), n_cycles=1, min_dilation=4, length=64, n_repeat=1)
+    assert [row["dilation"] for row in rows] == [4, 0]
+    assert all(row["max_abs"] < 1e-4 for row in rows)
+
+
+def test_bench_gated():
+    """`bench_gated` should report less allocation of the fused path."""
+    rows = bench_gated(channels=(4,), cond_channels=2, length=64, n_repeat=1)
+    assert [row["channels"] for row in rows] == [4]
+    assert rows[0]["allocated_fused"] < rows[0]["allocated_unfused"]
+
+
+def test_bench_ensemble():
+    """`bench_ensemble` should report all the numbers of models."""
+    rows = bench_ensemble(n_models=(1, 2), channels=2, lengths=(32,), n_repeat=1)
+    assert [row["models"] for row in rows] == [1, 2]
+
+
+def test_bench_prefix_cache():
+    """`bench_prefix_cache` should report more hits with larger budget."""
+    rows = bench_prefix_cache(budgets=(0, 2), n_prefixes=2, n_requests=6, prefix_length=32, content_length=8, n_layers=3, channels=2)
+    assert [row["budget"] for row in rows] == [None, 0, 2]
+    assert rows[1]["hit_rate"] == 0. and rows[2]["hit_rate"] > 0.
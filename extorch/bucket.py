@@ -0,0 +1,114 @@
+"""Length-bucketing batch sampler and padding collator for variable-length training."""
+
+import random
+from typing import Iterator, Sequence
+
+import torch
+from torch import Tensor, nn
+from torch.utils.data import Sampler
+import torch.nn.functional as F
+
+from .latency import latency_report
+
+
+def length_multiple(model: nn.Module) -> int:
+    """The smallest length unit which passes through a stack without partial frames (`scale_ceil` last stride), from its stride geometry."""
+    return latency_report(model)["min_chunk"]
+
+
+def padded_length(length: int, multiple: int) -> int:
+    """The smallest multiple of `multiple` which is not shorter than `length`."""
+    return -(-length // multiple) * multiple
+
+
+class BucketBatchSampler(Sampler[list[int]]):
+    """Batch sampler which groups sequences of similar length, so padding to the batch max length is minimized.
+
+    Indices are shuffled, then sorted by length within each pool of `pool_size` batches, and split into batches.
+    Batch order is shuffled, so each epoch differs while batches keep similar lengths.
+
+        shuffled    |-------pool0-------|-------pool1-------|...
+        sorted      |b0 |b1 |b2 |b3 |b4 |b5 |b6 |b7 |b8 |b9 |...
+        yielded      b7, b2, b9, b0, ...
+    """
+    def __init__(self, lengths: Sequence[int], batch_size: int, pool_size: int = 100, shuffle: bool = True, drop_last: bool = False, seed: int = 0):
+        """
+        Args:
+            lengths    - Lengths of all sequences in dataset order
+            batch_size - The number of sequences in a batch
+            pool_size  - The number of batches sorted together, larger for less padding but less randomness
+            shuffle    - Whether to shuffle sequences and batches
+            drop_last  - Whether to drop the last non-full batch
+            seed       - Random seed, combined with epoch (`set_epoch`)
+        """
+        super().__init__()
+        if batch_size < 1 or pool_size < 1:
+            raise RuntimeError(f"`batch_size` and `pool_size` should be positive, but got {batch_size} and {pool_size}.")
+        self.lengths, self.batch_size, self.pool_size = list(lengths), batch_size, pool_size
+        self.shuffle, self.drop_last, self.seed, self.epoch = shuffle, drop_last, seed, 0
+
+    def set_epoch(self, epoch: int) -> None:
+        """Set epoch for different shuffle in each epoch."""
+        self.epoch = epoch
+
+    def batches(self) -> list[list[int]]:
+        """All batches of the current epoch."""
+        rng = random.Random(self.seed + self.epoch)
+        indices = list(range(len(self.lengths)))
+        if self.shuffle:
+            rng.shuffle(indices)
+        pool = self.batch_size * self.pool_size
+        batches = []
+        for start in range(0, len(indices), pool):
+            sorted_pool = sorted(indices[start : start + pool], key=lambda idx: self.lengths[idx])
+            batches += [sorted_pool[head : head + self.batch_size] for head in range(0, len(sorted_pool), self.batch_size)]
+        if self.drop_last:
+            batches = [batch for batch in batches if len(batch) == self.batch_size]
+        if self.shuffle:
+            rng.shuffle(batches)
+        return batches
+
+    def __iter__(self) -> Iterator[list[int]]:
+        return iter(self.batches())
+
+    def __len__(self) -> int:
+        if self.drop_last:
+            return len(self.lengths) // self.batch_size
+        return -(-len(self.lengths) // self.batch_size)
+
+
+class PadCollator:
+    """Collate variable-length sequences (..., L) into a batch padded to the smallest length compatible with the model strides.
+
+    Used as `DataLoader(..., batch_sampler=BucketBatchSampler(...), collate_fn=PadCollator(length_multiple(model)))`.
+    """
+    def __init__(self, multiple: int = 1, value: float = 0.):
+        """
+        Args:
+            multiple - Length unit of padded batch, e.g. `length_multiple(model)`
+            value    - Padding value
+        """
+        self.multiple, self.value = multiple, value
+
+    def __call__(self, items: Sequence[Tensor]) -> tuple[Tensor, Tensor]:
+        """
+        Args:
+            items - Sequences, (..., L_i)
+        Returns:
+                  - Padded batch, (B, ..., L_pad)
+                  - Original lengths, (B,)
+        """
+        lengths = torch.tensor([item.size(-1) for item in items])
+        length = padded_length(int(lengths.max()), self.multiple)
+        batch = torch.stack([F.pad(item, (0, length - item.size(-1)), value=self.value) for item in items])
+        return batch, lengths
+
+
+def padding_waste(lengths: Sequence[int], batches: Sequence[Sequence[int]], multiple: int = 1) -> float:
+    """Ratio of padded samples in all batches, `1 - Σ length / Σ padded_length`."""
+    total, padded = 0, 0
+    for batch in batches:
+        length = padded_length(max(lengths[idx] for idx in batch), multiple)
+        total += sum(lengths[idx] for idx in batch)
+        padded += length * len(batch)
+    return 1. - total / padded
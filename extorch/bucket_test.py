@@ -0,0 +1,58 @@
+"""Test of length-bucketing"""
+
+import random
+
+import torch
+from torch import nn
+from torch.utils.data import DataLoader
+
+from .conv1d import Conv1dEx
+from .convt1d import ConvT1dEx
+from .bucket import length_multiple, BucketBatchSampler, PadCollator, padding_waste
+
+
+def test_length_multiple():
+    """length_multiple should be the cumulative downsampling of a stack."""
+    model = nn.Sequential(
+        Conv1dEx(1, 1, 4, causal=True, stride=2, padding="scale_ceil"),
+        Conv1dEx(1, 1, 5, causal=True, stride=3, padding="scale_ceil"),
+        ConvT1dEx(1, 1, 6, causal=True, stride=3, padding="scale_drop"),
+    )
+    assert length_multiple(model) == 6
+    assert length_multiple(Conv1dEx(1, 1, 3, causal=True, padding="same")) == 1
+
+
+def test_bucket_batch_sampler():
+    """BucketBatchSampler should yield all indices once, with less padding than random batching."""
+
+    rng = random.Random(0)
+    lengths = [rng.randint(10, 1000) for _ in range(1000)]
+    sampler = BucketBatchSampler(lengths, batch_size=8, pool_size=50)
+    batches = list(sampler)
+
+    assert len(batches) == len(sampler) == 125
+    assert sorted(idx for batch in batches for idx in batch) == list(range(1000))
+    batches_random = [list(range(start, start + 8)) for start in range(0, 1000, 8)]
+    assert padding_waste(lengths, batches, 4) < padding_waste(lengths, batches_random, 4) / 5
+
+    # Different order in each epoch, but reproducible
+    sampler.set_epoch(1)
+    assert list(sampler) != batches
+    sampler.set_epoch(0)
+    assert list(sampler) == batches
+
+    sampler = BucketBatchSampler(lengths[:20], batch_size=8, drop_last=True)
+    assert len(list(sampler)) == len(sampler) == 2
+
+
+def test_pad_collator():
+    """PadCollator should pad a batch to the multiple of the length unit, with original lengths."""
+
+    dataset = [torch.ones(2, length) for length in (5, 9, 7)]
+    loader = DataLoader(dataset, batch_sampler=BucketBatchSampler([5, 9, 7], batch_size=3), collate_fn=PadCollator(4))
+    batch, lengths = next(iter(loader))
+
+    assert batch.shape == (3, 2, 12)
+    assert sorted(lengths.tolist()) == [5, 7, 9]
+    for item, length in zip(batch, lengths):
+        assert item[..., :length].eq(1.).all() and item[..., length:].eq(0.).all()
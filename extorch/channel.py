@@ -0,0 +1,21 @@
+"""Channel-independence check of parameter-free layers."""
+
+from torch import nn
+
+from .transpose import Transpose
+
+
+# Parameter-free activations which mix channels
+_MIXING = (nn.Softmax, nn.Softmin, nn.LogSoftmax, nn.Softmax2d, nn.GLU, nn.MultiheadAttention)
+
+
+def is_channel_independent(layer: nn.Module) -> bool:
+    """Whether a parameter-free layer processes each channel independently (element-wise activation, dropout, Transpose, etc.).
+
+    Such layers keep channel count and order, so channel-sliced (pruned) or channel-stacked (ensemble) input can pass through them as is.
+    """
+    if next(layer.parameters(), None) is not None or next(layer.buffers(), None) is not None:
+        return False
+    if isinstance(layer, (nn.Identity, nn.Dropout, Transpose)):
+        return True
+    return type(layer).__module__ == "torch.nn.modules.activation" and not isinstance(layer, _MIXING)
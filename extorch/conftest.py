@@ -0,0 +1,66 @@
+"""Shared test utilities (pytest conftest), model stacks and chunk-by-chunk streaming."""
+
+from typing import Sequence
+
+import torch
+from torch import Tensor, nn
+
+from .conv1d import Conv1dEx
+from .convt1d import ConvT1dEx
+from .depthwise import DepthwiseConv1dEx, SeparableConv1dEx
+from .antialias import AntiAliasConv1dEx
+from .transpose import Transpose
+from .stream import init_states, forward_stream, flush_stream
+
+
+def causal_stack(in_channels: int = 1, out_channels: int = 1, bias: bool = True) -> nn.Sequential:
+    """Causal stack of 4 Conv1dEx/ConvT1dEx with parameter-free layers between them (activation, Transpose pair, nested `nn.Sequential`).
+
+        Conv(same) -> ReLU -> Conv(s2, d2) -> Transpose x2 -> [ConvT(s2) -> Tanh] -> Conv(same)
+    """
+    return nn.Sequential(
+        Conv1dEx(in_channels, 8, 3, causal=True, padding="same", bias=bias), nn.ReLU(),
+        Conv1dEx(8, 8, 4, causal=True, stride=2, padding="scale_drop", dilation=2, bias=bias), Transpose(1, 2), Transpose(1, 2),
+        nn.Sequential(ConvT1dEx(8, 8, 4, causal=True, stride=2, padding="scale_drop", bias=bias), nn.Tanh()),
+        Conv1dEx(8, out_channels, 3, causal=True, padding="same", bias=bias),
+    )
+
+
+def module_stack(in_channels: int = 4, out_channels: int = 2, causal: bool = True, layer_norm: bool = True) -> nn.Sequential:
+    """Stack of all 1D extorch conv types with channel-wise layers (norms, activations), in eval mode.
+
+        Conv(d2) -> LeakyReLU -> AntiAlias(s2) -> BatchNorm -> [Transpose -> LayerNorm -> Transpose] -> Tanh
+            -> Depthwise(d2) -> Separable -> ConvT(s2) -> Conv(no bias)
+
+    Args:
+        layer_norm - Whether to include the channel LayerNorm, which mixes channels (e.g. rejected by `ensemble.stack_modules`)
+    """
+    norm = [Transpose(1, 2), nn.LayerNorm(8), Transpose(1, 2)] if layer_norm else []
+    return nn.Sequential(
+        Conv1dEx(in_channels, 8, 3, causal=causal, padding="same", dilation=2), nn.LeakyReLU(0.2),
+        AntiAliasConv1dEx(8, 8, 3, causal=causal, stride=2, padding="scale_drop"),
+        nn.BatchNorm1d(8), *norm, nn.Tanh(),
+        DepthwiseConv1dEx(8, 8, 5, causal=causal, padding="same", dilation=2),
+        SeparableConv1dEx(8, 8, 3, causal=causal, padding="same"),
+        ConvT1dEx(8, 4, 4, causal=causal, stride=2, padding="scale_drop"),
+        Conv1dEx(4, out_channels, 3, causal=causal, padding="same", bias=False),
+    ).eval()
+
+
+def stream_chunked(model: nn.Module, ipt: Tensor, chunk_sizes: int | Sequence[int], flush: bool = True) -> Tensor:
+    """Run a model chunk by chunk from the initial states, then flush.
+
+    Args:
+        model       - Streamable model (c.f. `stream.forward_stream`)
+        ipt         - Whole input, (B, C_in, L)
+        chunk_sizes - Chunk length shared by all chunks (the last can be shorter), or each chunk length
+        flush       - Whether to append the flushed tail
+    Returns:
+                    - Concatenated output
+    """
+    states, opts = init_states(model, ipt.size(0)), []
+    for chunk in ipt.split(chunk_sizes if isinstance(chunk_sizes, int) else list(chunk_sizes), dim=-1):
+        opt, states = forward_stream(model, chunk, states)
+        opts.append(opt)
+    tail = flush_stream(model, states) if flush else None
+    return torch.cat(opts + ([] if tail is None else [tail]), dim=-1)
@@ -3,10 +3,12 @@
 from typing import Literal, Any
 import warnings
 
+import torch
 from torch import Tensor, nn
 import torch.nn.functional as F
 
 from .padding import padding_lr
+from .precision import compute_dtype
 
 
 class Conv1dEx(nn.Conv1d):
@@ -88,7 +90,68 @@ class Conv1dEx(nn.Conv1d):
             conv_padding = 0
 
         super().__init__(in_channels, out_channels, kernel_size, stride, conv_padding, dilation, groups, bias, padding_mode, device, dtype)
+        self.causal = causal
+
+    def _effective_kernel(self) -> int:
+        """Effective kernel size, which is spanned by a dilated kernel."""
+        return 1 + (self.kernel_size[0] - 1) * self.dilation[0]
+
+    def _padding_total(self) -> tuple[int, int]:
+        """(left, right) padding in total, explicit `_input_padding` + nn.Conv1d internal padding."""
+        if self.padding == "same":
+            total = self.dilation[0] * (self.kernel_size[0] - 1)
+            conv_l, conv_r = total // 2, total - total // 2
+        elif self.padding == "valid":
+            conv_l, conv_r = 0, 0
+        else:
+            conv_l, conv_r = self.padding[0], self.padding[0]
+        return (self._input_padding[0] + conv_l, self._input_padding[1] + conv_r)
+
+    def _forward_valid(self, x: Tensor) -> Tensor:
+        """Forward convolution without any padding."""
+        return F.conv1d(x, self.weight, self.bias, self.stride, 0, self.dilation, self.groups)
 
     def forward(self, x: Tensor):
         """Forward Conv1d with non-uniform padding"""
         return super().forward(F.pad(x, self._input_padding))
+
+    def init_state(self, batch_size: int = 1) -> Tensor:
+        """Initial streaming state, left zero padding :: (B, C_in, padding_left)."""
+        return self.weight.new_zeros(batch_size, self.in_channels, self._padding_total()[0])
+
+    def forward_stream(self, x: Tensor, state: Tensor, **kwargs: Any) -> tuple[Tensor, Tensor]:
+        """Forward a chunk in streaming mode.
+
+        State holds the input not yet consumed by strided kernel, so chunk-by-chunk forward yields output identical to the full-length forward.
+        Frames which need right padding are yielded by `flush_stream` at the end of stream.
+
+            state     chunk
+            ●●●●●|●●●●●●●●●●
+            |_______|              <- kernel
+              |_______|
+                |_______|
+                      ●●●●●●●●●  <- new state
+
+        Args:
+            x      - Input chunk, (B, C_in, L_chunk)
+            state  - Streaming state, (B, C_in, L_state)
+            kwargs - Extra inputs of `_forward_valid` in subclasses (e.g. conditioning of GatedConv1dEx)
+        Returns:
+                   - Output chunk, (B, C_out, L_chunk_out)
+                   - New streaming state
+        """
+        if self.padding_mode != "zeros":
+            raise RuntimeError("Currently Conv1dEx support streaming only with `padding_mode='zeros'`.")
+
+        buffer = torch.cat([state.to(x.dtype), x], dim=-1)
+        kernel_eff, stride = self._effective_kernel(), self.stride[0]
+        n_frame = max(0, (buffer.size(-1) - kernel_eff) // stride + 1)
+        if n_frame == 0:
+            return buffer.new_zeros(buffer.size(0), self.out_channels, 0, dtype=compute_dtype(self.weight)), buffer
+        o = self._forward_valid(buffer[..., : (n_frame - 1) * stride + kernel_eff], **kwargs)
+        return o, buffer[..., n_frame * stride :]
+
+    def flush_stream(self, state: Tensor, **kwargs: Any) -> Tensor:
+        """Yield the last frames which need right padding, at the end of stream."""
+        padding_r = state.new_zeros(state.shape[:-1] + (self._padding_total()[1],))
+        return self.forward_stream(padding_r, state, **kwargs)[0]
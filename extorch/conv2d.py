@@ -0,0 +1,144 @@
+"Extended Conv2d"
+
+from typing import Literal, Any
+
+import torch
+from torch import Tensor, nn
+import torch.nn.functional as F
+
+from .padding import padding_lr
+from .precision import compute_dtype
+
+
+PaddingMode = Literal["same", "valid", "scale", "scale_drop", "scale_ceil"]
+
+
+def _pair(value: int | tuple[int, int]) -> tuple[int, int]:
+    return value if isinstance(value, tuple) else (value, value)
+
+
+class Conv2dEx(nn.Conv2d):
+    """Extended Conv2d which support causal convolution along time axis.
+
+    Input is (B, C, Freq, Time), so the last axis is the time axis.
+    Each axis is padded in the same way as Conv1dEx:
+        - Freq axis: Normal conv (centered kernel, aligned to the stride center)
+        - Time axis: Causal conv (◢ shape kernel, aligned to the stride tail) if `causal`, else normal conv
+    Symmetric part of padding is absorbed into nn.Conv2d native padding, so input is explicitly padded only for asymmetric residual.
+    """
+    def __init__(self,
+        in_channels:  int,
+        out_channels: int,
+        kernel_size:  int | tuple[int, int],
+        *args:        Any,
+        causal:       bool = False,
+        stride:       int | tuple[int, int] = 1,
+        padding:      PaddingMode | int | tuple[PaddingMode | int, PaddingMode | int] = 0,
+        dilation:     int | tuple[int, int] = 1,
+        groups:       int  = 1,
+        bias:         bool = True,
+        padding_mode: str  = "zeros",
+        device             = None,
+        dtype              = None,
+    ):
+        """All arguments of `nn.Conv2d`, and new `causal` option:
+
+        Args:
+            causal - Whether to use causal conv along time axis
+            padding - Padding size or automatic padding mode (c.f. Conv1dEx), shared by axes or per (Freq, Time) axis
+        """
+
+        # Validation
+        if len(args) > 0:
+            raise RuntimeError("Conv2dEx needs named arguments for stride and subsequents.")
+        if causal and padding_mode != "zeros":
+            raise RuntimeError("Currently Conv2dEx support only `padding_mode='zeros'` for causal mode.")
+
+        kernel_size, stride, dilation = _pair(kernel_size), _pair(stride), _pair(dilation)
+        paddings = padding if isinstance(padding, tuple) else (padding, padding)
+
+        # Padding per axis, (Freq, Time)
+        padding_axes: list[tuple[int, int]] = []
+        for axis, (k, s, d, p) in enumerate(zip(kernel_size, stride, dilation, paddings)):
+            # Backward compatibility
+            p = p if p != "scale" else "scale_ceil"
+            causal_axis = causal and axis == 1
+            #                                               normal                            causal
+            shape:     Literal["delta", "causal"]        = "delta"  if not causal_axis else "causal"
+            align:     Literal["head", "center", "tail"] = "center" if not causal_axis else "tail"
+            if (s > 1) and (p == "same"):
+                raise RuntimeError("Convolution with stride>1 results in len(ipt) > len(opt), so `padding == 'same'` is not permitted.")
+            if causal_axis and (p not in ("same", "scale_drop", "scale_ceil")):
+                raise RuntimeError("Conv2dEx with `causal=True` requires time axis `padding=='same'|'scale_drop'|'scale_ceil'`.")
+            if isinstance(p, int):
+                padding_axes.append((p, p))
+            elif p == "valid":
+                padding_axes.append((0, 0))
+            else:
+                padding_axes.append(padding_lr(1 + (k - 1) * d, shape, s, align, p == "scale_drop"))
+
+        # conv_padding:  Symmetric padding in nn.Conv2d internally
+        # input_padding: Asymmetric residual padding during Conv2dEx forward explicitly, F.pad order (Time_l, Time_r, Freq_l, Freq_r)
+        conv_padding = tuple(min(padding_l, padding_r) for padding_l, padding_r in padding_axes)
+        (freq_l, freq_r), (time_l, time_r) = padding_axes
+        self._input_padding = (time_l - conv_padding[1], time_r - conv_padding[1], freq_l - conv_padding[0], freq_r - conv_padding[0])
+        if padding_mode != "zeros" and any(self._input_padding):
+            raise RuntimeError("Conv2dEx with asymmetric padding support only `padding_mode='zeros'`.")
+
+        super().__init__(in_channels, out_channels, kernel_size, stride, conv_padding, dilation, groups, bias, padding_mode, device, dtype)
+        self.causal = causal
+
+    def _effective_kernel(self) -> tuple[int, int]:
+        """Effective kernel size of (Freq, Time) axis."""
+        return (1 + (self.kernel_size[0] - 1) * self.dilation[0], 1 + (self.kernel_size[1] - 1) * self.dilation[1])
+
+    def _padding_total(self) -> tuple[tuple[int, int], tuple[int, int]]:
+        """((Freq_l, Freq_r), (Time_l, Time_r)) padding in total, explicit `_input_padding` + nn.Conv2d internal padding."""
+        time_l, time_r, freq_l, freq_r = self._input_padding
+        return ((freq_l + self.padding[0], freq_r + self.padding[0]), (time_l + self.padding[1], time_r + self.padding[1]))
+
+    def forward(self, x: Tensor):
+        """Forward Conv2d with non-uniform padding, explicit pad only if needed."""
+        return super().forward(F.pad(x, self._input_padding) if any(self._input_padding) else x)
+
+    def _forward_valid_time(self, x: Tensor) -> Tensor:
+        """Forward convolution with Freq padding and without Time padding."""
+        _, _, freq_l, freq_r = self._input_padding
+        if freq_l > 0 or freq_r > 0:
+            x = F.pad(x, (0, 0, freq_l, freq_r))
+        return F.conv2d(x, self.weight, self.bias, self.stride, (self.padding[0], 0), self.dilation, self.groups)
+
+    def init_state(self, batch_size: int = 1) -> Tensor:
+        """Initial streaming state, left zero padding of time axis :: (B, C_in, 1, padding_left), broadcasted to Freq axis."""
+        return self.weight.new_zeros(batch_size, self.in_channels, 1, self._padding_total()[1][0])
+
+    def forward_stream(self, x: Tensor, state: Tensor) -> tuple[Tensor, Tensor]:
+        """Forward a time chunk in streaming mode, c.f. `Conv1dEx.forward_stream`.
+
+        Args:
+            x     - Input chunk, (B, C_in, Freq, T_chunk)
+            state - Streaming state, (B, C_in, Freq|1, T_state)
+        Returns:
+                  - Output chunk, (B, C_out, Freq_out, T_chunk_out)
+                  - New streaming state
+        """
+        if self.padding_mode != "zeros":
+            raise RuntimeError("Currently Conv2dEx support streaming only with `padding_mode='zeros'`.")
+
+        # Initial state is shared by all frequencies
+        if state.size(-2) != x.size(-2):
+            state = state.expand(-1, -1, x.size(-2), -1)
+        buffer = torch.cat([state.to(x.dtype), x], dim=-1)
+        (kernel_eff_f, kernel_eff_t), (stride_f, stride_t) = self._effective_kernel(), self.stride
+        n_frame = max(0, (buffer.size(-1) - kernel_eff_t) // stride_t + 1)
+        if n_frame == 0:
+            (freq_l, freq_r), _ = self._padding_total()
+            n_freq = (buffer.size(-2) + freq_l + freq_r - kernel_eff_f) // stride_f + 1
+            return buffer.new_zeros(buffer.size(0), self.out_channels, n_freq, 0, dtype=compute_dtype(self.weight)), buffer
+        o = self._forward_valid_time(buffer[..., : (n_frame - 1) * stride_t + kernel_eff_t])
+        return o, buffer[..., n_frame * stride_t :]
+
+    def flush_stream(self, state: Tensor) -> Tensor:
+        """Yield the last frames which need right padding of time axis, at the end of stream."""
+        padding_r = state.new_zeros(state.shape[:-1] + (self._padding_total()[1][1],))
+        return self.forward_stream(padding_r, state)[0]
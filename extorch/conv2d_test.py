@@ -0,0 +1,59 @@
+"""Test of Conv2dEx"""
+
+import torch
+from torch import allclose, no_grad # pylint: disable=no-name-in-module
+
+from .conv1d import Conv1dEx
+from .conv2d import Conv2dEx
+from .conftest import stream_chunked
+
+
+def _rows(x: torch.Tensor) -> torch.Tensor:
+    """(B, 1, F, T) -> (B*F, 1, T)"""
+    return x.transpose(1, 2).flatten(0, 1)
+
+
+def test_conv2dex_axis_equivalence():
+    """Conv2dEx should pad each axis as Conv1dEx (time: causal/normal, freq: normal)."""
+
+    torch.manual_seed(0)
+    with no_grad():
+        for causal in (False, True):
+            for kernel, stride, padding in ((3, 1, "same"), (4, 1, "same"), (4, 2, "scale_ceil"), (5, 3, "scale_drop")):
+                ipt = torch.randn(2, 1, 7, 11)
+                # Time axis
+                conv2d = Conv2dEx(1, 1, (1, kernel), causal=causal, stride=(1, stride), padding=padding, bias=False)
+                conv1d = Conv1dEx(1, 1,     kernel,  causal=causal, stride=stride,      padding=padding, bias=False)
+                conv1d.weight.copy_(conv2d.weight[:, :, 0])
+                assert allclose(_rows(conv2d(ipt)), conv1d(_rows(ipt)), atol=1e-6)
+                # Freq axis, always normal conv
+                conv2d = Conv2dEx(1, 1, (kernel, 1), causal=causal, stride=(stride, 1), padding=(padding, "same"), bias=False)
+                conv1d = Conv1dEx(1, 1,  kernel,                    stride=stride,      padding=padding, bias=False)
+                conv1d.weight.copy_(conv2d.weight[:, :, :, 0])
+                assert allclose(_rows(conv2d(ipt).transpose(2, 3)), conv1d(_rows(ipt.transpose(2, 3))), atol=1e-6)
+
+
+def test_conv2dex_native_padding():
+    """Conv2dEx should absorb symmetric padding into native padding."""
+
+    conv_normal = Conv2dEx(1, 1, 3,                          padding="same")
+    conv_causal = Conv2dEx(1, 1, 3,           causal=True,   padding="same")
+    conv_even   = Conv2dEx(1, 1, (4, 3),                     padding="same")
+
+    assert conv_normal.padding == (1, 1) and conv_normal._input_padding == (0, 0, 0, 0) # pylint: disable=protected-access
+    assert conv_causal.padding == (1, 0) and conv_causal._input_padding == (2, 0, 0, 0) # pylint: disable=protected-access
+    assert conv_even.padding   == (1, 1) and conv_even._input_padding   == (0, 0, 0, 1) # pylint: disable=protected-access
+
+
+def test_conv2dex_forward_stream():
+    """Conv2dEx should yield identical output in time-axis streaming."""
+
+    torch.manual_seed(0)
+    with no_grad():
+        for conv in (
+            Conv2dEx(2, 3, 3, causal=True, padding="same"),
+            Conv2dEx(2, 3, (4, 3), causal=True, stride=2, padding="scale_ceil"),
+            Conv2dEx(2, 3, (3, 5), causal=True, stride=(1, 3), padding=("same", "scale_drop"), dilation=(1, 2)),
+        ):
+            ipt = torch.randn(2, 2, 8, 20)
+            assert allclose(stream_chunked(conv, ipt, 3), conv(ipt), atol=1e-6)
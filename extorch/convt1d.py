@@ -3,8 +3,10 @@
 from typing import Literal, Any
 
 from torch import Tensor, nn
+import torch.nn.functional as F
 
 from .padding import padding_lr
+from .precision import accumulation_dtype, compute_dtype
 
 
 class ConvT1dEx(nn.ConvTranspose1d):
@@ -16,10 +18,16 @@ class ConvT1dEx(nn.ConvTranspose1d):
             - modes:
                 - 'valid':      Use only valid values (no inverse padding)
                 - 'scale_drop': Scale kernel-fulfilled strides (drop non-fulfilled last stride), basically L_out = stride * L_in
-                - 'scale_ceil': Scale all strides, including non-fulfilled last one, basically L_out = stride * L_in + i (c.f. output_padding) (not implemented now)
+                - 'scale_ceil': Scale all strides, including non-fulfilled last one, L_out = stride * (L_in - 1) + 1 + output_padding
+                                (`output_padding` in [0, stride) specifies the last stride length - 1, so mirrors `Conv1dEx(padding='scale_ceil')`)
+                                (or `forward(x, output_size)` specifies the output length per call)
             - alignment
                 - Normal conv: Kernel axis is aligned to the stride center
                 - Causal conv: Kernel axis is aligned to the stride tail
+    Symmetric part of padding^-1 is absorbed into nn.ConvTranspose1d native padding, so only asymmetric residual is cropped explicitly.
+    Causal 'scale_ceil' (K_eff >= stride) has only right residual, so its tail is computed and then cropped.
+    Streaming does not know the end of stream, so 'scale_ceil' stream yields `stride - 1 - output_padding` extra trailing samples
+    compared to the full-length forward (c.f. `forward_stream`).
     """
     def __init__(self,
         in_channels:    int,
@@ -53,11 +61,10 @@ class ConvT1dEx(nn.ConvTranspose1d):
             raise RuntimeError("ConvT1dEx needs named arguments for stride and subsequents.")
         if (stride > 1) and (padding == "same"):
             raise RuntimeError("Transposed convolution with stride>1 results in len(opt) > len(ipt), so `padding == 'same'` is not permitted.")
-        ## Support only drop_last=True
-        if not (isinstance(padding, int) or isinstance(padding, tuple)) and output_padding > 0:
-            raise RuntimeError("Currently ConvT1dEx support only `output_padding=0` for auto-padding.")
-        if padding == "scale_ceil":
-            raise RuntimeError("Currently ConvT1dEx not yet implement `padding='scale_ceil'`.")
+        if not (isinstance(padding, int) or isinstance(padding, tuple)) and padding != "scale_ceil" and output_padding > 0:
+            raise RuntimeError("Currently ConvT1dEx support `output_padding>0` only for `padding=='scale_ceil'` in auto-padding.")
+        if padding == "scale_ceil" and not 0 <= output_padding < stride:
+            raise RuntimeError(f"`padding=='scale_ceil'` requires `0 <= output_padding < stride`, but got output_padding={output_padding}.")
         if (shape == "inv_causal") and (padding not in ("same", "scale_drop", "scale_ceil")):
             raise RuntimeError("ConvT1dEx with `causal=True` requires `padding=='same'|'scale_drop'|'scale_ceil'`.")
             # If len(opt)!=len(ipt) by not-same/scale padding, 'causal or not' is determined by opt usage.
@@ -82,15 +89,115 @@ class ConvT1dEx(nn.ConvTranspose1d):
             conv_padding = 0
         else:
             padding_r, padding_l = padding_lr(effective_kernel, shape, stride, align, True)
+            if padding == "scale_ceil":
+                # Crop right so that the last stride yields only `output_padding + 1` samples.
+                # Under K_eff < stride, full output is shorter than that, so zero-pad right by native output_padding instead.
+                #
+                #   scale_drop  |_stride_|_stride_|_stride_|
+                #   scale_ceil  |_stride_|_stride_|_|        (output_padding=1)
+                padding_l = effective_kernel - padding_r - 1 - output_padding
+                output_padding = max(0, -padding_l)
+                padding_l = max(0, padding_l)
+            # Symmetric part is absorbed into nn.ConvTranspose1d native padding, so only asymmetric residual is cropped explicitly
+            conv_padding = min(padding_r, padding_l)
+            padding_r, padding_l = padding_r - conv_padding, padding_l - conv_padding
             padding_r = padding_r if padding_r > 0 else None
             padding_l = padding_l if padding_l > 0 else None
             self._input_padding = (padding_r, padding_l)
-            conv_padding = 0
 
         super().__init__(in_channels, out_channels, kernel_size, stride, conv_padding, output_padding, groups, bias, dilation, padding_mode, device, dtype)
+        self.causal = causal
+        self._scale_ceil = padding == "scale_ceil"
+
+    def _effective_kernel(self) -> int:
+        """Effective kernel size, which is spanned by a dilated kernel."""
+        return 1 + (self.kernel_size[0] - 1) * self.dilation[0]
+
+    def _padding_total(self) -> tuple[int, int]:
+        """(left, right) padding^-1 in total, explicit `_input_padding` + nn.ConvTranspose1d internal padding."""
+        crop_l, crop_r = (crop or 0 for crop in self._input_padding)
+        return (crop_l + self.padding[0], crop_r + self.padding[0])
+
+    def forward(self, x: Tensor, output_size: int | None = None): # pylint: disable=arguments-renamed
+        """Forward ConvT1dEx with non-uniform padding^-1.
 
-    def forward(self, x: Tensor):
-        """Forward ConvT1dEx with non-uniform padding^-1"""
+        Args:
+            x           - Input, (B, C_in, L_in) or (C_in, L_in)
+            output_size - Output length of `padding='scale_ceil'` in [stride * (L_in - 1) + 1, stride * L_in], overriding `output_padding`.
+                          It mirrors a `Conv1dEx(padding='scale_ceil')` input of any `(L - 1) % stride` by one decoder.
+        Returns:
+                        - Output, (B, C_out, L_out) or (C_out, L_out)
+        """
+        if output_size is not None:
+            return self._forward_sized(x, output_size)
         opt_full = super().forward(x)
         ipad_l = None if self._input_padding[1] is None else -1 * self._input_padding[1]
         return opt_full[..., self._input_padding[0] : ipad_l]
+
+    def _forward_sized(self, x: Tensor, output_size: int) -> Tensor:
+        """Forward `padding='scale_ceil'` ConvT1dEx into the given output length, whose last stride yields `output_size - stride * (L_in - 1)` samples."""
+        if not self._scale_ceil:
+            raise RuntimeError("`output_size` is supported only for `padding=='scale_ceil'`.")
+        len_i, stride = x.size(-1), self.stride[0]
+        if not stride * (len_i - 1) + 1 <= output_size <= stride * len_i:
+            raise RuntimeError(f"`output_size` should be in [{stride * (len_i - 1) + 1}, {stride * len_i}], but got {output_size}.")
+        crop_l, len_full = self._padding_total()[0], stride * (len_i - 1) + self._effective_kernel()
+        # Samples beyond the kernel-covered output are bias only, so yielded by native output_padding as the construction-time one
+        output_padding = max(0, crop_l + output_size - len_full)
+        # Symmetric part of the crop is absorbed into native padding, so only asymmetric residual is computed and cropped
+        conv_padding = min(crop_l, len_full + output_padding - crop_l - output_size)
+        opt_full = F.conv_transpose1d(x, self.weight, self.bias, self.stride, conv_padding, output_padding, self.groups, self.dilation)
+        return opt_full[..., crop_l - conv_padding : crop_l - conv_padding + output_size]
+
+    def init_state(self, batch_size: int = 1) -> Tensor:
+        """Initial streaming state, zero overlap-add tail :: (B, C_out, max(0, K_eff - stride))."""
+        return self.weight.new_zeros(batch_size, self.out_channels, max(0, self._effective_kernel() - self.stride[0]), dtype=accumulation_dtype(self.weight.dtype))
+
+    def forward_stream(self, x: Tensor, state: Tensor) -> tuple[Tensor, Tensor]:
+        """Forward a chunk in streaming mode, supported when padding^-1 is not applied to the left (e.g. causal).
+
+        Each input sample yields `stride` output samples, and the kernel tail is overlap-added to the next chunk through state.
+
+            state    ●●●
+            chunk    ●●●●●●●●●●●●●●●
+                     |____________|●●●
+                         output    new state
+
+        Args:
+            x     - Input chunk, (B, C_in, L_chunk)
+            state - Streaming state, (B, C_out, L_state)
+        Returns:
+                  - Output chunk, (B, C_out, stride * L_chunk)
+                  - New streaming state
+        If `K_eff < stride`, the stream yields `stride - K_eff` extra trailing samples compared to the full-length forward.
+        With `padding='scale_ceil'`, the end of stream is unknown while streaming, so the last stride is fully yielded
+        (`stride - 1 - output_padding` extra trailing samples compared to the full-length forward).
+        """
+        if self._padding_total()[0] != 0:
+            raise RuntimeError("Currently ConvT1dEx support streaming only without left padding^-1 (e.g. `causal=True`).")
+        if self.padding_mode != "zeros":
+            raise RuntimeError("Currently ConvT1dEx support streaming only with `padding_mode='zeros'`.")
+
+        stride = self.stride[0]
+        len_o = stride * x.size(-1)
+        if len_o == 0:
+            return state.new_zeros(state.size(0), self.out_channels, 0, dtype=compute_dtype(self.weight)), state
+        o_full = F.conv_transpose1d(x, self.weight, None, self.stride, 0, 0, self.groups, self.dilation)
+        # Overlap-add (and bias) in accumulation dtype (fp32 for reduced precision), so state keeps full precision
+        dtype = o_full.dtype
+        o_full = o_full.to(accumulation_dtype(dtype))
+        if o_full.size(-1) < len_o:
+            o_full = F.pad(o_full, (0, len_o - o_full.size(-1)))
+        o_full[..., : state.size(-1)] += state
+        o = o_full[..., :len_o]
+        if self.bias is not None:
+            o = o + self.bias.unsqueeze(-1)
+        return o.to(dtype), o_full[..., len_o:]
+
+    def flush_stream(self, state: Tensor) -> Tensor:
+        """Yield the overlap-add tail not cropped by right padding^-1, at the end of stream."""
+        # Full-length output beyond `stride * L_in` already yielded
+        len_tail = max(0, self._effective_kernel() - self.stride[0] + self.output_padding[0] - self._padding_total()[1])
+        o = F.pad(state, (0, max(0, len_tail - state.size(-1))))[..., :len_tail]
+        o = o if self.bias is None else o + self.bias.unsqueeze(-1)
+        return o.to(compute_dtype(self.weight))
@@ -1,5 +1,6 @@
 """Test of ConvT1dEx"""
 
+import pytest
 import torch
 from torch import nn, tensor, allclose # pylint: disable=no-name-in-module
 from .convt1d import ConvT1dEx
@@ -116,3 +117,79 @@ def test_convt1dex_with_stride_dilation():
         print(o_causal)
         assert allclose(o_normal, tensor([[[ 7.,  0., 17.,  0., 19., 0.]]]))
         assert allclose(o_causal, tensor([[[ 2.,  0.,  7.,  0., 17., 0.]]]))
+
+
+def test_convt1dex_scale_ceil_length():
+    """ConvT1dEx with `padding='scale_ceil'` should restore the input length of `Conv1dEx(padding='scale_ceil')`."""
+
+    from .conv1d import Conv1dEx # pylint: disable=import-outside-toplevel
+    for causal in (False, True):
+        for kernel_size, stride, dilation in ((4, 2, 1), (5, 3, 1), (3, 2, 2), (3, 3, 1)):
+            encoder = Conv1dEx(1, 1, kernel_size, causal=causal, stride=stride, padding="scale_ceil", dilation=dilation)
+            for length in range(1, 13):
+                decoder = ConvT1dEx(1, 1, kernel_size, causal=causal, stride=stride, padding="scale_ceil", dilation=dilation, output_padding=(length - 1) % stride)
+                assert decoder(encoder(torch.zeros(1, 1, length))).size(-1) == length
+        # K_eff < stride, L_out = stride * (L_in - 1) + 1 + output_padding
+        for output_padding in range(4):
+            decoder = ConvT1dEx(1, 1, 2, causal=causal, stride=4, padding="scale_ceil", output_padding=output_padding)
+            assert decoder(torch.zeros(1, 1, 3)).size(-1) == 4 * 2 + 1 + output_padding
+
+
+def test_convt1dex_native_padding():
+    """ConvT1dEx should absorb symmetric padding^-1 into native padding, and crop only asymmetric residual."""
+
+    convt_drop = ConvT1dEx(1, 1, 4, stride=2, padding="scale_drop")
+    assert convt_drop.padding == (1,) and convt_drop._input_padding == (None, None) # pylint: disable=protected-access
+    convt_ceil = ConvT1dEx(1, 1, 5, stride=2, padding="scale_ceil", output_padding=1)
+    assert convt_ceil.padding == (1,) and convt_ceil._input_padding == (1, None) # pylint: disable=protected-access
+    assert convt_ceil._padding_total() == (2, 1) # pylint: disable=protected-access
+
+
+def test_convt1dex_scale_ceil_output_size():
+    """ConvT1dEx with `padding='scale_ceil'` should yield the given output length, equal to the one with the matching `output_padding`."""
+
+    torch.manual_seed(0)
+    with torch.no_grad():
+        for causal in (False, True):
+            for kernel_size, stride, dilation in ((4, 2, 1), (5, 3, 1), (3, 2, 2), (2, 4, 1)):
+                decoder = ConvT1dEx(2, 3, kernel_size, causal=causal, stride=stride, padding="scale_ceil", dilation=dilation)
+                for length in range(1, 13):
+                    # Output length of `Conv1dEx(padding='scale_ceil')` over `length` input
+                    ipt = torch.randn(1, 2, -(-length // stride))
+                    reference = ConvT1dEx(2, 3, kernel_size, causal=causal, stride=stride, padding="scale_ceil", dilation=dilation, output_padding=(length - 1) % stride)
+                    reference.load_state_dict(decoder.state_dict())
+                    opt = decoder(ipt, output_size=length)
+                    assert opt.size(-1) == length
+                    assert allclose(opt, reference(ipt), atol=1e-6)
+
+    with pytest.raises(RuntimeError):
+        ConvT1dEx(1, 1, 4, stride=2, padding="scale_ceil")(torch.zeros(1, 1, 3), output_size=7)
+    with pytest.raises(RuntimeError):
+        ConvT1dEx(1, 1, 4, stride=2, padding="scale_drop")(torch.zeros(1, 1, 3), output_size=6)
+
+
+def test_convt1dex_scale_ceil_value():
+    """ConvT1dEx with `padding='scale_ceil'` should equal to 'scale_drop' one with the cropped last stride, also in streaming."""
+
+    torch.manual_seed(0)
+    ipt = torch.randn(1, 2, 9)
+    with torch.no_grad():
+        for causal in (False, True):
+            for kernel_size, stride, dilation in ((4, 2, 1), (5, 3, 1), (3, 2, 2)):
+                conv_drop = ConvT1dEx(2, 3, kernel_size, causal=causal, stride=stride, padding="scale_drop", dilation=dilation)
+                opt_drop = conv_drop(ipt)
+                for output_padding in range(stride):
+                    conv_ceil = ConvT1dEx(2, 3, kernel_size, causal=causal, stride=stride, padding="scale_ceil", dilation=dilation, output_padding=output_padding)
+                    conv_ceil.load_state_dict(conv_drop.state_dict())
+                    len_gt = stride * (ipt.size(-1) - 1) + 1 + output_padding
+                    opt_ceil = conv_ceil(ipt)
+                    assert opt_ceil.size(-1) == len_gt
+                    assert allclose(opt_ceil, opt_drop[..., :len_gt], atol=1e-6)
+                    if causal:
+                        # The last stride is fully yielded in streaming
+                        state = conv_ceil.init_state()
+                        opt0, state = conv_ceil.forward_stream(ipt[..., :4], state)
+                        opt1, state = conv_ceil.forward_stream(ipt[..., 4:], state)
+                        opt_stream = torch.cat([opt0, opt1, conv_ceil.flush_stream(state)], dim=-1)
+                        assert opt_stream.size(-1) == len_gt + stride - 1 - output_padding
+                        assert allclose(opt_stream[..., :len_gt], opt_ceil, atol=1e-6)
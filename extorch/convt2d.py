@@ -0,0 +1,147 @@
+"Extended ConvTranspose2d"
+
+from typing import Literal, Any
+
+from torch import Tensor, nn
+import torch.nn.functional as F
+
+from .padding import padding_lr
+from .precision import accumulation_dtype, compute_dtype
+from .conv2d import _pair
+
+
+class ConvT2dEx(nn.ConvTranspose2d):
+    """Extended ConvTranspose2d which support causal transposed convolution along time axis.
+
+    Input is (B, C, Freq, Time), so the last axis is the time axis.
+    Each axis is padded^-1 (cropped) in the same way as ConvT1dEx:
+        - Freq axis: Normal transposed conv (centered kernel, aligned to the stride center)
+        - Time axis: Causal transposed conv (◣ shape kernel, aligned to the stride head) if `causal`, else normal one
+    Symmetric part of padding^-1 is absorbed into nn.ConvTranspose2d native padding, so only asymmetric residual is cropped explicitly.
+    """
+    def __init__(self,
+        in_channels:    int,
+        out_channels:   int,
+        kernel_size:    int | tuple[int, int],
+        *args:          Any,
+        causal:         bool = False,
+        stride:         int | tuple[int, int] = 1,
+        padding: Literal["same", "valid", "scale_drop"] | int | tuple[Literal["same", "valid", "scale_drop"] | int, Literal["same", "valid", "scale_drop"] | int] = 0,
+        output_padding: int | tuple[int, int] = 0,
+        groups:         int  = 1,
+        bias:           bool = True,
+        dilation:       int | tuple[int, int] = 1,
+        padding_mode:   str  = "zeros",
+        device               = None,
+        dtype                = None,
+    ):
+        """All arguments of `nn.ConvTranspose2d`, and new options.
+
+        Args:
+            causal - Whether to use causal ConvT along time axis
+            padding - Padding size or automatic padding mode (c.f. ConvT1dEx), shared by axes or per (Freq, Time) axis
+        """
+
+        # Validation
+        if len(args) > 0:
+            raise RuntimeError("ConvT2dEx needs named arguments for stride and subsequents.")
+        if causal and (padding_mode != "zeros"):
+            raise RuntimeError("Currently ConvT2dEx support only `padding_mode='zeros'` for causal mode.")
+
+        kernel_size, stride, dilation, output_padding = _pair(kernel_size), _pair(stride), _pair(dilation), _pair(output_padding)
+        paddings = padding if isinstance(padding, tuple) else (padding, padding)
+
+        # Padding^-1 per axis, (Freq, Time)
+        padding_axes: list[tuple[int, int]] = []
+        for axis, (k, s, d, p, op) in enumerate(zip(kernel_size, stride, dilation, paddings, output_padding)):
+            causal_axis = causal and axis == 1
+            #                                        normal                           causal
+            shape: Literal["delta", "inv_causal"] = "delta"  if not causal_axis else "inv_causal"
+            align: Literal["head", "center"]      = "center" if not causal_axis else "head"
+            if (s > 1) and (p == "same"):
+                raise RuntimeError("Transposed convolution with stride>1 results in len(opt) > len(ipt), so `padding == 'same'` is not permitted.")
+            if not isinstance(p, int) and op > 0:
+                raise RuntimeError("Currently ConvT2dEx support only `output_padding=0` for auto-padding.")
+            if p == "scale_ceil":
+                raise RuntimeError("Currently ConvT2dEx not yet implement `padding='scale_ceil'`.")
+            if causal_axis and (p not in ("same", "scale_drop")):
+                raise RuntimeError("ConvT2dEx with `causal=True` requires time axis `padding=='same'|'scale_drop'`.")
+            if isinstance(p, int):
+                padding_axes.append((p, p))
+            elif p == "valid":
+                padding_axes.append((0, 0))
+            else:
+                padding_axes.append(padding_lr(1 + (k - 1) * d, shape, s, align, True))
+
+        # conv_padding:  Symmetric padding^-1 in nn.ConvTranspose2d internally
+        # input_padding: Asymmetric residual padding^-1 during ConvT2dEx forward explicitly, in the order of `Conv2dEx._input_padding`
+        conv_padding = tuple(min(crop_l, crop_r) for crop_l, crop_r in padding_axes)
+        (freq_l, freq_r), (time_l, time_r) = padding_axes
+        self._input_padding = (time_l - conv_padding[1], time_r - conv_padding[1], freq_l - conv_padding[0], freq_r - conv_padding[0])
+
+        super().__init__(in_channels, out_channels, kernel_size, stride, conv_padding, output_padding, groups, bias, dilation, padding_mode, device, dtype)
+        self.causal = causal
+
+    def _effective_kernel(self) -> tuple[int, int]:
+        """Effective kernel size of (Freq, Time) axis."""
+        return (1 + (self.kernel_size[0] - 1) * self.dilation[0], 1 + (self.kernel_size[1] - 1) * self.dilation[1])
+
+    def _padding_total(self) -> tuple[tuple[int, int], tuple[int, int]]:
+        """((Freq_l, Freq_r), (Time_l, Time_r)) padding^-1 in total, explicit `_input_padding` + nn.ConvTranspose2d internal padding."""
+        time_l, time_r, freq_l, freq_r = self._input_padding
+        return ((freq_l + self.padding[0], freq_r + self.padding[0]), (time_l + self.padding[1], time_r + self.padding[1]))
+
+    def _crop_freq(self, o: Tensor) -> Tensor:
+        """Crop residual padding^-1 of Freq axis."""
+        _, _, freq_l, freq_r = self._input_padding
+        return o[..., freq_l : o.size(-2) - freq_r, :]
+
+    def forward(self, x: Tensor):
+        """Forward ConvT2dEx with non-uniform padding^-1"""
+        time_l, time_r, _, _ = self._input_padding
+        o = self._crop_freq(super().forward(x))
+        return o[..., time_l : o.size(-1) - time_r]
+
+    def init_state(self, batch_size: int = 1) -> Tensor:
+        """Initial streaming state, zero overlap-add tail of time axis :: (B, C_out, 1, max(0, K_eff - stride)), broadcasted to Freq axis."""
+        return self.weight.new_zeros(batch_size, self.out_channels, 1, max(0, self._effective_kernel()[1] - self.stride[1]), dtype=accumulation_dtype(self.weight.dtype))
+
+    def forward_stream(self, x: Tensor, state: Tensor) -> tuple[Tensor, Tensor]:
+        """Forward a time chunk in streaming mode, c.f. `ConvT1dEx.forward_stream`.
+
+        Args:
+            x     - Input chunk, (B, C_in, Freq, T_chunk)
+            state - Streaming state, (B, C_out, Freq_out|1, T_state)
+        Returns:
+                  - Output chunk, (B, C_out, Freq_out, stride * T_chunk)
+                  - New streaming state
+        """
+        if self._padding_total()[1][0] != 0:
+            raise RuntimeError("Currently ConvT2dEx support streaming only without time-axis left padding^-1 (e.g. `causal=True`).")
+        if self.padding_mode != "zeros":
+            raise RuntimeError("Currently ConvT2dEx support streaming only with `padding_mode='zeros'`.")
+
+        stride_t = self.stride[1]
+        len_o = stride_t * x.size(-1)
+        if len_o == 0:
+            (freq_l, freq_r), _ = self._padding_total()
+            n_freq = (x.size(-2) - 1) * self.stride[0] + self._effective_kernel()[0] + self.output_padding[0] - freq_l - freq_r
+            return state.new_zeros(state.size(0), self.out_channels, n_freq, 0, dtype=compute_dtype(self.weight)), state
+        o_full = F.conv_transpose2d(x, self.weight, None, self.stride, (self.padding[0], 0), (self.output_padding[0], 0), self.groups, self.dilation)
+        # Overlap-add (and bias) in accumulation dtype (fp32 for reduced precision), so state keeps full precision
+        dtype = o_full.dtype
+        o_full = self._crop_freq(o_full).to(accumulation_dtype(dtype))
+        if o_full.size(-1) < len_o:
+            o_full = F.pad(o_full, (0, len_o - o_full.size(-1)))
+        o_full[..., : state.size(-1)] += state
+        o = o_full[..., :len_o]
+        if self.bias is not None:
+            o = o + self.bias.view(-1, 1, 1)
+        return o.to(dtype), o_full[..., len_o:]
+
+    def flush_stream(self, state: Tensor) -> Tensor:
+        """Yield the overlap-add tail not cropped by right padding^-1 of time axis, at the end of stream."""
+        tail = F.pad(state, (0, self.output_padding[1]))
+        o = tail[..., : max(0, tail.size(-1) - self._padding_total()[1][1])]
+        o = o if self.bias is None else o + self.bias.view(-1, 1, 1)
+        return o.to(compute_dtype(self.weight))
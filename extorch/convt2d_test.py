@@ -0,0 +1,56 @@
+"""Test of ConvT2dEx"""
+
+import torch
+from torch import allclose, no_grad # pylint: disable=no-name-in-module
+
+from .convt1d import ConvT1dEx
+from .convt2d import ConvT2dEx
+from .conftest import stream_chunked
+
+
+def _rows(x: torch.Tensor) -> torch.Tensor:
+    """(B, 1, F, T) -> (B*F, 1, T)"""
+    return x.transpose(1, 2).flatten(0, 1)
+
+
+def test_convt2dex_axis_equivalence():
+    """ConvT2dEx should crop each axis as ConvT1dEx (time: causal/normal, freq: normal)."""
+
+    torch.manual_seed(0)
+    with no_grad():
+        for causal in (False, True):
+            for kernel, stride, dilation in ((3, 1, 1), (4, 2, 1), (5, 2, 2), (3, 3, 1)):
+                padding = "same" if stride == 1 else "scale_drop"
+                ipt = torch.randn(2, 1, 7, 11)
+                # Time axis
+                convt2d = ConvT2dEx(1, 1, (1, kernel), causal=causal, stride=(1, stride), padding=padding, dilation=(1, dilation), bias=False)
+                convt1d = ConvT1dEx(1, 1,     kernel,  causal=causal, stride=stride,      padding=padding, dilation=dilation,      bias=False)
+                convt1d.weight.copy_(convt2d.weight[:, :, 0])
+                assert allclose(_rows(convt2d(ipt)), convt1d(_rows(ipt)), atol=1e-6)
+                # Freq axis, always normal conv
+                convt2d = ConvT2dEx(1, 1, (kernel, 1), causal=causal, stride=(stride, 1), padding=(padding, "same"), dilation=(dilation, 1), bias=False)
+                convt1d = ConvT1dEx(1, 1,  kernel,                    stride=stride,      padding=padding,           dilation=dilation,      bias=False)
+                convt1d.weight.copy_(convt2d.weight[:, :, :, 0])
+                assert allclose(_rows(convt2d(ipt).transpose(2, 3)), convt1d(_rows(ipt.transpose(2, 3))), atol=1e-6)
+
+
+def test_convt2dex_input_padding():
+    """ConvT2dEx should hold residual padding^-1 in the order of Conv2dEx, (Time_l, Time_r, Freq_l, Freq_r)."""
+
+    convt = ConvT2dEx(1, 1, 4, causal=True, stride=(1, 2), padding="scale_drop")
+    assert convt.padding == (1, 0) and convt._input_padding == (0, 2, 0, 1) # pylint: disable=protected-access
+    assert convt._padding_total() == ((1, 2), (0, 2)) # pylint: disable=protected-access
+
+
+def test_convt2dex_forward_stream():
+    """ConvT2dEx should yield identical output in time-axis streaming."""
+
+    torch.manual_seed(0)
+    with no_grad():
+        for convt in (
+            ConvT2dEx(2, 3, 3, causal=True, padding="same"),
+            ConvT2dEx(2, 3, 4, causal=True, stride=2, padding="scale_drop"),
+            ConvT2dEx(2, 3, (3, 5), causal=True, stride=(1, 2), padding=("same", "scale_drop"), dilation=(1, 2)),
+        ):
+            ipt = torch.randn(2, 2, 8, 20)
+            assert allclose(stream_chunked(convt, ipt, 3), convt(ipt), atol=1e-6)
@@ -0,0 +1,130 @@
+"Depthwise & Separable Conv1dEx"
+
+from collections import OrderedDict
+from typing import Literal, Any
+
+from torch import Tensor, nn
+
+from .conv1d import Conv1dEx
+from .precision import compute_dtype, accumulation_dtype
+
+
+class DepthwiseConv1dEx(Conv1dEx):
+    """Depthwise Conv1dEx (`groups == in_channels`) with tap-wise multiply-accumulate implementation.
+
+    Drop-in replacement of `Conv1dEx(..., groups=in_channels)`, including causal and `scale_*` padding.
+    Instead of the grouped convolution path, output is accumulated tap by tap over strided views of the input.
+    Zero padding is not materialized, each tap accumulates only over its valid output range.
+
+        tap0  o[j] +=  w0 * x[j*s - pl + 0*d]
+        tap1  o[j] +=  w1 * x[j*s - pl + 1*d]
+        ...
+    """
+    def __init__(self,
+        in_channels:  int,
+        out_channels: int,
+        kernel_size:  int,
+        *args:        Any,
+        causal:       bool = False,
+        stride:       int  = 1,
+        padding:      Literal["same", "valid", "scale", "scale_drop", "scale_ceil"] | int | tuple[int] = 0,
+        dilation:     int  = 1,
+        bias:         bool = True,
+        padding_mode: str  = "zeros",
+        device             = None,
+        dtype              = None,
+    ):
+        """Arguments of `Conv1dEx` except for `groups` (fixed to `in_channels`).
+
+        Args:
+            out_channels - Multiple of `in_channels` (depth multiplier)
+        """
+        if len(args) > 0:
+            raise RuntimeError("DepthwiseConv1dEx needs named arguments for stride and subsequents.")
+        if out_channels % in_channels != 0:
+            raise RuntimeError(f"DepthwiseConv1dEx requires `out_channels` as multiple of `in_channels`, but {out_channels} vs {in_channels}.")
+        super().__init__(in_channels, out_channels, kernel_size, causal=causal, stride=stride, padding=padding, dilation=dilation,
+            groups=in_channels, bias=bias, padding_mode=padding_mode, device=device, dtype=dtype)
+
+    def forward(self, x: Tensor):
+        """Forward depthwise convolution by tap-wise multiply-accumulate."""
+
+        # Non-zero padding needs padded input, so fallback to the grouped convolution path
+        if self.padding_mode != "zeros":
+            return super().forward(x)
+
+        return self._forward_mac(x, *self._padding_total())
+
+    def _forward_valid(self, x: Tensor) -> Tensor:
+        """Forward convolution without any padding, by tap-wise multiply-accumulate."""
+        return self._forward_mac(x, 0, 0)
+
+    def _forward_mac(self, x: Tensor, padding_l: int, padding_r: int) -> Tensor:
+        """Forward depthwise convolution with virtual zero padding, by tap-wise multiply-accumulate."""
+
+        kernel_size, stride, dilation = self.kernel_size[0], self.stride[0], self.dilation[0]
+        len_i = x.size(-1)
+        len_o = (len_i + padding_l + padding_r - (1 + (kernel_size - 1) * dilation)) // stride + 1
+        multiplier = self.out_channels // self.in_channels
+        if len_o <= 0:
+            raise RuntimeError(f"Padded input length {len_i + padding_l + padding_r} is shorter than the effective kernel size.")
+
+        # Reduced precision (e.g. bf16 autocast) is accumulated in fp32
+        dtype = compute_dtype(self.weight)
+        acc_dtype = accumulation_dtype(dtype)
+
+        # weight :: (C_out=C_in*M, 1, K) -> (C_in, M, K), x :: (..., C_in, L) -> (..., C_in, 1, L)
+        weight = self.weight.view(self.in_channels, multiplier, kernel_size).to(dtype)
+        x = x.unsqueeze(-2).to(dtype)
+        shape_o = x.shape[:-2] + (multiplier, len_o)
+        if self.bias is None:
+            o = x.new_zeros(shape_o, dtype=acc_dtype)
+        else:
+            o = self.bias.view(self.in_channels, multiplier, 1).to(acc_dtype).expand(shape_o).clone()
+
+        for tap in range(kernel_size):
+            # Valid output range [j_start, j_end) of this tap, which satisfies `0 <= j*s - pl + tap*d < L_in`
+            offset = tap * dilation - padding_l
+            j_start = max(0, -(offset // stride))
+            j_end = min(len_o, (len_i - 1 - offset) // stride + 1)
+            if j_end <= j_start:
+                continue
+            i_start = j_start * stride + offset
+            o[..., j_start:j_end].addcmul_(x[..., i_start : i_start + (j_end - j_start - 1) * stride + 1 : stride], weight[..., tap : tap + 1])
+
+        return o.flatten(-3, -2).to(dtype)
+
+
+class SeparableConv1dEx(nn.Sequential):
+    """Depthwise-separable Conv1dEx, DepthwiseConv1dEx followed by pointwise Conv1dEx.
+
+    It is `nn.Sequential(depthwise, pointwise)`, so stack utilities (e.g. `stream.forward_stream`) handle it as its two convs.
+    """
+    def __init__(self,
+        in_channels:  int,
+        out_channels: int,
+        kernel_size:  int,
+        *args:        Any,
+        causal:       bool = False,
+        stride:       int  = 1,
+        padding:      Literal["same", "valid", "scale", "scale_drop", "scale_ceil"] | int | tuple[int] = 0,
+        dilation:     int  = 1,
+        depth_multiplier: int = 1,
+        bias:         bool = True,
+        padding_mode: str  = "zeros",
+        device             = None,
+        dtype              = None,
+    ):
+        """Arguments of `Conv1dEx` except for `groups`, and new option.
+
+        Args:
+            depth_multiplier - Number of depthwise output channels per input channel
+        """
+        if len(args) > 0:
+            raise RuntimeError("SeparableConv1dEx needs named arguments for stride and subsequents.")
+        hidden_channels = in_channels * depth_multiplier
+        super().__init__(OrderedDict([
+            ("depthwise", DepthwiseConv1dEx(in_channels, hidden_channels, kernel_size, causal=causal, stride=stride, padding=padding,
+                dilation=dilation, bias=False, padding_mode=padding_mode, device=device, dtype=dtype)),
+            ("pointwise", Conv1dEx(hidden_channels, out_channels, 1, causal=causal, padding="same", bias=bias, device=device, dtype=dtype)),
+        ]))
@@ -0,0 +1,83 @@
+"""Test of DepthwiseConv1dEx & SeparableConv1dEx"""
+
+import torch
+from torch import nn, tensor, equal, allclose, no_grad # pylint: disable=no-name-in-module
+
+from .conv1d import Conv1dEx
+from .depthwise import DepthwiseConv1dEx, SeparableConv1dEx
+from .conftest import stream_chunked
+
+
+def test_depthwise_conv1dex_causal():
+    """DepthwiseConv1dEx should support causal convolution.
+
+    [causal] k3s1d1, kernel (2,3,5)
+    ipt        -         -         1         2         3
+     ---------------------------------------------------
+                               0+0+5    0+3+10    2+6+15
+     ---------------------------------------------------
+    opt                            5        13        23
+    """
+
+    with no_grad():
+        i = tensor([[[1., 2., 3.]]])
+        conv = DepthwiseConv1dEx(1, 1, 3, causal=True, padding="same", bias=False)
+        conv.weight[0][0] = nn.Parameter(tensor([2., 3., 5.]))
+
+        assert equal(conv(i), tensor([[[ 5., 13., 23.]]]))
+
+
+def test_depthwise_conv1dex_equivalence():
+    """DepthwiseConv1dEx should be equivalent to grouped Conv1dEx."""
+
+    torch.manual_seed(0)
+    configs = [
+        # causal stride dilation padding       kernel multiplier
+        (True,   1,     1,       "same",       3,     1),
+        (True,   1,     4,       "same",       3,     2),
+        (False,  1,     1,       "same",       4,     1),
+        (False,  1,     1,       3,            3,     1),
+        (True,   2,     1,       "scale_ceil", 5,     1),
+        (True,   3,     2,       "scale_drop", 3,     1),
+        (False,  2,     1,       "scale_ceil", 4,     3),
+        (False,  2,     1,       "valid",      3,     1),
+    ]
+    with no_grad():
+        for causal, stride, dilation, padding, kernel, multiplier in configs:
+            generic   =          Conv1dEx(4, 4 * multiplier, kernel, causal=causal, stride=stride, dilation=dilation, padding=padding, groups=4)
+            depthwise = DepthwiseConv1dEx(4, 4 * multiplier, kernel, causal=causal, stride=stride, dilation=dilation, padding=padding)
+            depthwise.load_state_dict(generic.state_dict())
+            for length in (7, 8, 20):
+                ipt = torch.randn(2, 4, length)
+                opt_gt, opt = generic(ipt), depthwise(ipt)
+                assert opt.shape == opt_gt.shape, f"{causal}/{stride}/{dilation}/{padding}/{kernel}/{length}"
+                assert allclose(opt, opt_gt, atol=1e-6), f"{causal}/{stride}/{dilation}/{padding}/{kernel}/{length}"
+
+
+def test_depthwise_conv1dex_backward():
+    """DepthwiseConv1dEx should yield gradients identical to grouped Conv1dEx."""
+
+    torch.manual_seed(0)
+    generic   =          Conv1dEx(3, 3, 3, causal=True, stride=2, padding="scale_ceil", groups=3)
+    depthwise = DepthwiseConv1dEx(3, 3, 3, causal=True, stride=2, padding="scale_ceil")
+    depthwise.load_state_dict(generic.state_dict())
+    ipt = torch.randn(2, 3, 9)
+    generic(ipt).sum().backward()
+    depthwise(ipt).sum().backward()
+
+    assert allclose(depthwise.weight.grad, generic.weight.grad, atol=1e-6)
+    assert allclose(depthwise.bias.grad,   generic.bias.grad,   atol=1e-6)
+
+
+def test_separable_conv1dex():
+    """SeparableConv1dEx should be depthwise conv followed by pointwise conv."""
+
+    with no_grad():
+        conv = SeparableConv1dEx(2, 5, 3, causal=True, stride=2, padding="scale_ceil", depth_multiplier=2)
+        ipt = torch.randn(1, 2, 9)
+
+        assert conv(ipt).shape == (1, 5, 5)
+        assert allclose(conv(ipt), conv.pointwise(conv.depthwise(ipt)))
+
+        # Streaming as a stack
+        assert allclose(stream_chunked(conv, ipt, 4), conv(ipt), atol=1e-6)
@@ -0,0 +1,78 @@
+"""Test of space-to-batch execution"""
+
+import torch
+from torch import nn, allclose, equal, no_grad # pylint: disable=no-name-in-module
+
+from .conv1d import Conv1dEx
+from .convt1d import ConvT1dEx
+from .depthwise import SeparableConv1dEx
+from .antialias import AntiAliasConv1dEx
+from .transpose import Transpose
+from .dilation import space_to_batch, batch_to_space, forward_space_to_batch
+
+
+def test_space_to_batch():
+    """space_to_batch should fold time by phase, and batch_to_space should invert it."""
+
+    x = torch.arange(18.).view(2, 1, 9)
+    folded = space_to_batch(x, 3)
+    assert folded.shape == (6, 1, 3)
+    assert equal(folded[0, 0], torch.tensor([0., 3., 6.]))
+    assert equal(folded[3, 0], torch.tensor([10., 13., 16.]))
+    assert equal(batch_to_space(folded, 3), x)
+
+
+def test_forward_space_to_batch_equivalence():
+    """forward_space_to_batch should yield output identical to the normal forward in tolerance."""
+
+    torch.manual_seed(0)
+    with no_grad():
+        for causal in (True, False):
+            model = nn.Sequential(
+                Conv1dEx(3, 8, 3, causal=causal, padding="same"), nn.ReLU(),
+                Conv1dEx(8, 8, 3, causal=causal, padding="same", dilation=4), nn.ReLU(),
+                Conv1dEx(8, 8, 3, causal=causal, padding="same", dilation=8), nn.Tanh(),
+                Transpose(1, 2), nn.LayerNorm(8), Transpose(1, 2),
+                Conv1dEx(8, 8, 2, causal=causal, padding="same", dilation=16, groups=2),
+                Conv1dEx(8, 8, 3, causal=causal, padding="same", dilation=2),
+                Conv1dEx(8, 8, 5, causal=causal, padding="same", dilation=12), nn.ReLU(),
+                SeparableConv1dEx(8, 8, 3, causal=causal, padding="same", dilation=8),
+                Conv1dEx(8, 2, 3, causal=causal, padding="same"),
+            )
+            for length in (64, 77, 5):
+                ipt = torch.randn(2, 3, length)
+                assert allclose(forward_space_to_batch(model, ipt, min_dilation=4), model(ipt), atol=1e-5)
+            conv = Conv1dEx(3, 2, 3, causal=causal, padding="same", dilation=8)
+            assert allclose(forward_space_to_batch(conv, ipt[0], min_dilation=4), conv(ipt[0]), atol=1e-5)
+
+        # Valid padding and non-Conv1dEx conv
+        model = nn.Sequential(
+            Conv1dEx(3, 4, 3, padding="valid", dilation=8), nn.ReLU(),
+            ConvT1dEx(4, 4, 4, causal=True, stride=2, padding="scale_drop"),
+            Conv1dEx(4, 4, 3, causal=True, padding="same", dilation=8),
+        )
+        ipt = torch.randn(1, 3, 50)
+        assert allclose(forward_space_to_batch(model, ipt, min_dilation=8), model(ipt), atol=1e-5)
+
+
+def test_forward_space_to_batch_antialias():
+    """forward_space_to_batch should run AntiAliasConv1dEx unfolded with its fused lowpass."""
+
+    torch.manual_seed(0)
+    with no_grad():
+        conv = AntiAliasConv1dEx(2, 2, 3, causal=True, padding="same", dilation=8, lowpass=9)
+        ipt = torch.randn(1, 2, 40)
+        assert allclose(forward_space_to_batch(nn.Sequential(conv), ipt, min_dilation=4), conv(ipt), atol=1e-5)
+
+
+def test_forward_space_to_batch_grad():
+    """forward_space_to_batch should be differentiable as the normal forward."""
+
+    torch.manual_seed(0)
+    conv = Conv1dEx(3, 2, 3, causal=True, padding="same", dilation=4)
+    ipt = torch.randn(1, 3, 30)
+    forward_space_to_batch(conv, ipt, min_dilation=4).sum().backward()
+    grad = conv.weight.grad.clone()
+    conv.weight.grad = None
+    conv(ipt).sum().backward()
+    assert allclose(grad, conv.weight.grad, atol=1e-5)
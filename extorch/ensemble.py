@@ -0,0 +1,96 @@
+"""Batched execution of structurally identical models (ensemble/multi-speaker) by grouped convolution."""
+
+from copy import deepcopy
+from typing import Sequence
+
+import torch
+from torch import Tensor, nn
+
+from .conv1d import Conv1dEx
+from .convt1d import ConvT1dEx
+from .depthwise import DepthwiseConv1dEx
+from .antialias import AntiAliasConv1dEx
+from .channel import is_channel_independent
+
+
+# Convs whose weight is `nn.Conv1d`/`nn.ConvTranspose1d` one, so stacked by groups
+_CONVS = (Conv1dEx, ConvT1dEx, DepthwiseConv1dEx, AntiAliasConv1dEx)
+
+
+def _cat(tensors: list[Tensor | None]) -> nn.Parameter | None:
+    return None if tensors[0] is None else nn.Parameter(torch.cat([tensor.detach() for tensor in tensors]))
+
+
+def _conv_config(conv: nn.Module) -> tuple:
+    """Non-parameter configs which are not fully visible in `repr`."""
+    return (conv._input_padding, conv.output_padding, conv.causal, getattr(conv, "_scale_ceil", False)) # pylint: disable=protected-access
+
+
+def stack_modules(modules: Sequence[nn.Module]) -> nn.Module:
+    """Stack N structurally identical models into a single model over channel-stacked input, by grouped convolution.
+
+    Each conv becomes a conv with `N * groups` groups, whose n-th group block is the n-th model's conv.
+    The copy of the first model is modified, so padding/trimming (`_input_padding`, `causal`, etc.) is kept as is.
+
+        model_0:  (C_in) -> Conv1dEx(C_in, C, groups=g) -> ReLU -> ConvT1dEx(C, C_out)
+        model_1:  (C_in) -> Conv1dEx(C_in, C, groups=g) -> ReLU -> ConvT1dEx(C, C_out)
+        stacked:  (2C_in) -> Conv1dEx(2C_in, 2C, groups=2g) -> ReLU -> ConvT1dEx(2C, 2C_out, groups=2)
+
+    It saves per-call overhead of N models (e.g. short chunks), while grouped conv kernels can be slower than N dense ones.
+    On CPU, the stacked path measured 0.48-0.99x the speed of the sequential loop over N models (never faster), c.f. `benchmark.bench_ensemble`,
+    so measure it on the target device before use.
+
+    Args:
+        modules - Conv1dEx/ConvT1dEx (incl. depthwise/anti-alias), or `nn.Sequential` stacks of them, channel-independent activations,
+                  Transpose and BatchNorm1d, with the same configs and different weights.
+                  Convs are matched by exact type, so other subclasses are rejected
+                  (GatedConv1dEx splits its channels into tanh/sigmoid halves, WinogradConv1dEx supports only `groups=1`).
+    Returns:
+                - Stacked model, (B, N * C_in, L) -> (B, N * C_out, L_out). Weights are copied, so not shared with the source models.
+    """
+    if len(modules) == 0:
+        raise RuntimeError("`modules` should contain at least one module.")
+    ref = modules[0]
+    n_models = len(modules)
+    if any(type(module) is not type(ref) or repr(module) != repr(ref) for module in modules):
+        raise RuntimeError("All modules should have the same structure and configs.")
+
+    if isinstance(ref, nn.Sequential):
+        return nn.Sequential(*[stack_modules(list(layers)) for layers in zip(*modules)])
+
+    if type(ref) in _CONVS:
+        if any(_conv_config(module) != _conv_config(ref) for module in modules):
+            raise RuntimeError("All convs should have the same padding, `output_padding` and `causal`.")
+        if any(not all(torch.equal(buffer, buffer_ref) for buffer, buffer_ref in zip(module.buffers(), ref.buffers())) for module in modules):
+            raise RuntimeError("All convs should have the same buffers (e.g. `lowpass`).")
+        stacked = deepcopy(ref)
+        stacked.in_channels, stacked.out_channels, stacked.groups = n_models * ref.in_channels, n_models * ref.out_channels, n_models * ref.groups
+        stacked.weight = _cat([module.weight for module in modules])
+        stacked.bias = _cat([module.bias for module in modules])
+        return stacked
+
+    if type(ref) is nn.BatchNorm1d:
+        stacked = deepcopy(ref)
+        stacked.num_features = n_models * ref.num_features
+        stacked.weight, stacked.bias = _cat([module.weight for module in modules]), _cat([module.bias for module in modules])
+        if ref.running_mean is not None:
+            stacked.running_mean = torch.cat([module.running_mean for module in modules])
+            stacked.running_var  = torch.cat([module.running_var  for module in modules])
+        return stacked
+
+    if is_channel_independent(ref):
+        return deepcopy(ref)
+
+    raise RuntimeError(f"Not-supported layer for stacking: {type(ref).__name__}")
+
+
+def forward_stacked(stacked: nn.Module, xs: Sequence[Tensor]) -> list[Tensor]:
+    """Forward N inputs through a stacked model in one call, and split the output per model.
+
+    Args:
+        stacked - Model from `stack_modules` of N models
+        xs      - Inputs of each model, N x (B, C_in, L), the same input repeated for an ensemble
+    Returns:
+                - Outputs of each model, N x (B, C_out, L_out)
+    """
+    return list(stacked(torch.cat(list(xs), dim=-2)).chunk(len(xs), dim=-2))
@@ -0,0 +1,56 @@
+"""Test of stacked execution of identical models"""
+
+import pytest
+import torch
+from torch import nn, allclose, no_grad # pylint: disable=no-name-in-module
+
+from .conv1d import Conv1dEx
+from .convt1d import ConvT1dEx
+from .antialias import AntiAliasConv1dEx
+from .gated import GatedConv1dEx
+from .transpose import Transpose
+from .ensemble import stack_modules, forward_stacked
+from .conftest import module_stack, stream_chunked
+
+
+def test_stack_modules_equivalence():
+    """Stacked model should yield outputs identical to each model in tolerance, including streaming."""
+
+    torch.manual_seed(0)
+    with no_grad():
+        for causal in (True, False):
+            models = [module_stack(3, 2, causal=causal, layer_norm=False) for _ in range(3)]
+            for model in models:
+                model[3].running_mean.normal_()
+                model[3].running_var.uniform_(0.5, 2.)
+            stacked = stack_modules(models)
+            assert stacked[0].groups == 3 and stacked[5].groups == 24
+
+            ipts = [torch.randn(2, 3, 40) for _ in models]
+            for opt, model, ipt in zip(forward_stacked(stacked, ipts), models, ipts):
+                assert allclose(opt, model(ipt), atol=1e-5)
+
+            if causal:
+                opt = stream_chunked(stacked, torch.cat(ipts, dim=-2), 8)
+                for opt_model, model, ipt in zip(opt.chunk(3, dim=-2), models, ipts):
+                    assert allclose(opt_model, model(ipt), atol=1e-5)
+
+
+def test_stack_modules_unsupported():
+    """stack_modules should reject different structures and channel-mixing layers."""
+
+    with pytest.raises(RuntimeError):
+        stack_modules([Conv1dEx(2, 2, 3, padding="same"), Conv1dEx(2, 2, 5, padding="same")])
+    with pytest.raises(RuntimeError):
+        stack_modules([Conv1dEx(2, 2, 3, causal=True, padding="same"), Conv1dEx(2, 2, 3, padding="same")])
+    with pytest.raises(RuntimeError):
+        stack_modules([AntiAliasConv1dEx(2, 2, 3, stride=2, padding="scale_drop", lowpass=lowpass) for lowpass in ([0.25, 0.5, 0.25], [0.5, 0., 0.5])])
+    with pytest.raises(RuntimeError):
+        stack_modules([ConvT1dEx(2, 2, 4, stride=2, padding="scale_ceil", output_padding=output_padding) for output_padding in (0, 1)])
+    for layer in (nn.Softmax(dim=1), nn.LayerNorm(2)):
+        with pytest.raises(RuntimeError):
+            stack_modules([nn.Sequential(Transpose(1, 2), layer, Transpose(1, 2)) for _ in range(2)])
+    with pytest.raises(RuntimeError):
+        stack_modules([GatedConv1dEx(2, 2, 3, causal=True, padding="same") for _ in range(2)])
+    with pytest.raises(RuntimeError):
+        stack_modules([])
@@ -0,0 +1,115 @@
+"Gated-activation Conv1dEx"
+
+from typing import Literal, Any
+
+import torch
+from torch import Tensor, nn
+import torch.nn.functional as F
+
+from .conv1d import Conv1dEx
+
+
+class GatedConv1dEx(Conv1dEx):
+    """Conv1dEx with fused gated activation and optional conditioning, for WaveNet/GLU blocks.
+
+    Equivalent to `Conv1dEx(C_in, 2C) (+ Conv1d_1x1(C_cond, 2C)(cond)) -> split -> tanh(a) * sigmoid(b)` (or `a * sigmoid(b)` for GLU).
+    The unfused one materializes conditioning projection, their sum and each activation as new tensors.
+    The fused one accumulates the conditioning into the conv output in place (`baddbmm_`), applies tanh to the filter half in place,
+    and writes only the gated C-channel output by a single GLU pass.
+
+        unfused:  x -> conv -> (2C) ─┬─ + ─ (2C) ─ split ─ tanh ─ (C) ─┬─ * -> y
+                  c -> 1x1  -> (2C) ─┘                 └── sigm ─ (C) ─┘
+        fused:    x -> conv -> (2C) += W_c @ c -> [tanh_ | ] -> glu -> y
+
+    `out_channels` is the conv output channels 2C of [filter; gate] as the weight (2C, C_in/groups, K), and `gated_channels` is the output C.
+    Stack executors (e.g. `stream.forward_stream`) cannot pass `cond`, so they reject GatedConv1dEx with conditioning.
+    The gate is nonlinear, so channel-wise transforms of linear convs (`reparam.merge_parallel`, `prune.prune_channels`, etc.) reject it.
+    """
+    def __init__(self,
+        in_channels:   int,
+        out_channels:  int,
+        kernel_size:   int,
+        *args:         Any,
+        causal:        bool = False,
+        stride:        int  = 1,
+        padding:       Literal["same", "valid", "scale", "scale_drop", "scale_ceil"] | int | tuple[int] = 0,
+        dilation:      int  = 1,
+        groups:        int  = 1,
+        bias:          bool = True,
+        padding_mode:  str  = "zeros",
+        activation:    Literal["tanh", "glu"] = "tanh",
+        cond_channels: int  = 0,
+        device              = None,
+        dtype               = None,
+    ):
+        """Arguments of `Conv1dEx`, and new options.
+
+        Args:
+            out_channels  - The number of gated output channels (conv has `2 * out_channels`)
+            activation    - Gated activation, 'tanh' for `tanh(a) * sigmoid(b)` or 'glu' for `a * sigmoid(b)`
+            cond_channels - The number of conditioning input channels, 0 for no conditioning
+        """
+        if len(args) > 0:
+            raise RuntimeError("GatedConv1dEx needs named arguments for stride and subsequents.")
+        if activation not in ("tanh", "glu"):
+            raise RuntimeError(f"`activation` should be 'tanh' or 'glu', but got {activation}.")
+        super().__init__(in_channels, 2 * out_channels, kernel_size, causal=causal, stride=stride, padding=padding, dilation=dilation,
+            groups=groups, bias=bias, padding_mode=padding_mode, device=device, dtype=dtype)
+        # Gated output channels, while the conv (`out_channels`, weight) has `2 * gated_channels`
+        self.gated_channels = out_channels
+        self.activation, self.cond_channels = activation, cond_channels
+        if cond_channels > 0:
+            self.cond_weight = nn.Parameter(torch.empty(2 * out_channels, cond_channels, device=device, dtype=dtype))
+            nn.init.kaiming_uniform_(self.cond_weight, a=5 ** 0.5)
+        else:
+            self.register_parameter("cond_weight", None)
+
+    def _gate(self, o: Tensor, cond: Tensor | None = None) -> Tensor:
+        """Conditioning and gated activation of conv output (..., 2C, L), which is modified in place."""
+        if self.cond_channels > 0:
+            if cond is None:
+                raise RuntimeError("GatedConv1dEx with `cond_channels>0` needs `cond`.")
+            if cond.size(-1) != o.size(-1):
+                raise RuntimeError(f"`cond` length should be the output length {o.size(-1)}, but got {cond.size(-1)}.")
+            cond_weight = self.cond_weight.to(o.dtype)
+            cond = cond.to(o.dtype)
+            if o.dim() == 2:
+                o.addmm_(cond_weight, cond)
+            else:
+                o.baddbmm_(cond_weight.expand(o.size(0), -1, -1), cond)
+        # `a * sigmoid(b)` by single GLU kernel, after in-place tanh of the filter half
+        if self.activation == "tanh":
+            o.narrow(-2, 0, self.gated_channels).tanh_()
+        return F.glu(o, dim=-2)
+
+    def forward(self, x: Tensor, cond: Tensor | None = None): # pylint: disable=arguments-differ
+        """Forward gated Conv1dEx.
+
+        Args:
+            x    - Input, (B, C_in, L) or (C_in, L)
+            cond - Conditioning aligned to the output, (B, C_cond, L_out) or (C_cond, L_out)
+        Returns:
+                 - Gated output, (B, C_out, L_out) or (C_out, L_out)
+        """
+        return self._gate(super().forward(x), cond)
+
+    def _forward_valid(self, x: Tensor, cond: Tensor | None = None) -> Tensor: # pylint: disable=arguments-differ
+        """Forward gated convolution without any padding."""
+        return self._gate(super()._forward_valid(x), cond)
+
+    def forward_stream(self, x: Tensor, state: Tensor, cond: Tensor | None = None) -> tuple[Tensor, Tensor]: # pylint: disable=arguments-differ
+        """Forward a chunk in streaming mode, as `Conv1dEx.forward_stream` with conditioning chunk aligned to the output chunk, (B, C_cond, L_chunk_out)."""
+        o, state = super().forward_stream(x, state, cond=cond)
+        # No-frame output is not gated, so only its channels are reduced
+        return (o[..., : self.gated_channels, :] if o.size(-1) == 0 else o), state
+
+    def flush_stream(self, state: Tensor, cond: Tensor | None = None) -> Tensor: # pylint: disable=arguments-differ
+        """Yield the last frames which need right padding, at the end of stream."""
+        return super().flush_stream(state, cond=cond)
+
+
+def reject_conditioned(layers: list[nn.Module], executor: str) -> None:
+    """Raise if any layer is GatedConv1dEx with conditioning, which a stack executor cannot feed with `cond`."""
+    for layer in layers:
+        if isinstance(layer, GatedConv1dEx) and layer.cond_channels > 0:
+            raise RuntimeError(f"{executor} cannot pass `cond`, so GatedConv1dEx with `cond_channels>0` is not supported.")
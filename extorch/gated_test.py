@@ -0,0 +1,123 @@
+"""Test of gated-activation Conv1dEx"""
+
+import pytest
+import torch
+from torch import nn, allclose, no_grad # pylint: disable=no-name-in-module
+import torch.nn.functional as F
+
+from .conv1d import Conv1dEx
+from .gated import GatedConv1dEx
+from .stream import init_states, forward_stream
+from .silence import forward_stream_skip
+from .dilation import forward_space_to_batch
+from .reparam import merge_parallel
+from .prune import prune_channels, conv_flops
+from .parallel import forward_blocked
+
+
+def _unfused(gated: GatedConv1dEx, x: torch.Tensor, cond: torch.Tensor | None = None) -> torch.Tensor:
+    """Unfused reference, `conv(C_in, 2C) (+ 1x1 conditioning) -> split -> activation -> product`."""
+    padding = gated._padding_total() # pylint: disable=protected-access
+    o = F.conv1d(F.pad(x, padding), gated.weight, gated.bias, gated.stride, 0, gated.dilation, gated.groups)
+    if cond is not None:
+        o = o + F.conv1d(cond, gated.cond_weight.unsqueeze(-1))
+    filt, gate = o.chunk(2, dim=-2)
+    return (torch.tanh(filt) if gated.activation == "tanh" else filt) * torch.sigmoid(gate)
+
+
+@pytest.mark.parametrize("activation", ["tanh", "glu"])
+def test_gated_conv1dex_equivalence(activation: str):
+    """GatedConv1dEx should yield output identical to the unfused path, including conditioning and streaming."""
+
+    torch.manual_seed(0)
+    with no_grad():
+        for causal in (True, False):
+            for kwargs in ({"padding": "same"}, {"padding": "same", "dilation": 3, "groups": 2}, {"stride": 2, "padding": "scale_drop"}):
+                for cond_channels in (0, 3):
+                    gated = GatedConv1dEx(4, 6, 3, causal=causal, activation=activation, cond_channels=cond_channels, **kwargs)
+                    ipt = torch.randn(2, 4, 20)
+                    len_o = 20 // gated.stride[0]
+                    cond = torch.randn(2, 3, len_o) if cond_channels > 0 else None
+                    opt = gated(ipt, cond)
+                    assert (gated.out_channels, gated.gated_channels) == (12, 6) and opt.shape == (2, 6, len_o)
+                    assert allclose(opt, _unfused(gated, ipt, cond), atol=1e-6)
+                    assert allclose(gated(ipt[0], None if cond is None else cond[0]), opt[0], atol=1e-6)
+
+                    if causal:
+                        len_head = 8 // gated.stride[0]
+                        state = gated.init_state(2)
+                        opt0, state = gated.forward_stream(ipt[..., :8], state, None if cond is None else cond[..., :len_head])
+                        opt1, state = gated.forward_stream(ipt[..., 8:], state, None if cond is None else cond[..., len_head:])
+                        assert allclose(torch.cat([opt0, opt1], dim=-1), opt, atol=1e-6)
+
+
+def test_gated_conv1dex_grad():
+    """GatedConv1dEx should be differentiable as the unfused path."""
+
+    torch.manual_seed(0)
+    gated = GatedConv1dEx(3, 2, 3, causal=True, padding="same", cond_channels=2)
+    ipt, cond = torch.randn(1, 3, 10), torch.randn(1, 2, 10)
+    gated(ipt, cond).sum().backward()
+    grads = [gated.weight.grad.clone(), gated.cond_weight.grad.clone()]
+    gated.zero_grad()
+    _unfused(gated, ipt, cond).sum().backward()
+    assert allclose(grads[0], gated.weight.grad, atol=1e-6)
+    assert allclose(grads[1], gated.cond_weight.grad, atol=1e-6)
+
+
+def test_gated_conv1dex_stack():
+    """GatedConv1dEx should work in stack executors (streaming, silence-aware streaming, space-to-batch)."""
+
+    torch.manual_seed(0)
+    model = nn.Sequential(
+        GatedConv1dEx(1, 4, 3, causal=True, padding="same"),
+        GatedConv1dEx(4, 4, 3, causal=True, padding="same", dilation=4, activation="glu"),
+        Conv1dEx(4, 1, 3, causal=True, padding="same"),
+    )
+    ipt = torch.cat([torch.randn(1, 1, 16), torch.zeros(1, 1, 32), torch.ones(1, 1, 32)], dim=-1)
+    with no_grad():
+        opt = model(ipt)
+        states_normal, states_skip, opt_normal, opt_skip = init_states(model), init_states(model), [], []
+        for chunk in ipt.split(8, dim=-1):
+            o_normal, states_normal = forward_stream(model, chunk, states_normal)
+            o_skip, states_skip = forward_stream_skip(model, chunk, states_skip)
+            opt_normal.append(o_normal)
+            opt_skip.append(o_skip)
+        assert allclose(torch.cat(opt_normal, dim=-1), opt, atol=1e-6)
+        assert allclose(torch.cat(opt_skip, dim=-1), opt, atol=1e-6)
+        assert allclose(forward_space_to_batch(model, ipt, min_dilation=4), opt, atol=1e-6)
+
+    with pytest.raises(RuntimeError):
+        GatedConv1dEx(2, 2, 3, padding="same", cond_channels=2)(torch.randn(1, 2, 5))
+
+
+def test_gated_conv1dex_unsupported():
+    """Channel-wise transforms of linear convs should reject GatedConv1dEx."""
+
+    with pytest.raises(RuntimeError, match="branch type"):
+        merge_parallel([GatedConv1dEx(4, 4, 3, padding="same"), GatedConv1dEx(4, 4, 1, padding="same")])
+    with pytest.raises(RuntimeError, match="GatedConv1dEx"):
+        prune_channels(nn.Sequential(Conv1dEx(2, 8, 3, padding="same"), GatedConv1dEx(8, 4, 3, padding="same"), Conv1dEx(4, 2, 3, padding="same")), 0.5)
+
+
+def test_gated_conv1dex_conditioned_executors():
+    """Stack executors, which cannot pass `cond`, should reject conditioned GatedConv1dEx."""
+
+    model = nn.Sequential(GatedConv1dEx(2, 2, 3, causal=True, padding="same", dilation=4, cond_channels=2))
+    ipt = torch.randn(1, 2, 8)
+    with no_grad():
+        for run in (
+            lambda: forward_stream(model, ipt, init_states(model)),
+            lambda: forward_stream_skip(model, ipt, init_states(model)),
+            lambda: forward_space_to_batch(model, ipt, min_dilation=4),
+            lambda: forward_blocked(model[0], ipt, 2),
+        ):
+            with pytest.raises(RuntimeError, match="cannot pass `cond`"):
+                run()
+
+
+def test_gated_conv1dex_flops():
+    """conv_flops should count the 2C-channel conv of GatedConv1dEx."""
+
+    gated = GatedConv1dEx(3, 4, 3, padding="same")
+    assert conv_flops(gated, torch.randn(1, 3, 10)) == 2 * 10 * 8 * 3 * 3
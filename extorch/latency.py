@@ -0,0 +1,94 @@
+"""Algorithmic latency (lookahead) accounting of extorch modules and stacks."""
+
+from fractions import Fraction
+from math import lcm, ceil
+from typing import Any, Callable
+
+from torch import nn
+
+from .conv2d import Conv2dEx
+from .convt2d import ConvT2dEx
+from .stream import StreamingModule, stream_layers
+
+
+def _time_geometry(layer: StreamingModule) -> tuple[bool, int, int, int]:
+    """Time-axis geometry of a layer as (transposed, effective_kernel, stride, padding_left or padding^-1_left)."""
+    kernel_eff, padding = layer._effective_kernel(), layer._padding_total() # pylint: disable=protected-access
+    if isinstance(layer, (Conv2dEx, ConvT2dEx)):
+        return (layer.transposed, kernel_eff[1], layer.stride[1], padding[1][0])
+    return (layer.transposed, kernel_eff, layer.stride[0], padding[0])
+
+
+def _need(layer: StreamingModule) -> Callable[[int], int]:
+    """Index of the latest input sample needed by the output sample `j` of a layer."""
+    transposed, kernel_eff, stride, padding_l = _time_geometry(layer)
+    if transposed:
+        # Output j = i * s - crop_l + k, so inputs up to floor((j + crop_l) / s) contribute
+        return lambda j: (j + padding_l) // stride
+    # Output j convolves padded input [j * s, j * s + K_eff), i.e. input [j * s - pl, j * s - pl + K_eff)
+    return lambda j: j * stride - padding_l + kernel_eff - 1
+
+
+def latency_report(model: nn.Module) -> dict[str, Any]:
+    """Report algorithmic latency of a stack, for real-time deployment and streaming buffer sizing.
+
+    Output sample `m` of a layer corresponds to the model input sample `m * period` (`period` is input samples per output sample),
+    as length-preserving (same/scale) stacks are aligned. Lookahead is how many input samples beyond the corresponding one are needed.
+
+        model input   ●●●●●●●●●●●●●●●●
+                          ^   |__|
+        output m      ●   |  lookahead
+                      |___|
+                    m * period
+
+    It includes kernel right side (`padding_lr`), stride phase (a strided output waits for its whole stride) and ConvT1dEx trimming.
+    Values are exact in streaming (`stream.forward_stream`), where an output is yielded as soon as its latest input arrives.
+
+    Args:
+        model - Conv1dEx/ConvT1dEx/Conv2dEx/ConvT2dEx, or `nn.Sequential` stack of them and time-local layers (activation, Transpose, etc.)
+    Returns:
+        layers     - Per-layer rows of
+                         module          - Module class name
+                         period          - Cumulative model input samples per output sample
+                         lookahead       - Lookahead of the layer itself, in its input samples
+                         lookahead_total - Cumulative lookahead, in model input samples
+                         delay           - Cumulative lookahead in output samples of the layer, `ceil(lookahead_total / period)`
+                         state           - Maximum streaming buffer of the layer, in its input (Conv) / output (ConvT) samples
+        lookahead  - Algorithmic latency of the model, in model input samples
+        delay      - Algorithmic latency of the model, in model output samples
+        period     - Model input samples per model output sample
+        min_chunk  - Minimum input chunk size with which every chunk yields the same number of output samples in streaming
+    """
+    layers = [layer for layer in stream_layers(model) if isinstance(layer, StreamingModule)]
+    if len(layers) == 0:
+        raise RuntimeError("latency_report needs at least one Conv1dEx/ConvT1dEx/Conv2dEx/ConvT2dEx.")
+
+    # All composite `need` are periodic over the product of strides
+    window = 1
+    for layer in layers:
+        window *= _time_geometry(layer)[2]
+
+    rows, needs, period, min_chunk = [], [], Fraction(1), 1
+    for layer in layers:
+        transposed, kernel_eff, stride, padding_l = _time_geometry(layer)
+        need, rate = _need(layer), (Fraction(1, stride) if transposed else Fraction(stride))
+        needs.append(need)
+        period *= rate
+        min_chunk = lcm(min_chunk, period.numerator)
+
+        def need_total(m: int) -> int:
+            for need_layer in reversed(needs):
+                m = need_layer(m)
+            return m
+
+        lookahead_total = max(need_total(m) - m * period for m in range(window))
+        rows.append({
+            "module":          type(layer).__name__,
+            "period":          period,
+            "lookahead":       max(need(j) - j * rate for j in range(stride)),
+            "lookahead_total": lookahead_total,
+            "delay":           ceil(lookahead_total / period),
+            "state":           max(0, kernel_eff - stride) if transposed else max(kernel_eff - 1, padding_l),
+        })
+
+    return {"layers": rows, "lookahead": rows[-1]["lookahead_total"], "delay": rows[-1]["delay"], "period": period, "min_chunk": min_chunk}
@@ -0,0 +1,67 @@
+"""Test of algorithmic latency accounting"""
+
+from fractions import Fraction
+
+import torch
+from torch import nn, no_grad # pylint: disable=no-name-in-module
+
+from .conv1d import Conv1dEx
+from .convt1d import ConvT1dEx
+from .transpose import Transpose
+from .stream import init_states, forward_stream
+from .latency import latency_report
+
+
+def _emission(model: nn.Module, length: int) -> list[int]:
+    """The number of input samples received when each output sample is yielded, by sample-by-sample streaming."""
+    states, emission = init_states(model), []
+    with no_grad():
+        for idx, sample in enumerate(torch.randn(1, 1, length).split(1, dim=-1)):
+            o, states = forward_stream(model, sample, states)
+            emission += [idx + 1] * o.size(-1)
+    return emission
+
+
+def test_latency_report_layer():
+    """latency_report should account kernel right side and stride phase.
+
+    [normal k5s1] lookahead = kernel_r = 2
+    [causal k4s2] lookahead = stride - 1 = 1 (output needs its whole stride)
+    [causal ConvT k4s2] lookahead = 0
+    """
+    assert latency_report(Conv1dEx(1, 1, 5, padding="same"))["lookahead"] == 2
+    assert latency_report(Conv1dEx(1, 1, 4, causal=True, stride=2, padding="scale_drop"))["lookahead"] == 1
+    assert latency_report(ConvT1dEx(1, 1, 4, causal=True, stride=2, padding="scale_drop"))["lookahead"] == 0
+
+
+def test_latency_report_stack():
+    """latency_report should be exact in streaming, for causal encoder-decoder stacks."""
+
+    torch.manual_seed(0)
+    models = [
+        nn.Sequential(Conv1dEx(1, 2, 3, causal=True, padding="same"), nn.ReLU(), Conv1dEx(2, 1, 5, causal=True, padding="same", dilation=2)),
+        nn.Sequential(
+            Conv1dEx(1, 2, 4, causal=True, stride=2, padding="scale_drop"), Transpose(1, 2), Transpose(1, 2),
+            Conv1dEx(2, 2, 5, causal=True, stride=3, padding="scale_ceil"),
+            ConvT1dEx(2, 2, 6, causal=True, stride=3, padding="scale_drop"),
+            ConvT1dEx(2, 1, 4, causal=True, stride=2, padding="scale_drop"),
+        ),
+        nn.Sequential(Conv1dEx(1, 2, 3, causal=True, stride=2, padding="scale_drop"), ConvT1dEx(2, 1, 4, causal=True, stride=4, padding="scale_drop")),
+    ]
+    for model in models:
+        report = latency_report(model)
+        emission = _emission(model, 60)
+        # Output m is yielded when input `m * period + lookahead` arrives, at worst
+        lookahead = max(received - 1 - m * report["period"] for m, received in enumerate(emission))
+        assert lookahead == report["lookahead"]
+        assert report["delay"] == -(-report["lookahead"] // report["period"])
+
+    report = latency_report(models[1])
+    assert report["period"] == 1
+    assert report["min_chunk"] == 6
+    assert [row["period"] for row in report["layers"]] == [2, 6, 2, 1]
+    assert [row["state"] for row in report["layers"]] == [3, 4, 3, 2]
+
+    report = latency_report(models[2])
+    assert report["period"] == Fraction(1, 2)
+    assert report["min_chunk"] == 2
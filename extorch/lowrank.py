@@ -0,0 +1,161 @@
+"""Low-rank factorization of wide Conv1dEx/ConvT1dEx into `pointwise reduce -> small conv -> pointwise expand` chain."""
+
+from copy import deepcopy
+from typing import Any
+
+import torch
+from torch import Tensor, nn
+
+from .conv1d import Conv1dEx
+from .convt1d import ConvT1dEx
+from .antialias import AntiAliasConv1dEx
+from .winograd import WinogradConv1dEx
+from .timing import measure
+from .precision import accuracy_report
+from .prune import conv_flops
+
+
+# Convs whose `weight` is the whole linear map, so factorized core keeps the module type (padding, trimming, lowpass, etc.)
+_FACTORIZABLE = (Conv1dEx, ConvT1dEx, AntiAliasConv1dEx, WinogradConv1dEx)
+
+
+def _rank(singular: Tensor, budget: float) -> int:
+    """The minimum rank whose discarded energy `Σ_{j>=r} σ_j^2` is within the budget."""
+    discarded = singular.square().flip(0).cumsum(0).flip(0)
+    return max(1, int((discarded > budget).sum()))
+
+
+def _tucker2(weight: Tensor, rank: tuple[int, int] | None, tolerance: float | None) -> tuple[Tensor, Tensor, Tensor]:
+    """Tucker-2 (HOSVD) of a conv weight (C_out, C_in, K) as `W[o,i,k] ≈ Σ_ab U[o,a] G[a,b,k] V[i,b]`.
+
+    Returns:
+        - U (C_out, r_out), G (r_out, r_in, K), V (C_in, r_in)
+    """
+    c_out, c_in, kernel_size = weight.shape
+    u, s_out, _ = torch.linalg.svd(weight.reshape(c_out, c_in * kernel_size), full_matrices=False)
+    v, s_in, _ = torch.linalg.svd(weight.permute(1, 0, 2).reshape(c_in, c_out * kernel_size), full_matrices=False)
+    if rank is None:
+        # HOSVD error is bounded by the sum of discarded energies of both modes, so the budget is split into halves
+        budget = (tolerance ** 2) * weight.square().sum() / 2
+        rank = (_rank(s_in, budget), _rank(s_out, budget))
+    rank_in, rank_out = min(rank[0], c_in), min(rank[1], c_out)
+    u, v = u[:, :rank_out], v[:, :rank_in]
+    return u, torch.einsum("oik,oa,ib->abk", weight, u, v), v
+
+
+def factorize_conv(conv: Conv1dEx | ConvT1dEx, rank: int | tuple[int, int] | None = None, tolerance: float | None = None) -> nn.Sequential:
+    """Factorize a conv into `Conv1dEx_1x1(C_in, r_in) -> conv(r_in, r_out, K) -> Conv1dEx_1x1(r_out, C_out)` by Tucker-2 decomposition.
+
+    Pointwise convs commute with time-axis operations, so the core conv (a copy of the original with `r_in`/`r_out` channels)
+    keeps `_input_padding`, causal, stride, dilation and ConvT trimming, and the chain is exactly the conv of the approximated weight.
+    Cost per output sample drops from `C_out * C_in * K` to `C_in * r_in (* stride) + r_out * r_in * K + C_out * r_out`.
+
+        x (C_in) -> 1x1 reduce -> (r_in) -> conv K, stride, padding -> (r_out) -> 1x1 expand + bias -> y (C_out)
+
+    Args:
+        conv      - Conv1dEx/ConvT1dEx (incl. anti-alias/Winograd) with `groups=1`
+        rank      - Ranks (r_in, r_out), or a rank shared by both
+        tolerance - Relative Frobenius error budget of the weight, used when `rank` is None
+    Returns:
+                  - Factorized chain, streamable as `nn.Sequential` of Conv1dEx/ConvT1dEx
+    """
+    if type(conv) not in _FACTORIZABLE:
+        raise RuntimeError(f"Not-supported layer for factorization: {type(conv).__name__}")
+    if conv.groups != 1:
+        raise RuntimeError("factorize_conv support only `groups=1`.")
+    if (rank is None) == (tolerance is None):
+        raise RuntimeError("Either `rank` or `tolerance` should be specified.")
+    rank = (rank, rank) if isinstance(rank, int) else rank
+
+    transposed = isinstance(conv, ConvT1dEx)
+    weight = conv.weight.detach()
+    # ConvT weight (C_in, C_out, K) -> (C_out, C_in, K)
+    weight64 = (weight.permute(1, 0, 2) if transposed else weight).double()
+    u, g, v = _tucker2(weight64, rank, tolerance)
+    rank_in, rank_out = v.size(1), u.size(1)
+
+    kwargs = {"causal": conv.causal, "padding": "same", "device": weight.device, "dtype": weight.dtype}
+    reduce = Conv1dEx(conv.in_channels, rank_in, 1, bias=False, **kwargs)
+    expand = Conv1dEx(rank_out, conv.out_channels, 1, bias=conv.bias is not None, **kwargs)
+    core = deepcopy(conv)
+    core.in_channels, core.out_channels = rank_in, rank_out
+    core.bias = None
+    with torch.no_grad():
+        reduce.weight.copy_(v.T.unsqueeze(-1))
+        core.weight = nn.Parameter((g.permute(1, 0, 2) if transposed else g).to(weight.dtype).contiguous())
+        expand.weight.copy_(u.unsqueeze(-1))
+        if conv.bias is not None:
+            expand.bias.copy_(conv.bias)
+    return nn.Sequential(reduce, core, expand)
+
+
+def _flops_per_sample(conv: Conv1dEx | ConvT1dEx, rank_in: int | None = None, rank_out: int | None = None) -> float:
+    """MACs per input sample of a conv, or of its factorized chain with ranks."""
+    c_in, c_out, kernel_size, stride = conv.in_channels, conv.out_channels, conv.kernel_size[0], conv.stride[0]
+    transposed = isinstance(conv, ConvT1dEx)
+    # Output samples per input sample. Core (and the original) costs per input sample for ConvT, per output sample for Conv.
+    rate = stride if transposed else 1 / stride
+    core_rate = 1 if transposed else rate
+    if rank_in is None:
+        return c_in * c_out * kernel_size * core_rate
+    return c_in * rank_in + rank_in * rank_out * kernel_size * core_rate + c_out * rank_out * rate
+
+
+def factorize_model(model: nn.Module, tolerance: float = 0.1, min_channels: int = 256) -> tuple[nn.Module, list[dict[str, Any]]]:
+    """Factorize wide convs in a model, where the factorized chain within the error budget is cheaper.
+
+    Args:
+        model        - Model, not modified. A bare factorizable conv is replaced by the chain as a whole.
+        tolerance    - Relative Frobenius error budget of each conv weight
+        min_channels - Convs with `min(C_in, C_out) >= min_channels` are considered
+    Returns:
+                     - Factorized model
+                     - Per-conv rows of {name, module, channels (C_in, C_out), rank (r_in, r_out), error (relative weight error), flops_ratio, factorized}
+    """
+    factorized_model = deepcopy(model)
+    rows = []
+    for name, module in list(factorized_model.named_modules()):
+        if type(module) not in _FACTORIZABLE or module.groups != 1 or min(module.in_channels, module.out_channels) < min_channels:
+            continue
+        chain = factorize_conv(module, tolerance=tolerance)
+        rank_in, rank_out = chain[0].out_channels, chain[2].in_channels
+        flops_ratio = _flops_per_sample(module, rank_in, rank_out) / _flops_per_sample(module)
+        with torch.no_grad():
+            weight, weight_approx = module.weight.double(), factorized_weight(chain).double()
+            error = ((weight_approx - weight).norm() / weight.norm()).item()
+        rows.append({"name": name, "module": type(module).__name__, "channels": (module.in_channels, module.out_channels),
+            "rank": (rank_in, rank_out), "error": error, "flops_ratio": flops_ratio, "factorized": flops_ratio < 1.})
+        if flops_ratio < 1.:
+            if name == "":
+                return chain, rows
+            parent_name, _, child_name = name.rpartition(".")
+            setattr(factorized_model.get_submodule(parent_name), child_name, chain)
+    return factorized_model, rows
+
+
+def factorized_weight(chain: nn.Sequential) -> Tensor:
+    """Equivalent single-conv weight of a factorized chain, in the layout of its core."""
+    reduce, core, expand = chain
+    if isinstance(core, ConvT1dEx):
+        return torch.einsum("bi,bak,oa->iok", reduce.weight[..., 0], core.weight, expand.weight[..., 0])
+    return torch.einsum("bi,abk,oa->oik", reduce.weight[..., 0], core.weight, expand.weight[..., 0])
+
+
+def factorization_report(model: nn.Module, factorized: nn.Module, x: Tensor, n_repeat: int = 10) -> dict[str, Any]:
+    """Cost reduction and accuracy drop of a factorized model against the original, as `prune.pruning_report`.
+
+    Returns:
+        - {params, params_factorized, flops, flops_factorized, flop_reduction, latency [sec], latency_factorized [sec], speedup,
+           max_abs, mean_abs, rel, snr_db}
+    """
+    flops, flops_factorized = conv_flops(model, x), conv_flops(factorized, x)
+    with torch.inference_mode():
+        latency            = measure(lambda: model(x),      n_repeat=n_repeat)
+        latency_factorized = measure(lambda: factorized(x), n_repeat=n_repeat)
+        report = accuracy_report(factorized(x), model(x))
+    return {
+        "params": sum(p.numel() for p in model.parameters()), "params_factorized": sum(p.numel() for p in factorized.parameters()),
+        "flops": flops, "flops_factorized": flops_factorized, "flop_reduction": 1. - flops_factorized / flops,
+        "latency": latency, "latency_factorized": latency_factorized, "speedup": latency / latency_factorized,
+        **report,
+    }
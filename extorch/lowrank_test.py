@@ -0,0 +1,101 @@
+"""Test of low-rank factorization"""
+
+import pytest
+import torch
+from torch import nn, allclose, no_grad # pylint: disable=no-name-in-module
+
+from .conv1d import Conv1dEx
+from .convt1d import ConvT1dEx
+from .antialias import AntiAliasConv1dEx
+from .conftest import stream_chunked
+from .lowrank import factorize_conv, factorize_model, factorized_weight, factorization_report
+
+
+def _low_rank(conv: Conv1dEx | ConvT1dEx, rank: int) -> Conv1dEx | ConvT1dEx:
+    """Set a weight of Tucker rank (rank, rank)."""
+    dim_o, dim_i, kernel_size = conv.weight.shape
+    with no_grad():
+        conv.weight.copy_(torch.einsum("oa,abk,ib->oik", torch.randn(dim_o, rank), torch.randn(rank, rank, kernel_size), torch.randn(dim_i, rank)))
+    return conv
+
+
+def test_factorize_conv_exact():
+    """Factorized chain of a low-rank conv should yield output identical to the conv, including padding, stride, trimming and streaming."""
+
+    torch.manual_seed(0)
+    convs = [
+        Conv1dEx(12, 10, 7, causal=True,  padding="same"),
+        Conv1dEx(12, 10, 4,               padding="same", dilation=2),
+        Conv1dEx(12, 10, 5, causal=True,  stride=2, padding="scale_ceil"),
+        Conv1dEx(12, 10, 3,               padding=2, bias=False),
+        AntiAliasConv1dEx(12, 10, 4, causal=True, stride=2, padding="scale_drop"),
+        ConvT1dEx(12, 10, 8, causal=True, stride=4, padding="scale_drop"),
+        ConvT1dEx(12, 10, 5,              stride=2, padding="scale_ceil"),
+    ]
+    with no_grad():
+        for conv in convs:
+            conv = _low_rank(conv, 3)
+            chain = factorize_conv(conv, tolerance=1e-6)
+            assert (chain[0].out_channels, chain[2].in_channels) == (3, 3)
+            assert allclose(factorized_weight(chain), conv.weight, atol=1e-4)
+            ipt = torch.randn(2, 12, 23)
+            assert allclose(chain(ipt), conv(ipt), atol=1e-4)
+
+            if conv.causal:
+                opt = stream_chunked(chain, ipt, 8, flush=False)
+                ref, _ = conv.forward_stream(ipt, conv.init_state(2))
+                assert allclose(opt, ref, atol=1e-4)
+
+
+def test_factorize_conv_rank():
+    """Explicit rank should be applied, and error should shrink as rank grows."""
+
+    torch.manual_seed(0)
+    conv = Conv1dEx(16, 12, 5, causal=True, padding="same")
+    errors = []
+    for rank in (2, 6, (16, 12)):
+        chain = factorize_conv(conv, rank=rank)
+        rank = (rank, rank) if isinstance(rank, int) else rank
+        assert (chain[0].out_channels, chain[2].in_channels) == rank
+        with no_grad():
+            errors.append(((factorized_weight(chain) - conv.weight).norm() / conv.weight.norm()).item())
+    assert errors[0] > errors[1] > errors[2] and errors[2] < 1e-5
+
+    for kwargs in ({}, {"rank": 2, "tolerance": 0.1}):
+        with pytest.raises(RuntimeError):
+            factorize_conv(conv, **kwargs)
+    with pytest.raises(RuntimeError):
+        factorize_conv(Conv1dEx(4, 4, 3, padding="same", groups=2), rank=2)
+
+
+def test_factorize_model():
+    """factorize_model should replace only wide convs which become cheaper, within the error budget."""
+
+    torch.manual_seed(0)
+    model = nn.Sequential(
+        Conv1dEx(4, 32, 3, causal=True, padding="same"), nn.ReLU(),
+        _low_rank(Conv1dEx(32, 32, 7, causal=True, padding="same"), 4), nn.ReLU(),
+        _low_rank(ConvT1dEx(32, 32, 8, causal=True, stride=4, padding="scale_drop"), 4), nn.ReLU(),
+        Conv1dEx(32, 2, 3, causal=True, padding="same"),
+    )
+    factorized, rows = factorize_model(model, tolerance=1e-4, min_channels=32)
+    assert [row["name"] for row in rows] == ["2", "4"]
+    assert all(row["factorized"] and row["rank"] == (4, 4) and row["error"] < 1e-4 for row in rows)
+    assert isinstance(factorized[2], nn.Sequential) and isinstance(model[2], Conv1dEx)
+
+    report = factorization_report(model, factorized, torch.randn(1, 4, 64), n_repeat=1)
+    assert report["flop_reduction"] > 0.5
+    assert report["rel"] < 1e-4
+
+
+def test_factorize_model_root():
+    """factorize_model should replace a bare conv model with the chain."""
+
+    torch.manual_seed(0)
+    conv = _low_rank(Conv1dEx(32, 32, 7, causal=True, padding="same"), 4)
+    factorized, rows = factorize_model(conv, tolerance=1e-4, min_channels=32)
+    assert [row["name"] for row in rows] == [""] and rows[0]["factorized"]
+    assert isinstance(factorized, nn.Sequential) and isinstance(conv, Conv1dEx)
+    with no_grad():
+        ipt = torch.randn(1, 32, 40)
+        assert allclose(factorized(ipt), conv(ipt), atol=1e-4)
@@ -0,0 +1,109 @@
+"""Vectorized convolution kernel/stride handling, NumPy version of `padding` for batch of configs."""
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+
+# Integer codes of kernel shape and stride alignment
+SHAPES = ("delta", "causal", "inv_causal")
+ALIGNS = ("head", "center", "tail")
+# Kernel shape -> Axis position, delta=center / causal=tail / inv_causal=head
+_SHAPE_TO_AXIS = np.array([1, 2, 0])
+
+
+def encode(names: ArrayLike, codebook: tuple[str, ...]) -> NDArray[np.int64]:
+    """Convert names (e.g. "causal", "tail") into integer codes of the codebook (SHAPES | ALIGNS)."""
+    names = np.asarray(names)
+    codes = np.full(names.shape, -1, dtype=np.int64)
+    for code, name in enumerate(codebook):
+        codes[names == name] = code
+    if (codes < 0).any():
+        raise RuntimeError(f"Not-supported names: {set(names[codes < 0].tolist())}")
+    return codes
+
+
+def left_axis_right(length: ArrayLike, axis: ArrayLike) -> tuple[NDArray[np.int64], NDArray[np.int64]]:
+    """Vectorized `padding.left_axis_right`.
+
+    Args:
+        length - Target lengths
+        axis   - Axis position codes of ALIGNS (0: head, 1: center, 2: tail)
+    """
+    length, axis = np.asarray(length, dtype=np.int64), np.asarray(axis, dtype=np.int64)
+    if ((axis < 0) | (axis > 2)).any():
+        raise RuntimeError(f"Not-supported axis position codes: {np.unique(axis[(axis < 0) | (axis > 2)])}")
+    left = np.select([axis == 0, axis == 1], [np.zeros_like(length), (length - 1) // 2], length - 1)
+    return (left, (length - 1) - left)
+
+
+def kernel_lr(size: ArrayLike, shape: ArrayLike) -> tuple[NDArray[np.int64], NDArray[np.int64]]:
+    """Vectorized `padding.kernel_lr`, `shape` as codes of SHAPES (0: delta, 1: causal, 2: inv_causal)."""
+    shape = np.asarray(shape, dtype=np.int64)
+    if ((shape < 0) | (shape > 2)).any():
+        raise RuntimeError(f"Not-supported kernel shape codes: {np.unique(shape[(shape < 0) | (shape > 2)])}")
+    return left_axis_right(size, _SHAPE_TO_AXIS[shape])
+
+
+def stride_lr(size: ArrayLike, align: ArrayLike) -> tuple[NDArray[np.int64], NDArray[np.int64]]:
+    """Vectorized `padding.stride_lr`, `align` as codes of ALIGNS (0: head, 1: center, 2: tail)."""
+    return left_axis_right(size, align)
+
+
+def padding_lr(
+        kernel_size:  ArrayLike,
+        kernel_shape: ArrayLike,
+        stride_size:  ArrayLike,
+        stride_align: ArrayLike,
+        drop_last:    ArrayLike,
+    ) -> tuple[NDArray[np.int64], NDArray[np.int64]]:
+    """Vectorized `padding.padding_lr`, all arguments are broadcasted."""
+    kernel_l, kernel_r = kernel_lr(kernel_size, kernel_shape)
+    stride_l, stride_r = stride_lr(stride_size, stride_align)
+    padding_l = np.maximum(0, kernel_l - stride_l)
+    padding_r = np.where(np.asarray(drop_last, dtype=bool), np.maximum(0, kernel_r - stride_r), np.maximum(0, stride_l + kernel_r))
+    return (padding_l, padding_r)
+
+
+def stack_geometry(
+        kernel_size:  ArrayLike,
+        dilation:     ArrayLike,
+        stride_size:  ArrayLike,
+        kernel_shape: ArrayLike,
+        stride_align: ArrayLike,
+        drop_last:    ArrayLike,
+        length:       ArrayLike,
+    ) -> dict[str, NDArray[np.int64]]:
+    """Geometry of batched conv stacks in one call.
+
+    Arguments are broadcasted into (..., n_layer), where the last axis is the layer order in a stack.
+
+    Args:
+        kernel_size  - Kernel sizes (not dilated)
+        dilation     - Dilations
+        stride_size  - Strides
+        kernel_shape - Kernel shape codes of SHAPES
+        stride_align - Stride alignment codes of ALIGNS
+        drop_last    - Whether to drop the non-fulfilled last frame
+        length       - Input lengths of the stacks, (...)
+    Returns:
+        padding_l       - Left padding of each layer, (..., n_layer)
+        padding_r       - Right padding of each layer, (..., n_layer)
+        length          - Output length of each layer, (..., n_layer)
+        receptive_field - Cumulative receptive field (input samples per output sample) at each layer, (..., n_layer)
+    """
+    args = np.broadcast_arrays(*(np.asarray(arg, dtype=np.int64) for arg in (kernel_size, dilation, stride_size, kernel_shape, stride_align, drop_last)))
+    kernel_size, dilation, stride_size, kernel_shape, stride_align, drop_last = args
+    kernel_eff = 1 + (kernel_size - 1) * dilation
+    padding_l, padding_r = padding_lr(kernel_eff, kernel_shape, stride_size, stride_align, drop_last)
+
+    n_layer = kernel_eff.shape[-1]
+    len_i = np.broadcast_to(np.asarray(length, dtype=np.int64), kernel_eff.shape[:-1])
+    lengths, receptive_fields = np.empty_like(kernel_eff), np.empty_like(kernel_eff)
+    receptive_field, jump = np.ones_like(len_i), np.ones_like(len_i)
+    for idx in range(n_layer):
+        len_i = np.maximum(0, (len_i + padding_l[..., idx] + padding_r[..., idx] - kernel_eff[..., idx]) // stride_size[..., idx] + 1)
+        receptive_field = receptive_field + (kernel_eff[..., idx] - 1) * jump
+        jump = jump * stride_size[..., idx]
+        lengths[..., idx], receptive_fields[..., idx] = len_i, receptive_field
+
+    return {"padding_l": padding_l, "padding_r": padding_r, "length": lengths, "receptive_field": receptive_fields}
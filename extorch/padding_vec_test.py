@@ -0,0 +1,65 @@
+"""Test of vectorized paddings."""
+
+import itertools
+
+import numpy as np
+import pytest
+import torch
+
+from . import padding
+from .conv1d import Conv1dEx
+from .padding_vec import SHAPES, ALIGNS, encode, kernel_lr, stride_lr, padding_lr, stack_geometry
+
+
+def test_encode():
+    """`encode` should convert names into codes."""
+    assert encode(["causal", "delta", "inv_causal"], SHAPES).tolist() == [1, 0, 2]
+    assert encode([["tail"], ["head"]], ALIGNS).tolist() == [[2], [0]]
+    with pytest.raises(RuntimeError):
+        encode(["left"], ALIGNS)
+
+
+def test_kernel_stride_lr_match_scalar():
+    """Vectorized `kernel_lr`/`stride_lr` should match the scalar ones."""
+    sizes = np.arange(1, 20)
+    for code, shape in enumerate(SHAPES):
+        left, right = kernel_lr(sizes, code)
+        assert list(zip(left.tolist(), right.tolist())) == [padding.kernel_lr(int(size), shape) for size in sizes]
+    for code, align in enumerate(ALIGNS):
+        left, right = stride_lr(sizes, code)
+        assert list(zip(left.tolist(), right.tolist())) == [padding.stride_lr(int(size), align) for size in sizes]
+
+
+def test_padding_lr_match_scalar():
+    """Vectorized `padding_lr` should match the scalar one in all configs."""
+    configs = list(itertools.product(range(1, 12), range(3), range(1, 9), range(3), (False, True)))
+    kernel, shape, stride, align, drop_last = (np.array(arg) for arg in zip(*configs))
+
+    padding_l, padding_r = padding_lr(kernel, shape, stride, align, drop_last)
+
+    for (k, kshape, s, salign, drop), p_l, p_r in zip(configs, padding_l.tolist(), padding_r.tolist()):
+        assert (p_l, p_r) == padding.padding_lr(k, SHAPES[kshape], s, ALIGNS[salign], drop)
+
+
+def test_stack_geometry():
+    """`stack_geometry` should match the actual Conv1dEx stacks.
+
+    k3s1 -> k4s2 -> k5s3 stack, receptive field 3 -> 3+3*1=6 -> 6+4*2=14
+    """
+    #                  c0-causal / c1-normal
+    kernel   = np.array([[3, 4, 5], [3, 4, 5]])
+    stride   = np.array([[1, 2, 3], [1, 2, 3]])
+    shape    = encode([["causal"] * 3, ["delta"] * 3], SHAPES)
+    align    = encode([["tail"]   * 3, ["center"] * 3], ALIGNS)
+    geometry = stack_geometry(kernel, 1, stride, shape, align, False, 50)
+
+    assert geometry["receptive_field"].tolist() == [[3, 6, 14], [3, 6, 14]]
+    for idx, causal in enumerate((True, False)):
+        stack = torch.nn.Sequential(*[
+            Conv1dEx(1, 1, k, causal=causal, stride=s, padding="scale_ceil") for k, s in zip(kernel[idx].tolist(), stride[idx].tolist())
+        ])
+        x = torch.zeros(1, 1, 50)
+        for layer, length, p_l, p_r in zip(stack, geometry["length"][idx], geometry["padding_l"][idx], geometry["padding_r"][idx]):
+            x = layer(x)
+            assert x.size(-1) == length
+            assert layer._padding_total() == (p_l, p_r) # pylint: disable=protected-access
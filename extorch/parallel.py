@@ -0,0 +1,67 @@
+"""Time-block parallel execution of Conv1dEx."""
+
+from concurrent.futures import Executor, ThreadPoolExecutor
+
+import torch
+from torch import Tensor
+import torch.nn.functional as F
+
+from .conv1d import Conv1dEx
+from .gated import reject_conditioned
+
+
+def block_bounds(length: int, n_blocks: int) -> list[tuple[int, int]]:
+    """Split [0, length) into at most `n_blocks` contiguous non-empty [start, end) ranges with balanced size."""
+    edges = [length * n // n_blocks for n in range(n_blocks + 1)]
+    return [(start, end) for start, end in zip(edges[:-1], edges[1:]) if end > start]
+
+
+def forward_blocked(conv: Conv1dEx, x: Tensor, n_blocks: int, executor: Executor | None = None) -> Tensor:
+    """Forward Conv1dEx by time blocks with halo, which can run in parallel.
+
+    Output is split into `n_blocks` blocks, and each block convolves its input range with halo (overlap to neighbors).
+    Padding is applied only to the edge blocks, so padded input copy of full length is not materialized.
+
+        output      |  block0  |  block1  |  block2  |
+        input     |---block0---|
+                             |---block1---|
+                                        |---block2---|
+                             halo = K_eff - stride
+
+    Args:
+        conv     - Conv1dEx with `padding_mode='zeros'`
+        x        - Input, (..., C_in, L)
+        n_blocks - The number of time blocks
+        executor - Executor which run blocks, `ThreadPoolExecutor(n_blocks)` if None
+    Returns:
+                 - Output identical to `conv(x)`
+    """
+    if conv.padding_mode != "zeros":
+        raise RuntimeError("forward_blocked support only `padding_mode='zeros'`.")
+    reject_conditioned([conv], "forward_blocked")
+
+    padding_l, padding_r = conv._padding_total() # pylint: disable=protected-access
+    kernel_eff, stride = conv._effective_kernel(), conv.stride[0] # pylint: disable=protected-access
+    len_i = x.size(-1)
+    len_o = (len_i + padding_l + padding_r - kernel_eff) // stride + 1
+    if len_o <= 0:
+        raise RuntimeError(f"Padded input length {len_i + padding_l + padding_r} is shorter than the effective kernel size.")
+
+    def forward_block(bound: tuple[int, int]) -> Tensor:
+        # Input range [start, end) of output block [j_start, j_end), in non-padded coordinates
+        j_start, j_end = bound
+        start = j_start * stride - padding_l
+        end   = (j_end - 1) * stride + kernel_eff - padding_l
+        block = x[..., max(0, start) : min(len_i, end)]
+        if start < 0 or end > len_i:
+            block = F.pad(block, (max(0, -start), max(0, end - len_i)))
+        return conv._forward_valid(block) # pylint: disable=protected-access
+
+    bounds = block_bounds(len_o, n_blocks)
+    if executor is None:
+        with ThreadPoolExecutor(max_workers=len(bounds)) as pool:
+            blocks = list(pool.map(forward_block, bounds))
+    else:
+        blocks = list(executor.map(forward_block, bounds))
+
+    return torch.cat(blocks, dim=-1)
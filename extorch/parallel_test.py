@@ -0,0 +1,50 @@
+"""Test of time-block parallel execution"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import torch
+from torch import allclose, no_grad # pylint: disable=no-name-in-module
+
+from .conv1d import Conv1dEx
+from .antialias import AntiAliasConv1dEx
+from .parallel import block_bounds, forward_blocked
+
+
+def test_block_bounds():
+    """block_bounds should split range into balanced non-empty blocks."""
+    assert block_bounds(10, 3) == [(0, 3), (3, 6), (6, 10)]
+    assert block_bounds(2,  4) == [(0, 1), (1, 2)]
+
+
+def test_forward_blocked_equivalence():
+    """forward_blocked should yield output identical to the single-call forward."""
+
+    torch.manual_seed(0)
+    convs = [
+        Conv1dEx(3, 4, 3, causal=True,  padding="same"),
+        Conv1dEx(3, 4, 3, causal=True,  padding="same", dilation=4),
+        Conv1dEx(3, 4, 4,               padding="same"),
+        Conv1dEx(3, 4, 3,               padding=2),
+        Conv1dEx(3, 4, 5, causal=True,  stride=3, padding="scale_ceil"),
+        Conv1dEx(3, 4, 4,               stride=2, padding="scale_drop", groups=1),
+        Conv1dEx(3, 6, 3, causal=True,  stride=2, padding="scale_ceil", groups=3),
+        AntiAliasConv1dEx(3, 4, 4, causal=True, stride=2, padding="scale_drop"),
+    ]
+    with no_grad(), ThreadPoolExecutor(max_workers=3) as pool:
+        for conv in convs:
+            for length in (9, 10, 64):
+                ipt = torch.randn(2, 3, length)
+                for n_blocks in (1, 2, 3, 7):
+                    opt_gt = conv(ipt)
+                    opt = forward_blocked(conv, ipt, n_blocks, pool)
+                    assert opt.shape == opt_gt.shape
+                    assert allclose(opt, opt_gt, atol=1e-6), f"{conv}/L{length}/N{n_blocks}"
+
+
+def test_forward_blocked_default_executor():
+    """forward_blocked should run without explicit executor."""
+
+    with no_grad():
+        conv = Conv1dEx(1, 1, 3, causal=True, padding="same")
+        ipt = torch.randn(1, 1, 16)
+        assert allclose(forward_blocked(conv, ipt, 4), conv(ipt))
@@ -0,0 +1,192 @@
+"""Pipelined multi-threaded streaming execution of extorch stacks."""
+
+from queue import Queue
+from threading import Thread
+from typing import Iterable, Iterator
+
+import torch
+from torch import Tensor, nn
+
+from .stream import StreamingModule, stream_layers, init_states, forward_stream, flush_stream
+
+
+# End-of-stream marker in the stage queues
+_END = object()
+
+
+def _layer_cost(layer: nn.Module, rate: float) -> tuple[float, float]:
+    """Relative MACs per input sample of a layer, and its output sample rate."""
+    if not isinstance(layer, StreamingModule):
+        return (0., rate)
+    n_weight = float(layer.weight.numel())
+    stride = layer.stride[-1]
+    if layer.transposed:
+        return (n_weight * rate, rate * stride)
+    return (n_weight * rate / stride, rate / stride)
+
+
+def split_stages(model: nn.Module, n_stages: int) -> list[nn.Sequential]:
+    """Split a model into at most `n_stages` consecutive stages with balanced compute.
+
+    Cost of a layer is its weight size scaled by its output sample rate (stride/upsampling), i.e. MACs per input sample.
+    Time-local layers (activation, Transpose, etc.) are attached to the preceding stage.
+    """
+    layers, costs, rate = stream_layers(model), [], 1.
+    for layer in layers:
+        cost, rate = _layer_cost(layer, rate)
+        costs.append(cost)
+    total = sum(costs)
+
+    stages: list[list[nn.Module]] = [[]]
+    acc = 0.
+    for layer, cost in zip(layers, costs):
+        # Open a new stage when a costly layer starts beyond the current stage's share
+        if cost > 0. and stages[-1] and len(stages) < n_stages and acc + cost / 2 > total * len(stages) / n_stages:
+            stages.append([])
+        stages[-1].append(layer)
+        acc += cost
+    return [nn.Sequential(*stage) for stage in stages]
+
+
+class StreamPipeline:
+    """Streaming executor which runs consecutive stages of a stack on separate threads, connected by bounded queues.
+
+    Each stage holds its own streaming states, so successive chunks are processed by different stages concurrently.
+    Per-chunk latency is not reduced, but throughput scales up to the slowest stage.
+
+        put(chunk) -> [stage0] -queue-> [stage1] -queue-> ... -> [stageN] -> get()
+
+    Note: grad mode and autocast are thread-local, so stages always run in inference mode without autocast.
+
+    Usage:
+        with StreamPipeline(model, n_stages=2) as pipe:
+            for chunk in chunks:
+                pipe.put(chunk)
+                ...
+                o = pipe.get()
+            tail = pipe.close()
+    """
+    def __init__(self, model: nn.Module, n_stages: int, batch_size: int = 1, queue_size: int = 2):
+        """
+        Args:
+            model      - Conv1dEx/ConvT1dEx/Conv2dEx/ConvT2dEx, or `nn.Sequential` stack of them and time-local layers
+            n_stages   - The number of pipeline stages (threads), at most the number of streaming layers
+            batch_size - Batch size of streaming states
+            queue_size - Capacity of the queue in front of each stage
+        """
+        self.stages = split_stages(model, n_stages)
+        self._queues: list[Queue] = [Queue(maxsize=queue_size) for _ in self.stages]
+        # Output queue is unbounded so that the last stage never blocks the producer
+        self._queues.append(Queue())
+        self._threads = [
+            Thread(target=self._run_stage, args=(stage, init_states(stage, batch_size), q_in, q_out), daemon=True)
+            for stage, q_in, q_out in zip(self.stages, self._queues[:-1], self._queues[1:])
+        ]
+        self._n_pending, self._closed = 0, False
+        for thread in self._threads:
+            thread.start()
+
+    @staticmethod
+    def _run_stage(stage: nn.Sequential, states: list[Tensor], q_in: Queue, q_out: Queue) -> None:
+        """Stage loop. Errors are passed downstream, and then the input is drained so that upstream never blocks."""
+        error = None
+        with torch.inference_mode():
+            while True:
+                item = q_in.get()
+                if item is _END:
+                    if error is None:
+                        try:
+                            # Flush tail is passed as a normal chunk, which is equivalent to the whole-stack flush
+                            tail = flush_stream(stage, states)
+                            if tail is not None:
+                                q_out.put(tail)
+                        except Exception as err: # pylint: disable=broad-exception-caught
+                            q_out.put(err)
+                    q_out.put(_END)
+                    return
+                if error is not None:
+                    continue
+                if isinstance(item, Exception):
+                    error = item
+                    q_out.put(item)
+                    continue
+                try:
+                    o, states = forward_stream(stage, item, states)
+                    q_out.put(o)
+                except Exception as err: # pylint: disable=broad-exception-caught
+                    error = err
+                    q_out.put(err)
+
+    @property
+    def n_pending(self) -> int:
+        """Number of input chunks which are fed but whose outputs are not yet got."""
+        return self._n_pending
+
+    def put(self, x: Tensor) -> None:
+        """Feed an input chunk, blocks while the first stage queue is full."""
+        if self._closed:
+            raise RuntimeError("StreamPipeline is already closed.")
+        self._queues[0].put(x)
+        self._n_pending += 1
+
+    def get(self) -> Tensor:
+        """Output chunk of the oldest pending input chunk, blocks until it is ready."""
+        if self._n_pending == 0:
+            raise RuntimeError("No pending chunk in StreamPipeline.")
+        item = self._queues[-1].get()
+        self._n_pending -= 1
+        if isinstance(item, Exception):
+            raise item
+        return item
+
+    def close(self) -> Tensor | None:
+        """End the stream, and return the rest of outputs (pending chunks + flushed tail).
+
+        Returns:
+            - Concatenated rest of outputs, None if nothing is left
+        """
+        if self._closed:
+            return None
+        self._closed = True
+        self._queues[0].put(_END)
+        outputs, error = [], None
+        while (item := self._queues[-1].get()) is not _END:
+            if isinstance(item, Exception):
+                error = error or item
+            else:
+                outputs.append(item)
+        for thread in self._threads:
+            thread.join()
+        self._n_pending = 0
+        if error is not None:
+            raise error
+        return torch.cat(outputs, dim=-1) if outputs else None
+
+    def __enter__(self) -> "StreamPipeline":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        # Stop threads, without masking the exception in the `with` block
+        try:
+            self.close()
+        except Exception: # pylint: disable=broad-exception-caught
+            if exc_type is None:
+                raise
+
+
+def forward_stream_pipelined(model: nn.Module, chunks: Iterable[Tensor], n_stages: int, batch_size: int = 1, queue_size: int = 2) -> Iterator[Tensor]:
+    """Stream chunks through a model with `StreamPipeline`, yielding output chunks in order (flushed tail at last).
+
+    Input is fed ahead up to the queue capacity, so the stages run concurrently.
+    """
+    with StreamPipeline(model, n_stages, batch_size, queue_size) as pipe:
+        for chunk in chunks:
+            pipe.put(chunk)
+            # Get (blocking) the oldest outputs once more chunks are in flight than the queues and stages hold
+            while pipe.n_pending > n_stages * (queue_size + 1):
+                yield pipe.get()
+        while pipe.n_pending > 0:
+            yield pipe.get()
+        tail = pipe.close()
+        if tail is not None:
+            yield tail
@@ -0,0 +1,67 @@
+"""Test of pipelined streaming execution"""
+
+import pytest
+import torch
+from torch import allclose, no_grad # pylint: disable=no-name-in-module
+
+from .conv1d import Conv1dEx
+from .convt1d import ConvT1dEx
+from .pipeline import split_stages, StreamPipeline, forward_stream_pipelined
+from .conftest import causal_stack
+
+
+def test_split_stages():
+    """split_stages should split a stack into consecutive stages, keeping time-local layers with the preceding layer."""
+
+    model = causal_stack(3, 2)
+    for n_stages in (1, 2, 3, 5, 10):
+        stages = split_stages(model, n_stages)
+        assert 1 <= len(stages) <= min(n_stages, 4)
+        assert [layer for stage in stages for layer in stage] == [*model[:5], *model[5], model[6]]
+        assert all(isinstance(stage[0], (Conv1dEx, ConvT1dEx)) for stage in stages)
+
+
+def test_forward_stream_pipelined():
+    """Pipelined streaming should yield output identical to the full-length forward."""
+
+    torch.manual_seed(0)
+    model = causal_stack(3, 2)
+    ipt = torch.randn(2, 3, 50)
+    with no_grad():
+        opt_gt = model(ipt)
+    for n_stages in (1, 2, 4):
+        for size in (1, 7, 16):
+            opts = list(forward_stream_pipelined(model, ipt.split(size, dim=-1), n_stages, batch_size=2, queue_size=1))
+            assert allclose(torch.cat(opts, dim=-1), opt_gt, atol=1e-5)
+
+
+def test_stream_pipeline_put_get():
+    """StreamPipeline should return chunk outputs in order, and rest at close."""
+
+    torch.manual_seed(0)
+    model = causal_stack(3, 2)
+    ipt = torch.randn(1, 3, 24)
+    with no_grad():
+        opt_gt = model(ipt)
+    with StreamPipeline(model, n_stages=3) as pipe:
+        pipe.put(ipt[..., :8])
+        assert pipe.n_pending == 1
+        opt0 = pipe.get()
+        assert pipe.n_pending == 0
+        pipe.put(ipt[..., 8:16])
+        pipe.put(ipt[..., 16:])
+        assert pipe.n_pending == 2
+        tail = pipe.close()
+    assert opt0.size(-1) == 8
+    assert allclose(torch.cat([opt0, tail], dim=-1), opt_gt, atol=1e-5)
+
+
+def test_stream_pipeline_error():
+    """Errors in a stage should be raised in the caller without deadlock."""
+
+    model = causal_stack(3, 2)
+    with pytest.raises(RuntimeError):
+        with StreamPipeline(model, n_stages=2, queue_size=1) as pipe:
+            for _ in range(5):
+                pipe.put(torch.randn(1, 5, 8)) # Wrong channels
+            pipe.close()
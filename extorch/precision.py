@@ -0,0 +1,39 @@
+"""Reduced-precision (bfloat16/float16) support."""
+
+import torch
+from torch import Tensor
+
+
+REDUCED_DTYPES = (torch.bfloat16, torch.float16)
+
+
+def accumulation_dtype(dtype: torch.dtype) -> torch.dtype:
+    """Dtype for accumulation, float32 for reduced-precision dtypes."""
+    return torch.float32 if dtype in REDUCED_DTYPES else dtype
+
+
+def compute_dtype(weight: Tensor) -> torch.dtype:
+    """Dtype of convolution computation, autocast dtype if autocast is enabled else weight dtype (c.f. `F.conv1d` under autocast)."""
+    if torch.is_autocast_enabled(weight.device.type):
+        return torch.get_autocast_dtype(weight.device.type)
+    return weight.dtype
+
+
+def accuracy_report(output: Tensor, reference: Tensor) -> dict[str, float]:
+    """Accuracy of reduced-precision output against full-precision reference.
+
+    Returns:
+        max_abs  - Max absolute error
+        mean_abs - Mean absolute error
+        rel      - Relative L2 error, ||o - ref|| / ||ref||
+        snr_db   - Signal-to-noise ratio [dB]
+    """
+    output, reference = output.double(), reference.double()
+    error = output - reference
+    rel = (error.norm() / reference.norm().clamp_min(1e-30)).item()
+    return {
+        "max_abs":  error.abs().max().item(),
+        "mean_abs": error.abs().mean().item(),
+        "rel":      rel,
+        "snr_db":   float("inf") if rel == 0. else -20. * torch.log10(torch.tensor(rel)).item(),
+    }
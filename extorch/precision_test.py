@@ -0,0 +1,56 @@
+"""Test of reduced-precision support"""
+
+import torch
+from torch import nn, no_grad # pylint: disable=no-name-in-module
+
+from .precision import accumulation_dtype, accuracy_report
+from .stream import init_states, forward_stream
+from .conftest import module_stack, stream_chunked
+
+
+def test_accumulation_dtype():
+    """Reduced precision should be accumulated in fp32."""
+    assert accumulation_dtype(torch.bfloat16) == torch.float32
+    assert accumulation_dtype(torch.float16)  == torch.float32
+    assert accumulation_dtype(torch.float64)  == torch.float64
+
+
+def test_autocast_bf16():
+    """All modules should run in bf16 under CPU autocast, with fp32-level accuracy bound."""
+
+    torch.manual_seed(0)
+    model, ipt = module_stack(layer_norm=False), torch.randn(2, 4, 64)
+    with no_grad():
+        opt_ref = model(ipt)
+        with torch.autocast("cpu", dtype=torch.bfloat16):
+            x = ipt
+            for layer in model:
+                x = layer(x)
+                if not isinstance(layer, nn.Tanh):
+                    assert x.dtype == torch.bfloat16, f"{type(layer).__name__}"
+
+    assert accuracy_report(x, opt_ref)["rel"] < 3e-2
+
+
+def test_bf16_stream():
+    """bf16 streaming should match bf16 full-length forward, with fp32 ConvT overlap-add state."""
+
+    torch.manual_seed(0)
+    model, ipt = module_stack(layer_norm=False).to(torch.bfloat16), torch.randn(2, 4, 64, dtype=torch.bfloat16)
+    with no_grad():
+        opt_gt = model(ipt)
+        opt = stream_chunked(model, ipt, 16)
+        # ConvT1dEx state, next to the last Conv1dEx one
+        _, states = forward_stream(model, ipt[..., :16], init_states(model, 2))
+
+    assert states[-2].dtype == torch.float32
+    assert opt.dtype == torch.bfloat16 and opt.shape == opt_gt.shape
+    assert accuracy_report(opt, opt_gt)["rel"] < 1e-2
+
+
+def test_accuracy_report():
+    """accuracy_report should yield error metrics."""
+    report = accuracy_report(torch.tensor([1., 2.]), torch.tensor([1., 2.]))
+    assert report["max_abs"] == 0. and report["snr_db"] == float("inf")
+    report = accuracy_report(torch.tensor([1.1, 2.]), torch.tensor([1., 2.]))
+    assert abs(report["max_abs"] - 0.1) < 1e-6
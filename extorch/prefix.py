@@ -0,0 +1,128 @@
+"""Prefix cache of streaming states, for requests which share an input prefix (e.g. prompt/reference audio)."""
+
+from collections import OrderedDict
+import hashlib
+import threading
+import weakref
+
+import torch
+from torch import Tensor, nn
+
+from .stream import init_states, forward_stream
+
+
+# Model fingerprints, recomputed when a parameter/buffer is replaced or modified in place
+_FINGERPRINTS: "weakref.WeakKeyDictionary[nn.Module, tuple[tuple[tuple[int, int], ...], str]]" = weakref.WeakKeyDictionary()
+
+
+def _tensor_digest(hasher: "hashlib._Hash", tensor: Tensor) -> None:
+    """Feed dtype, shape and content of a tensor into a hash."""
+    hasher.update(f"{tensor.dtype}{tuple(tensor.shape)}".encode())
+    tensor = tensor.detach().cpu().contiguous()
+    if tensor.numel() > 0:
+        hasher.update(tensor.flatten().view(torch.uint8).numpy().tobytes())
+
+
+def model_fingerprint(model: nn.Module) -> str:
+    """Content hash of a model, its structure/configs (`repr`) and all parameters/buffers.
+
+    It is cached per model object, and recomputed when any parameter/buffer is replaced or modified in place.
+    """
+    tensors = list(model.state_dict(keep_vars=True).values())
+    versions = tuple((tensor.data_ptr(), tensor._version) for tensor in tensors) # pylint: disable=protected-access
+    cached = _FINGERPRINTS.get(model)
+    if cached is not None and cached[0] == versions:
+        return cached[1]
+    hasher = hashlib.sha256(repr(model).encode())
+    for tensor in tensors:
+        _tensor_digest(hasher, tensor)
+    digest = hasher.hexdigest()
+    _FINGERPRINTS[model] = (versions, digest)
+    return digest
+
+
+def prefix_key(model: nn.Module, prefix: Tensor) -> str:
+    """Cache key of a (model, prefix) pair, content hash of both."""
+    hasher = hashlib.sha256(model_fingerprint(model).encode())
+    _tensor_digest(hasher, prefix)
+    return hasher.hexdigest()
+
+
+class PrefixCache:
+    """LRU cache of streaming states after input prefixes, under a memory budget.
+
+    Causal streaming states after a prefix depend only on the model and the prefix, so requests sharing the prefix resume from the cached states
+    instead of re-running the prefix.
+
+        request0   [prefix A|content0]  -> miss, stream prefix A, cache states
+        request1   [prefix A|content1]  -> hit,  resume from cached states, stream only content1
+
+    Cached states are shared with callers as is. Streaming (`stream.forward_stream`) returns new states without modifying given ones,
+    so they should not be modified in place. Thread-safe.
+    """
+    def __init__(self, max_bytes: int):
+        """
+        Args:
+            max_bytes - Memory budget of all cached states [bytes]
+        """
+        if max_bytes < 0:
+            raise RuntimeError(f"`max_bytes` should be non-negative, but got {max_bytes}.")
+        self.max_bytes = max_bytes
+        self.nbytes, self.hits, self.misses, self.evictions = 0, 0, 0, 0
+        self._entries: OrderedDict[str, tuple[list[Tensor], int]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, model: nn.Module, prefix: Tensor) -> list[Tensor] | None:
+        """Cached states after the prefix, None if not cached."""
+        key = prefix_key(model, prefix)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, model: nn.Module, prefix: Tensor, states: list[Tensor]) -> None:
+        """Cache states after the prefix, evicting least recently used entries to keep the budget. States over the budget are not cached."""
+        key = prefix_key(model, prefix)
+        nbytes = sum(state.numel() * state.element_size() for state in states)
+        with self._lock:
+            if key in self._entries:
+                self.nbytes -= self._entries.pop(key)[1]
+            if nbytes > self.max_bytes:
+                return
+            while self.nbytes + nbytes > self.max_bytes:
+                self.nbytes -= self._entries.popitem(last=False)[1][1]
+                self.evictions += 1
+            # Compact copy, as a state can be a view of the whole prefix buffer
+            self._entries[key] = ([state.detach().clone() for state in states], nbytes)
+            self.nbytes += nbytes
+
+    def prefill(self, model: nn.Module, prefix: Tensor) -> list[Tensor]:
+        """Streaming states after the prefix, from cache or by streaming the prefix from the initial states (then cached).
+
+        Output over the prefix is discarded, and the following streaming yields output from the end of the prefix.
+
+        Args:
+            model  - Streamable model (c.f. `stream.forward_stream`)
+            prefix - Input prefix, (B, C_in, L_prefix)
+        Returns:
+                   - Streaming states to resume `stream.forward_stream` with the following input
+        """
+        states = self.get(model, prefix)
+        if states is None:
+            with torch.no_grad():
+                _, states = forward_stream(model, prefix, init_states(model, prefix.size(0)))
+            self.put(model, prefix, states)
+        return states
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+            self.nbytes = 0
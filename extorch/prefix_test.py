@@ -0,0 +1,70 @@
+"""Test of prefix cache"""
+
+import pytest
+import torch
+from torch import equal, no_grad # pylint: disable=no-name-in-module
+
+from .stream import init_states, forward_stream
+from .prefix import model_fingerprint, PrefixCache
+from .conftest import causal_stack
+
+
+def test_prefix_cache_resume():
+    """Streaming resumed from cached states should be identical to streaming the whole input."""
+
+    torch.manual_seed(0)
+    model = causal_stack()
+    cache = PrefixCache(max_bytes=1 << 20)
+    prefix = torch.randn(1, 1, 24)
+    with no_grad():
+        for _ in range(2):
+            content = torch.randn(1, 1, 16)
+            states_ref = forward_stream(model, prefix, init_states(model))[1]
+            opt_ref, _ = forward_stream(model, content, states_ref)
+            opt, _ = forward_stream(model, content, cache.prefill(model, prefix))
+            assert equal(opt, opt_ref)
+    assert (cache.hits, cache.misses, len(cache)) == (1, 1, 1)
+
+
+def test_prefix_cache_key():
+    """Entries should be keyed by the content of both prefix and model."""
+
+    torch.manual_seed(0)
+    model, model_other = causal_stack(), causal_stack()
+    cache = PrefixCache(max_bytes=1 << 20)
+    prefix = torch.randn(1, 1, 24)
+    cache.prefill(model, prefix)
+    assert cache.get(model, prefix.clone()) is not None
+    assert cache.get(model, prefix + 1.) is None
+    assert cache.get(model_other, prefix) is None
+
+    # In-place weight update invalidates the model fingerprint
+    fingerprint = model_fingerprint(model)
+    with no_grad():
+        model[0].weight.add_(1.)
+    assert model_fingerprint(model) != fingerprint
+    assert cache.get(model, prefix) is None
+
+
+def test_prefix_cache_lru():
+    """Least recently used entries should be evicted to keep the memory budget."""
+
+    torch.manual_seed(0)
+    model = causal_stack()
+    prefixes = [torch.randn(1, 1, 24) for _ in range(3)]
+    nbytes = sum(state.numel() * state.element_size() for state in PrefixCache(1 << 20).prefill(model, prefixes[0]))
+    cache = PrefixCache(max_bytes=2 * nbytes)
+    cache.prefill(model, prefixes[0])
+    cache.prefill(model, prefixes[1])
+    cache.prefill(model, prefixes[0])
+    cache.prefill(model, prefixes[2])
+    assert cache.nbytes == 2 * nbytes and cache.evictions == 1
+    assert cache.get(model, prefixes[0]) is not None
+    assert cache.get(model, prefixes[1]) is None
+
+    # Entry over the budget is not cached
+    cache_small = PrefixCache(max_bytes=nbytes - 1)
+    cache_small.prefill(model, prefixes[0])
+    assert len(cache_small) == 0
+    with pytest.raises(RuntimeError):
+        PrefixCache(max_bytes=-1)
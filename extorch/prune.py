@@ -0,0 +1,170 @@
+"""Structured channel pruning of extorch conv stacks."""
+
+from copy import deepcopy
+from typing import Any, Callable, Sequence
+
+import torch
+from torch import Tensor, nn
+
+from .conv1d import Conv1dEx
+from .convt1d import ConvT1dEx
+from .gated import GatedConv1dEx
+from .channel import is_channel_independent
+from .stream import stream_layers
+from .precision import accuracy_report
+from .timing import measure
+
+
+def channel_importance(conv: Conv1dEx | ConvT1dEx) -> Tensor:
+    """L1 norm of each output channel's kernel, (C_out,)."""
+    weight = conv.weight.detach().abs()
+    # Conv1dEx :: (C_out, C_in, K), ConvT1dEx :: (C_in, C_out, K)
+    return weight.sum(dim=(0, 2)) if isinstance(conv, ConvT1dEx) else weight.sum(dim=(1, 2))
+
+
+def _is_channelwise(layer: nn.Module) -> bool:
+    """Whether the layer is channel-wise (each channel independent), e.g. depthwise conv."""
+    return isinstance(layer, Conv1dEx) and layer.groups == layer.in_channels == layer.out_channels
+
+
+def _is_dense(layer: nn.Module) -> bool:
+    """Whether the layer is a channel-mixing conv which can be pruned."""
+    return isinstance(layer, (Conv1dEx, ConvT1dEx)) and not _is_channelwise(layer)
+
+
+def _prune_out(conv: Conv1dEx | ConvT1dEx, idx: Tensor) -> None:
+    """Keep only output channels `idx` of the conv, in place."""
+    if conv.groups != 1:
+        raise RuntimeError(f"Channel pruning support only `groups=1` or depthwise conv, but got `groups={conv.groups}`.")
+    conv.weight = nn.Parameter(conv.weight.detach()[:, idx] if isinstance(conv, ConvT1dEx) else conv.weight.detach()[idx])
+    if conv.bias is not None:
+        conv.bias = nn.Parameter(conv.bias.detach()[idx])
+    conv.out_channels = len(idx)
+
+
+def _prune_in(conv: Conv1dEx | ConvT1dEx, idx: Tensor) -> None:
+    """Keep only input channels `idx` of the conv, in place."""
+    if conv.groups != 1:
+        raise RuntimeError(f"Channel pruning support only `groups=1` or depthwise conv, but got `groups={conv.groups}`.")
+    conv.weight = nn.Parameter(conv.weight.detach()[idx] if isinstance(conv, ConvT1dEx) else conv.weight.detach()[:, idx])
+    conv.in_channels = len(idx)
+
+
+def _prune_channelwise(layer: nn.Module, idx: Tensor) -> None:
+    """Keep only channels `idx` of the channel-wise layer (depthwise conv / BatchNorm1d / channel LayerNorm), in place."""
+    if _is_channelwise(layer):
+        layer.weight = nn.Parameter(layer.weight.detach()[idx])
+        if layer.bias is not None:
+            layer.bias = nn.Parameter(layer.bias.detach()[idx])
+        layer.in_channels = layer.out_channels = layer.groups = len(idx)
+    elif isinstance(layer, nn.BatchNorm1d):
+        if layer.affine:
+            layer.weight, layer.bias = nn.Parameter(layer.weight.detach()[idx]), nn.Parameter(layer.bias.detach()[idx])
+        if layer.track_running_stats:
+            layer.running_mean, layer.running_var = layer.running_mean[idx], layer.running_var[idx]
+        layer.num_features = len(idx)
+    elif isinstance(layer, nn.LayerNorm):
+        if len(layer.normalized_shape) != 1:
+            raise RuntimeError("Channel pruning support only LayerNorm over channel axis, e.g. `Transpose -> LayerNorm(C) -> Transpose`.")
+        if layer.elementwise_affine:
+            layer.weight = nn.Parameter(layer.weight.detach()[idx])
+            if layer.bias is not None:
+                layer.bias = nn.Parameter(layer.bias.detach()[idx])
+        layer.normalized_shape = (len(idx),)
+    else:
+        raise RuntimeError(f"Not-supported layer between pruned convs: {type(layer).__name__}, "
+            "which should be channel-wise or parameter-free element-wise (e.g. activation, Transpose).")
+
+
+def prune_channels(
+        model:      nn.Module,
+        ratio:      float | Sequence[float],
+        importance: Callable[[Conv1dEx | ConvT1dEx], Tensor] = channel_importance,
+    ) -> nn.Module:
+    """Physically remove the least important output channels of conv layers, and the matched input channels of the next conv.
+
+    Model is flattened into layers as `stream.stream_layers`. Output channels of each channel-mixing Conv1dEx/ConvT1dEx
+    (except the last one, which determines the model output) are pruned, and the following layers are pruned accordingly:
+
+        Conv1dEx(C_out=8) -> Transpose -> LayerNorm(8) -> Transpose -> GELU -> DepthwiseConv1dEx(8) -> Conv1dEx(C_in=8)
+           out [0..7]                       [0..7]                               [0..7]               in [0..7]
+           out [1,4,6]                      [1,4,6]                              [1,4,6]              in [1,4,6]
+
+    Layers between convs should be parameter-free element-wise (activation, Transpose, etc.) or channel-wise (depthwise conv, BatchNorm1d, channel LayerNorm).
+    Modules are sliced in place of a copy, so `_input_padding`, `causal` and other configs are kept as is.
+
+    Args:
+        model      - Conv1dEx/ConvT1dEx stack as `nn.Sequential`, not modified
+        ratio      - Ratio of output channels to be removed, shared by layers or per prunable conv
+        importance - Channel importance score, conv -> (C_out,)
+    Returns:
+                   - Pruned model
+    """
+    pruned = deepcopy(model)
+    layers = stream_layers(pruned)
+    if any(isinstance(layer, GatedConv1dEx) for layer in layers):
+        raise RuntimeError("prune_channels does not support GatedConv1dEx, whose output channel is a nonlinear gate of two conv channels.")
+    idx_dense = [idx for idx, layer in enumerate(layers) if _is_dense(layer)]
+    idx_prunable = idx_dense[:-1]
+    ratios = [ratio] * len(idx_prunable) if isinstance(ratio, (int, float)) else list(ratio)
+    if len(ratios) != len(idx_prunable):
+        raise RuntimeError(f"`ratio` should be given for each of {len(idx_prunable)} prunable convs, but got {len(ratios)}.")
+
+    with torch.no_grad():
+        for idx_layer, idx_next, r in zip(idx_prunable, idx_dense[1:], ratios):
+            if not 0. <= r < 1.:
+                raise RuntimeError(f"Pruning ratio should be in [0, 1), but got {r}.")
+            conv = layers[idx_layer]
+            n_keep = max(1, round(conv.out_channels * (1. - r)))
+            keep = torch.topk(importance(conv), n_keep).indices.sort().values
+            _prune_out(conv, keep)
+            for layer in layers[idx_layer + 1 : idx_next]:
+                if not is_channel_independent(layer):
+                    _prune_channelwise(layer, keep)
+            _prune_in(layers[idx_next], keep)
+
+    return pruned
+
+
+def conv_flops(model: nn.Module, x: Tensor) -> int:
+    """FLOPs (2 * MACs) of all convolutions in a model for the input."""
+    flops = []
+
+    def hook(module: nn.Module, inputs: tuple[Tensor, ...], output: Tensor) -> None:
+        kernel = 1
+        for size in module.kernel_size:
+            kernel *= size
+        if module.transposed:
+            flops.append(2 * inputs[0].numel() * (module.out_channels // module.groups) * kernel)
+        else:
+            # Per output position, as module output channels can differ from conv ones (e.g. gated activation)
+            n_position = output.numel() // output.size(-1 - len(module.kernel_size))
+            flops.append(2 * n_position * module.out_channels * (module.in_channels // module.groups) * kernel)
+
+    handles = [module.register_forward_hook(hook) for module in model.modules() if isinstance(module, nn.modules.conv._ConvNd)] # pylint: disable=protected-access
+    try:
+        with torch.inference_mode():
+            model(x)
+    finally:
+        for handle in handles:
+            handle.remove()
+    return sum(flops)
+
+
+def pruning_report(model: nn.Module, pruned: nn.Module, x: Tensor, n_repeat: int = 10) -> dict[str, Any]:
+    """Cost reduction and accuracy drop of a pruned model against the original.
+
+    Returns:
+        - {params, params_pruned, flops, flops_pruned, flop_reduction, latency [sec], latency_pruned [sec], speedup, max_abs, mean_abs, rel, snr_db}
+    """
+    flops, flops_pruned = conv_flops(model, x), conv_flops(pruned, x)
+    with torch.inference_mode():
+        latency        = measure(lambda: model(x),  n_repeat=n_repeat)
+        latency_pruned = measure(lambda: pruned(x), n_repeat=n_repeat)
+        report = accuracy_report(pruned(x), model(x))
+    return {
+        "params": sum(p.numel() for p in model.parameters()), "params_pruned": sum(p.numel() for p in pruned.parameters()),
+        "flops": flops, "flops_pruned": flops_pruned, "flop_reduction": 1. - flops_pruned / flops,
+        "latency": latency, "latency_pruned": latency_pruned, "speedup": latency / latency_pruned,
+        **report,
+    }
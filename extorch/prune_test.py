@@ -0,0 +1,68 @@
+"""Test of structured channel pruning"""
+
+import pytest
+import torch
+from torch import nn, no_grad # pylint: disable=no-name-in-module
+
+from .conv1d import Conv1dEx
+from .transpose import Transpose
+from .prune import prune_channels, pruning_report
+from .conftest import module_stack, stream_chunked
+
+
+def test_prune_channels_shape():
+    """prune_channels should shrink layers densely while keeping padding and causality."""
+
+    model = module_stack(4, 3)
+    pruned = prune_channels(model, (0.5, 0.5, 0.5, 0.75))
+
+    assert (pruned[0].out_channels, pruned[2].in_channels, pruned[2].out_channels, pruned[3].num_features, pruned[5].normalized_shape) == (4, 4, 4, 4, (4,))
+    assert (pruned[8].out_channels, pruned[8].groups, pruned[9].depthwise.groups, pruned[9].pointwise.in_channels) == (4, 4, 4, 4)
+    assert (pruned[9].pointwise.out_channels, pruned[10].in_channels, pruned[10].out_channels, pruned[11].in_channels) == (4, 4, 1, 1)
+    assert pruned[10].weight.shape == (4, 1, 4)
+    assert pruned[11].weight.shape == (3, 1, 3)
+    for layer, layer_pruned in zip(model.modules(), pruned.modules()):
+        assert getattr(layer, "_input_padding", None) == getattr(layer_pruned, "_input_padding", None)
+        assert getattr(layer, "causal", None) == getattr(layer_pruned, "causal", None)
+    # Original model is not modified
+    assert model[0].out_channels == 8
+
+
+def test_prune_channels_dead():
+    """Pruning dead channels should not change the output, and the pruned model should be streamable."""
+
+    torch.manual_seed(0)
+    model = nn.Sequential(
+        Conv1dEx(2, 6, 3, causal=True, padding="same"), nn.ReLU(), Transpose(1, 2), Transpose(1, 2),
+        Conv1dEx(6, 2, 3, causal=True, padding="same"),
+    )
+    with no_grad():
+        model[0].weight[[1, 3, 4]] = 0.
+        model[0].bias[[1, 3, 4]] = 0.
+    ipt = torch.randn(1, 2, 20)
+
+    pruned = prune_channels(model, 0.5)
+
+    with no_grad():
+        assert torch.allclose(pruned(ipt), model(ipt), atol=1e-6)
+        assert torch.allclose(stream_chunked(pruned, ipt, 7), model(ipt), atol=1e-6)
+
+
+def test_prune_channels_mixing():
+    """prune_channels should reject channel-mixing layers between pruned convs."""
+
+    model = nn.Sequential(Conv1dEx(2, 8, 3, padding="same"), nn.GLU(dim=1), Conv1dEx(4, 2, 3, padding="same"))
+    with pytest.raises(RuntimeError, match="GLU"):
+        prune_channels(model, 0.25)
+
+
+def test_pruning_report():
+    """pruning_report should report cost reduction and accuracy drop."""
+
+    model = module_stack(4, 3)
+    pruned = prune_channels(model, 0.5)
+    report = pruning_report(model, pruned, torch.randn(1, 4, 32), n_repeat=2)
+
+    assert report["flops_pruned"] < report["flops"]
+    assert report["params_pruned"] < report["params"]
+    assert 0. < report["flop_reduction"] < 1.
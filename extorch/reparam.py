@@ -0,0 +1,100 @@
+"""Structural reparameterization of parallel convolution branches."""
+
+from math import gcd
+from typing import Sequence
+
+import torch
+from torch import nn
+
+from .conv1d import Conv1dEx
+from .antialias import AntiAliasConv1dEx
+from .gated import GatedConv1dEx
+
+
+def _branch_geometry(branch: Conv1dEx | nn.Identity) -> tuple[int, int, int, int]:
+    """Geometry of a branch as (padding_left, padding_right, effective_kernel, dilation).
+
+    `nn.Identity` is regarded as k1s1 delta convolution.
+    """
+    if isinstance(branch, nn.Identity):
+        return (0, 0, 1, 1)
+    padding_l, padding_r = branch._padding_total() # pylint: disable=protected-access
+    return (padding_l, padding_r, branch._effective_kernel(), branch.dilation[0]) # pylint: disable=protected-access
+
+
+def merge_parallel(branches: Sequence[Conv1dEx | nn.Identity]) -> Conv1dEx:
+    """Merge parallel branches `sum([branch(x) for branch in branches])` into single equivalent Conv1dEx.
+
+    Each branch kernel is zero-padded and placed on the merged kernel based on its alignment (padding_lr),
+    so delta/causal kernels with different size/dilation are correctly superimposed.
+
+          k3 delta       k1 delta       identity          merged k3
+        [a][b][c]   +     [d]      +      [1]      ->   [a][b+d+1][c]
+
+          k3 causal      k1 causal      identity          merged k3
+        [a][b][c]   +           [d] +         [1]  ->   [a][b][c+d+1]
+
+    Args:
+        branches - Conv1dEx branches with the same stride/causal/channels/groups, and optionally `nn.Identity`
+    Returns:
+               - Merged Conv1dEx, whose output is identical to the sum of branch outputs
+    """
+
+    convs = [branch for branch in branches if isinstance(branch, Conv1dEx)]
+
+    # Validation
+    if len(convs) == 0:
+        raise RuntimeError("merge_parallel needs at least one Conv1dEx branch.")
+    ref = convs[0]
+    for branch in branches:
+        if isinstance(branch, nn.Identity):
+            if ref.in_channels != ref.out_channels or ref.stride[0] != 1:
+                raise RuntimeError("Identity branch requires `in_channels == out_channels` and `stride == 1`.")
+            continue
+        if not isinstance(branch, Conv1dEx) or isinstance(branch, (AntiAliasConv1dEx, GatedConv1dEx)):
+            raise RuntimeError(f"Not-supported branch type: {type(branch)}")
+        if (branch.in_channels, branch.out_channels, branch.groups) != (ref.in_channels, ref.out_channels, ref.groups):
+            raise RuntimeError("All branches should have the same `in_channels`, `out_channels` and `groups`.")
+        if branch.stride != ref.stride or branch.causal != ref.causal:
+            raise RuntimeError("All branches should have the same `stride` and `causal`.")
+        if branch.padding_mode != "zeros":
+            raise RuntimeError("merge_parallel support only `padding_mode='zeros'`.")
+
+    # Merged geometry
+    #   Output length `(L + pl + pr - k_eff) // s + 1` should match, so `pl + pr - k_eff` should be common in all branches.
+    geometries = [_branch_geometry(branch) for branch in branches]
+    if len({pl + pr - k_eff for pl, pr, k_eff, _ in geometries}) != 1:
+        raise RuntimeError("Branches yield different output length, so cannot be merged.")
+    padding_l = max(pl for pl, _, _, _ in geometries)
+    effective_kernel = max(padding_l - pl + k_eff for pl, _, k_eff, _ in geometries)
+    padding_r = geometries[0][0] + geometries[0][1] - geometries[0][2] + effective_kernel - padding_l
+    #   Use the coarsest dilation on which all taps are placed
+    dilation = 0
+    for pl, _, _, d in geometries:
+        dilation = gcd(dilation, gcd(d, padding_l - pl))
+    kernel_size = 1 + (effective_kernel - 1) // dilation
+
+    merged = Conv1dEx(ref.in_channels, ref.out_channels, kernel_size,
+        stride=ref.stride[0], padding=0, dilation=dilation, groups=ref.groups,
+        bias=any(conv.bias is not None for conv in convs), device=ref.weight.device, dtype=ref.weight.dtype)
+    merged.causal = ref.causal
+    merged._input_padding = (padding_l, padding_r) # pylint: disable=protected-access
+
+    # Merged parameters
+    with torch.no_grad():
+        merged.weight.zero_()
+        if merged.bias is not None:
+            merged.bias.zero_()
+        for branch, (pl, _, _, d) in zip(branches, geometries):
+            offset = (padding_l - pl) // dilation
+            if isinstance(branch, nn.Identity):
+                channels_per_group = ref.in_channels // ref.groups
+                for ch in range(ref.out_channels):
+                    merged.weight[ch, ch % channels_per_group, offset] += 1.
+                continue
+            step = d // dilation
+            merged.weight[:, :, offset : offset + step * (branch.kernel_size[0] - 1) + 1 : step] += branch.weight
+            if branch.bias is not None:
+                merged.bias += branch.bias
+
+    return merged
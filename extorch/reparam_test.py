@@ -0,0 +1,73 @@
+"""Test of structural reparameterization"""
+
+import torch
+from torch import nn, equal, no_grad # pylint: disable=no-name-in-module
+
+from .conv1d import Conv1dEx
+from .reparam import merge_parallel
+
+
+def _integer_init(conv: Conv1dEx) -> Conv1dEx:
+    """Initialize parameters with small integers for exact comparison."""
+    with no_grad():
+        conv.weight.copy_(torch.randint(-3, 4, conv.weight.shape))
+        if conv.bias is not None:
+            conv.bias.copy_(torch.randint(-3, 4, conv.bias.shape))
+    return conv
+
+
+def test_merge_parallel_kernel():
+    """merge_parallel should align kernels by their shape.
+
+    [normal] k3 (2,3,5) + k1 (7) + identity -> k3 (2,11,5)
+    [causal] k3 (2,3,5) + k1 (7) + identity -> k3 (2,3,13)
+    """
+
+    with no_grad():
+        for causal, kernel_gt in ((False, [2., 11., 5.]), (True, [2., 3., 13.])):
+            conv_k3 = Conv1dEx(1, 1, 3, causal=causal, padding="same", bias=False)
+            conv_k1 = Conv1dEx(1, 1, 1, causal=causal, padding="same", bias=False)
+            conv_k3.weight[0][0] = torch.tensor([2., 3., 5.])
+            conv_k1.weight[0][0] = torch.tensor([7.])
+
+            merged = merge_parallel([conv_k3, conv_k1, nn.Identity()])
+
+            assert equal(merged.weight[0][0], torch.tensor(kernel_gt))
+
+
+def test_merge_parallel_equivalence():
+    """merge_parallel should yield output identical to the sum of branches."""
+
+    torch.manual_seed(0)
+    configs = [
+        # causal stride padding              [(kernel, dilation)]                 identity
+        (False,  1,    "same",               [(3, 1), (1, 1), (5, 1)],            True),
+        (True,   1,    "same",               [(3, 1), (1, 1), (3, 2), (3, 4)],    True),
+        (False,  1,    "same",               [(4, 1), (2, 1)],                    False),
+        (True,   1,    "same",               [(3, 2), (5, 2)],                    False),
+        (True,   2,    "scale_drop",         [(4, 1), (2, 1)],                    False),
+        (True,   3,    "scale_ceil",         [(5, 1), (3, 1)],                    False),
+        (False,  2,    "scale_drop",         [(5, 1), (3, 1)],                    False),
+    ]
+    with no_grad():
+        for causal, stride, padding, kernels, identity in configs:
+            branches: list[nn.Module] = [_integer_init(Conv1dEx(4, 4, k, causal=causal, stride=stride, padding=padding, dilation=d, groups=2)) for k, d in kernels]
+            if identity:
+                branches.append(nn.Identity())
+            merged = merge_parallel(branches)
+
+            for length in (11, 12, 13):
+                ipt = torch.randint(-3, 4, (2, 4, length)).float()
+                opt_gt = sum(branch(ipt) for branch in branches)
+                opt = merged(ipt)
+                assert equal(opt, opt_gt), f"{causal}/{stride}/{padding}/{kernels}"
+
+
+def test_merge_parallel_coarse_dilation():
+    """merge_parallel should keep the common dilation when possible."""
+
+    branches = [Conv1dEx(1, 1, 3, causal=True, padding="same", dilation=2), Conv1dEx(1, 1, 5, causal=True, padding="same", dilation=2)]
+    merged = merge_parallel(branches)
+
+    assert merged.dilation == (2,)
+    assert merged.kernel_size == (5,)
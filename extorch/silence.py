@@ -0,0 +1,154 @@
+"""Silence-aware streaming, which skips convolution of silent (constant) input."""
+
+import torch
+from torch import Tensor, nn
+import torch.nn.functional as F
+
+from .conv1d import Conv1dEx
+from .convt1d import ConvT1dEx
+from .antialias import AntiAliasConv1dEx
+from .gated import GatedConv1dEx, reject_conditioned
+from .stream import StreamingModule, stream_layers
+from .precision import compute_dtype
+
+
+def _count(stats: dict[str, int] | None, macs: int, skipped: bool) -> None:
+    """Accumulate compute accounting."""
+    if stats is None:
+        return
+    stats["calls"] = stats.get("calls", 0) + 1
+    stats["macs"] = stats.get("macs", 0) + macs
+    stats["skipped_calls"] = stats.get("skipped_calls", 0) + int(skipped)
+    stats["skipped_macs"] = stats.get("skipped_macs", 0) + (macs if skipped else 0)
+
+
+def _is_silent(x: Tensor, threshold: float) -> tuple[bool, bool]:
+    """Whether the input is constant over time (peak-to-peak <= threshold) in all channels, and whether it is also zero."""
+    # amax/amin are faster than aminmax over the last axis on CPU
+    high, low = x.amax(dim=-1), x.amin(dim=-1)
+    if bool((high - low).amax() > threshold):
+        return (False, False)
+    return (True, bool(high.amax() <= threshold) and bool(low.amin() >= -threshold))
+
+
+def _bias_output(conv: Conv1dEx | ConvT1dEx, batch_size: int, length: int) -> Tensor:
+    """Output for zero input, i.e. bias, (B, C_out, L) before gating."""
+    dtype = compute_dtype(conv.weight)
+    if conv.bias is None:
+        return conv.weight.new_zeros(1, 1, 1, dtype=dtype).expand(batch_size, conv.out_channels, length)
+    return conv.bias.to(dtype).view(1, -1, 1).expand(batch_size, -1, length)
+
+
+def _conv_stream_skip(conv: Conv1dEx, x: Tensor, state: Tensor, threshold: float, stats: dict[str, int] | None) -> tuple[Tensor, Tensor]:
+    """`Conv1dEx.forward_stream` which skips convolution when the buffer (history + chunk) is constant over time.
+
+    Convolution of a per-channel constant input is a constant, so it is computed once as a single frame (bias for zero).
+    """
+    buffer = torch.cat([state.to(x.dtype), x], dim=-1)
+    kernel_eff, stride = conv._effective_kernel(), conv.stride[0] # pylint: disable=protected-access
+    n_frame = max(0, (buffer.size(-1) - kernel_eff) // stride + 1)
+    if n_frame == 0 or conv.padding_mode != "zeros":
+        return conv.forward_stream(x, state)
+
+    silent, zero = _is_silent(buffer, threshold)
+    _count(stats, buffer.size(0) * n_frame * conv.out_channels * (conv.in_channels // conv.groups) * conv.kernel_size[0], silent)
+    if not silent:
+        o = conv._forward_valid(buffer[..., : (n_frame - 1) * stride + kernel_eff]) # pylint: disable=protected-access
+    else:
+        if zero:
+            frame = _bias_output(conv, buffer.size(0), 1)
+        else:
+            # Constant input over a kernel == one frame of undilated conv over K constant samples (dilation only spreads the same value)
+            weight = conv.fused_weight() if isinstance(conv, AntiAliasConv1dEx) else conv.weight
+            head = buffer[..., :1].expand(-1, -1, weight.size(-1))
+            frame = F.conv1d(head, weight, conv.bias, 1, 0, 1, conv.groups)
+        if isinstance(conv, GatedConv1dEx):
+            frame = conv._gate(frame.clone()) # pylint: disable=protected-access
+        o = frame.expand(-1, -1, n_frame)
+    return o, buffer[..., n_frame * stride :]
+
+
+def _convt_stream_skip(conv: ConvT1dEx, x: Tensor, state: Tensor, threshold: float, stats: dict[str, int] | None) -> tuple[Tensor, Tensor]:
+    """`ConvT1dEx.forward_stream` which skips transposed convolution of silent (zero or settled constant) chunk.
+
+    Zero chunk yields nothing, so output is the overlap-add tail in the state (+ bias).
+    Constant chunk whose state is settled (state is unchanged by one more sample) yields the same `stride` samples for each input sample,
+    so only one sample is convolved.
+    """
+    len_o = conv.stride[0] * x.size(-1)
+    if len_o == 0 or conv._padding_total()[0] != 0 or conv.padding_mode != "zeros": # pylint: disable=protected-access
+        return conv.forward_stream(x, state)
+
+    macs = x.size(0) * x.size(-1) * conv.in_channels * (conv.out_channels // conv.groups) * conv.kernel_size[0]
+    silent, zero = _is_silent(x, threshold)
+
+    if silent and zero:
+        _count(stats, macs, True)
+        if not bool(state.any()):
+            return _bias_output(conv, x.size(0), len_o), state
+        dtype = compute_dtype(conv.weight)
+        o_full = F.pad(state, (0, max(0, len_o - state.size(-1))))
+        o = o_full[..., :len_o]
+        if conv.bias is not None:
+            o = o + conv.bias.unsqueeze(-1)
+        # New state is the rest of tail, zero-filled to keep its length
+        tail = o_full[..., len_o:]
+        return o.to(dtype), F.pad(tail, (0, state.size(-1) - tail.size(-1)))
+
+    if silent:
+        o_head, state_head = conv.forward_stream(x[..., :1], state)
+        if not bool((state_head - state).abs().amax() > threshold):
+            _count(stats, macs, True)
+            return o_head.repeat(1, 1, x.size(-1)), state
+
+    _count(stats, macs, False)
+    return conv.forward_stream(x, state)
+
+
+def forward_stream_skip(
+        model:     nn.Module,
+        x:         Tensor,
+        states:    list[Tensor],
+        threshold: float = 0.,
+        stats:     dict[str, int] | None = None,
+    ) -> tuple[Tensor, list[Tensor]]:
+    """Silence-aware `stream.forward_stream`.
+
+    Conv1dEx skips convolution when its buffer (history + chunk) is constant over time, e.g. silence, and yields the precomputed constant output.
+    ConvT1dEx skips transposed convolution when the chunk is zero, or constant with settled state.
+    Skipped outputs are constant (or stride-periodic) again, so skip propagates through the stack once the histories of the following layers are settled.
+
+        chunk   000000000 -> Conv1dEx -> bbbbbbbbb -> ReLU -> ccccccccc -> Conv1dEx -> ddddddddd
+                             (skipped)                                     (skipped)
+
+    With `threshold=0`, output is exactly identical to `stream.forward_stream` for true zeros (zero input to bias-less layers),
+    and identical up to float summation order for constant input.
+    With `threshold>0`, near-constant input (peak-to-peak <= threshold) is approximated by its first sample.
+    States are the same as `stream.forward_stream`, so both can be switched chunk by chunk.
+
+    Args:
+        model     - Conv1dEx/ConvT1dEx/Conv2dEx/ConvT2dEx, or `nn.Sequential` stack of them and time-local layers
+        x         - Input chunk
+        states    - Streaming states from `stream.init_states` or previous forward
+        threshold - Maximum deviation regarded as silence
+        stats     - Compute accounting accumulated in place, {calls, skipped_calls, macs, skipped_macs} of Conv1dEx/ConvT1dEx
+    Returns:
+                  - Output chunk
+                  - New streaming states
+    """
+    layers = stream_layers(model)
+    reject_conditioned(layers, "forward_stream_skip")
+    states_iter, new_states = iter(states), []
+    for layer in layers:
+        if isinstance(layer, Conv1dEx):
+            x, state = _conv_stream_skip(layer, x, next(states_iter), threshold, stats)
+            new_states.append(state)
+        elif isinstance(layer, ConvT1dEx):
+            x, state = _convt_stream_skip(layer, x, next(states_iter), threshold, stats)
+            new_states.append(state)
+        elif isinstance(layer, StreamingModule):
+            x, state = layer.forward_stream(x, next(states_iter))
+            new_states.append(state)
+        else:
+            x = layer(x)
+    return x.contiguous(), new_states
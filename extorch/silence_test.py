@@ -0,0 +1,62 @@
+"""Test of silence-aware streaming"""
+
+import torch
+from torch import equal, allclose, no_grad # pylint: disable=no-name-in-module
+
+from .stream import init_states, forward_stream
+from .silence import forward_stream_skip
+from .conftest import causal_stack
+
+
+def _silent_input() -> torch.Tensor:
+    """Signal - silence - signal - silence."""
+    torch.manual_seed(0)
+    ipt = torch.randn(2, 1, 400)
+    ipt[..., 40:200] = 0.
+    ipt[..., 260:] = 0.
+    return ipt
+
+
+def test_forward_stream_skip_exact():
+    """forward_stream_skip should yield output exactly identical to forward_stream for true zeros."""
+
+    model, ipt = causal_stack(bias=False), _silent_input()
+    with no_grad():
+        states, states_skip, stats = init_states(model, 2), init_states(model, 2), {}
+        for chunk in ipt.split(16, dim=-1):
+            opt, states = forward_stream(model, chunk, states)
+            opt_skip, states_skip = forward_stream_skip(model, chunk, states_skip, stats=stats)
+            assert equal(opt_skip, opt)
+            assert all(equal(state_skip, state) for state_skip, state in zip(states_skip, states))
+    assert stats["skipped_macs"] > stats["macs"] * 0.4
+
+
+def test_forward_stream_skip_constant():
+    """forward_stream_skip should skip settled constant (e.g. bias) through the stack."""
+
+    model, ipt = causal_stack(), _silent_input()
+    with no_grad():
+        states, states_skip, stats = init_states(model, 2), init_states(model, 2), {}
+        for chunk in ipt.split(16, dim=-1):
+            opt, states = forward_stream(model, chunk, states)
+            opt_skip, states_skip = forward_stream_skip(model, chunk, states_skip, stats=stats)
+            assert allclose(opt_skip, opt, atol=1e-6)
+
+    assert stats["calls"] == 4 * 25
+    assert 0 < stats["skipped_calls"] < stats["calls"]
+    # Whole stack is skipped in the long silence
+    assert stats["skipped_macs"] > stats["macs"] * 0.4
+
+
+def test_forward_stream_skip_threshold():
+    """forward_stream_skip with threshold should approximate near-silence."""
+
+    model, ipt = causal_stack(), _silent_input()
+    ipt_noisy = ipt + 1e-6 * torch.randn_like(ipt)
+    with no_grad():
+        states, states_skip, stats = init_states(model, 2), init_states(model, 2), {}
+        for chunk in ipt_noisy.split(16, dim=-1):
+            opt, states = forward_stream(model, chunk, states)
+            opt_skip, states_skip = forward_stream_skip(model, chunk, states_skip, threshold=1e-5, stats=stats)
+            assert allclose(opt_skip, opt, atol=1e-4)
+    assert stats["skipped_calls"] > 0
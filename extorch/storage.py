@@ -0,0 +1,171 @@
+"""Memory-mapped model storage, for fast load of extorch models."""
+
+import importlib
+import json
+import mmap
+import struct
+from os import PathLike
+from typing import Any
+
+import torch
+from torch import Tensor, nn
+
+from .stream import _little_endian
+
+
+# File format (little endian, including tensor data)
+#   header :: magic 4B | version u16 | json_size u32 | json (utf-8) | padding to 64B alignment
+#   data   :: tensor data, each aligned to 64B
+#   json   :: {"torch": "major.minor", "tree": node, "tensors": [{"dtype", "shape", "offset"}]}
+#   node   :: {"class", "config", "parameters": {name: tensor_idx|None}, "buffers": {name: tensor_idx|None}, "non_persistent", "children": {name: node}}
+# Configs are raw module attributes, so `version` is bumped when extorch module attributes change,
+# and torch version is checked on load because torch.nn attributes may change between torch releases.
+_MAGIC = b"EXMD"
+_VERSION = 2
+_HEADER = struct.Struct("<4sHI")
+_ALIGN = 64
+# Module classes which can be restored
+_MODULE_PREFIXES = ("extorch.", "torch.nn.")
+# Module attributes managed by nn.Module itself
+_MODULE_INTERNALS = frozenset(vars(nn.Module()).keys()) - {"training"}
+
+
+def _align(offset: int) -> int:
+    return (offset + _ALIGN - 1) // _ALIGN * _ALIGN
+
+
+def _encode(value: Any) -> Any:
+    """Encode a config value into JSON, keeping tuple distinct from list."""
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, tuple):
+        return {"tuple": [_encode(item) for item in value]}
+    if isinstance(value, list):
+        return [_encode(item) for item in value]
+    raise RuntimeError(f"Not-supported module attribute type: {type(value)}")
+
+
+def _decode(value: Any) -> Any:
+    if isinstance(value, dict):
+        return tuple(_decode(item) for item in value["tuple"])
+    if isinstance(value, list):
+        return [_decode(item) for item in value]
+    return value
+
+
+def _dtype_name(dtype: torch.dtype) -> str:
+    return str(dtype).removeprefix("torch.")
+
+
+def _torch_version() -> str:
+    """`major.minor` of torch, which fixes torch.nn module attributes."""
+    return ".".join(torch.__version__.split(".")[:2])
+
+
+def save_model(model: nn.Module, path: str | PathLike) -> None:
+    """Save a model as a flat file of module configs + weights, which can be memory-mapped by `load_model`.
+
+    Configs are module attributes as is, so computed ones (e.g. `_input_padding`) are stored together with the user-facing ones (`causal`, stride, etc.).
+    Modules should be importable extorch or `torch.nn` ones, whose attributes are plain values.
+    The file is tied to the torch `major.minor` version, which `load_model` checks.
+    """
+    tensors: list[Tensor] = []
+
+    def register(tensor: Tensor | None) -> int | None:
+        if tensor is None:
+            return None
+        tensors.append(tensor.detach().cpu().contiguous())
+        return len(tensors) - 1
+
+    def encode_node(module: nn.Module) -> dict[str, Any]:
+        cls = type(module)
+        name = f"{cls.__module__}.{cls.__qualname__}"
+        if not name.startswith(_MODULE_PREFIXES) or getattr(importlib.import_module(cls.__module__), cls.__qualname__, None) is not cls:
+            raise RuntimeError(f"Not-supported module class: {name}")
+        return {
+            "class": name,
+            "config": {key: _encode(value) for key, value in vars(module).items() if key not in _MODULE_INTERNALS},
+            "parameters": {key: register(param) for key, param in module._parameters.items()}, # pylint: disable=protected-access
+            "buffers": {key: register(buffer) for key, buffer in module._buffers.items()}, # pylint: disable=protected-access
+            "non_persistent": sorted(module._non_persistent_buffers_set), # pylint: disable=protected-access
+            "children": {key: encode_node(child) for key, child in module.named_children()},
+        }
+
+    tree = encode_node(model)
+
+    # Layout
+    metas, offset = [], 0
+    for tensor in tensors:
+        metas.append({"dtype": _dtype_name(tensor.dtype), "shape": list(tensor.shape), "offset": offset})
+        offset = _align(offset + tensor.numel() * tensor.element_size())
+    header = json.dumps({"torch": _torch_version(), "tree": tree, "tensors": metas}).encode("utf-8")
+    offset_data = _align(_HEADER.size + len(header))
+
+    with open(path, "wb") as f:
+        f.write(_HEADER.pack(_MAGIC, _VERSION, len(header)))
+        f.write(header)
+        for tensor, meta in zip(tensors, metas):
+            f.seek(offset_data + meta["offset"])
+            if tensor.numel() > 0:
+                f.write(_little_endian(tensor.flatten().view(torch.uint8), tensor.element_size()).numpy().tobytes())
+        f.truncate(offset_data + offset)
+
+
+def load_model(path: str | PathLike, use_mmap: bool = True) -> nn.Module:
+    """Load a model saved by `save_model`.
+
+    Modules are restored from the stored configs without running their `__init__`, so padding computation is skipped.
+    With `use_mmap`, weights are zero-copy views of the copy-on-write mapped file (on little endian host), so they are paged in lazily on first use.
+    A file saved with another torch `major.minor` version is rejected, because module attributes are restored as is.
+
+    Args:
+        path     - Path of the saved model
+        use_mmap - Whether to memory-map the file, else read it into memory
+    Returns:
+                 - Restored model
+    """
+    with open(path, "rb") as f:
+        # ACCESS_COPY: writable (e.g. fine-tuning) without modifying the file
+        buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY) if use_mmap else bytearray(f.read())
+    magic, version, header_size = _HEADER.unpack_from(buffer, 0)
+    if magic != _MAGIC:
+        raise RuntimeError("Not an extorch model file.")
+    if version != _VERSION:
+        raise RuntimeError(f"Not-supported model file version: {version} (supported: {_VERSION})")
+    header = json.loads(bytes(buffer[_HEADER.size : _HEADER.size + header_size]).decode("utf-8"))
+    if header["torch"] != _torch_version():
+        raise RuntimeError(f"Model file is saved with torch {header['torch']}, but loaded with torch {_torch_version()}. Re-save it with this torch.")
+    offset_data = _align(_HEADER.size + header_size)
+
+    tensors = []
+    for meta in header["tensors"]:
+        dtype = getattr(torch, meta["dtype"])
+        numel = 1
+        for size in meta["shape"]:
+            numel *= size
+        if numel == 0:
+            tensors.append(torch.zeros(meta["shape"], dtype=dtype))
+        else:
+            data = torch.frombuffer(buffer, dtype=torch.uint8, count=numel * dtype.itemsize, offset=offset_data + meta["offset"])
+            tensors.append(_little_endian(data, dtype.itemsize).view(dtype).view(meta["shape"]))
+
+    def decode_node(node: dict[str, Any]) -> nn.Module:
+        if not node["class"].startswith(_MODULE_PREFIXES):
+            raise RuntimeError(f"Not-supported module class: {node['class']}")
+        module_name, _, cls_name = node["class"].rpartition(".")
+        cls = getattr(importlib.import_module(module_name), cls_name, None)
+        if not (isinstance(cls, type) and issubclass(cls, nn.Module)):
+            raise RuntimeError(f"Not a module class: {node['class']}")
+        module = cls.__new__(cls)
+        nn.Module.__init__(module)
+        for key, value in node["config"].items():
+            setattr(module, key, _decode(value))
+        for key, idx in node["parameters"].items():
+            module.register_parameter(key, None if idx is None else nn.Parameter(tensors[idx]))
+        for key, idx in node["buffers"].items():
+            module.register_buffer(key, None if idx is None else tensors[idx], persistent=key not in node["non_persistent"])
+        for key, child in node["children"].items():
+            module.add_module(key, decode_node(child))
+        return module
+
+    return decode_node(header["tree"])
@@ -0,0 +1,103 @@
+"""Test of memory-mapped model storage"""
+
+import json
+import struct
+
+import pytest
+import torch
+from torch import nn, equal, no_grad # pylint: disable=no-name-in-module
+
+from .conv1d import Conv1dEx
+from .conv2d import Conv2dEx
+from .storage import save_model, load_model
+from .conftest import module_stack
+
+
+@pytest.mark.parametrize("use_mmap", [True, False])
+def test_save_load_model(tmp_path, use_mmap: bool):
+    """load_model should restore configs and weights, yielding identical output."""
+
+    torch.manual_seed(0)
+    model = module_stack(3, 2)
+    path = tmp_path / "model.exmd"
+    save_model(model, path)
+    loaded = load_model(path, use_mmap=use_mmap)
+
+    ipt = torch.randn(2, 3, 40)
+    with no_grad():
+        assert equal(loaded(ipt), model(ipt))
+    assert str(loaded) == str(model)
+    assert loaded.training is False
+    for module, module_loaded in zip(model.modules(), loaded.modules()):
+        assert type(module) is type(module_loaded)
+        assert getattr(module, "_input_padding", None) == getattr(module_loaded, "_input_padding", None)
+        assert getattr(module, "causal", None) == getattr(module_loaded, "causal", None)
+    assert loaded.state_dict().keys() == model.state_dict().keys()
+
+
+def test_save_load_model_reduced(tmp_path):
+    """load_model should restore reduced-precision and 2D modules."""
+
+    model = Conv2dEx(2, 3, (3, 4), causal=True, stride=(1, 2), padding=("same", "scale_drop")).to(torch.bfloat16)
+    path = tmp_path / "model.exmd"
+    save_model(model, path)
+    loaded = load_model(path)
+
+    assert loaded.weight.dtype == torch.bfloat16
+    assert equal(loaded.weight, model.weight)
+    assert loaded._input_padding == model._input_padding # pylint: disable=protected-access
+
+
+def test_load_model_copy_on_write(tmp_path):
+    """Updating loaded weights should not modify the file."""
+
+    model = Conv1dEx(2, 2, 3, causal=True, padding="same")
+    path = tmp_path / "model.exmd"
+    save_model(model, path)
+    with no_grad():
+        load_model(path).weight.zero_()
+    assert equal(load_model(path).weight, model.weight)
+
+
+def test_save_model_unsupported(tmp_path):
+    """save_model should reject modules out of extorch/torch.nn."""
+
+    class Custom(nn.Module): # pylint: disable=missing-class-docstring
+        pass
+
+    with pytest.raises(RuntimeError):
+        save_model(nn.Sequential(Custom()), tmp_path / "model.exmd")
+
+
+def test_load_model_unsupported(tmp_path):
+    """load_model should reject non-module classes."""
+
+    from .storage import _HEADER, _MAGIC, _VERSION, _torch_version # pylint: disable=import-outside-toplevel
+    node = {"class": "torch.nn.functional.relu", "config": {}, "parameters": {}, "buffers": {}, "non_persistent": [], "children": {}}
+    header = json.dumps({"torch": _torch_version(), "tree": node, "tensors": []}).encode("utf-8")
+    path = tmp_path / "model.exmd"
+    path.write_bytes(_HEADER.pack(_MAGIC, _VERSION, len(header)) + header)
+    with pytest.raises(RuntimeError, match="Not a module class"):
+        load_model(path)
+
+
+def test_load_model_torch_version(tmp_path, monkeypatch):
+    """load_model should reject a file saved with another torch version, whose module attributes may differ."""
+
+    path = tmp_path / "model.exmd"
+    save_model(Conv1dEx(1, 1, 3, causal=True, padding="same"), path)
+    monkeypatch.setattr(torch, "__version__", "1.0.0")
+    with pytest.raises(RuntimeError, match="torch"):
+        load_model(path)
+
+
+def test_save_model_little_endian(tmp_path):
+    """save_model should write tensor data in little endian."""
+
+    from .storage import _ALIGN # pylint: disable=import-outside-toplevel
+    conv = Conv1dEx(1, 1, 3, causal=True, padding="same", bias=False)
+    with no_grad():
+        conv.weight.copy_(torch.tensor([[[1., 2., 3.]]]))
+    path = tmp_path / "model.exmd"
+    save_model(conv, path)
+    assert path.read_bytes()[-_ALIGN:][:12] == struct.pack("<3f", 1., 2., 3.)
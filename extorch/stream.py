@@ -0,0 +1,160 @@
+"""Streaming execution of extorch modules and stacks, and its state export/import."""
+
+import struct
+import sys
+
+import torch
+from torch import Tensor, nn
+
+from .conv1d import Conv1dEx
+from .convt1d import ConvT1dEx
+from .conv2d import Conv2dEx
+from .convt2d import ConvT2dEx
+from .gated import reject_conditioned
+
+
+StreamingModule = Conv1dEx | ConvT1dEx | Conv2dEx | ConvT2dEx
+
+
+def stream_layers(model: nn.Module) -> list[nn.Module]:
+    """Flatten a model into streaming-order layers.
+
+    `nn.Sequential` is flattened recursively. Other modules are regarded as a layer.
+    Layers other than Conv1dEx/ConvT1dEx/Conv2dEx/ConvT2dEx should be time-local (e.g. activation, Transpose), so are applied chunk by chunk without state.
+    """
+    if isinstance(model, nn.Sequential):
+        return [layer for child in model for layer in stream_layers(child)]
+    if not isinstance(model, StreamingModule) and any(isinstance(module, StreamingModule) for module in model.modules()):
+        raise RuntimeError(f"{type(model).__name__} contains streaming layers in non-sequential way, so cannot be streamed.")
+    return [model]
+
+
+def init_states(model: nn.Module, batch_size: int = 1) -> list[Tensor]:
+    """Initial streaming states of all Conv1dEx/ConvT1dEx/Conv2dEx/ConvT2dEx in a model, in streaming order."""
+    return [layer.init_state(batch_size) for layer in stream_layers(model) if isinstance(layer, StreamingModule)]
+
+
+def forward_stream(model: nn.Module, x: Tensor, states: list[Tensor]) -> tuple[Tensor, list[Tensor]]:
+    """Forward a chunk through a model in streaming mode.
+
+    Args:
+        model  - Conv1dEx/ConvT1dEx/Conv2dEx/ConvT2dEx, or `nn.Sequential` stack of them and time-local layers
+        x      - Input chunk
+        states - Streaming states from `init_states` or previous `forward_stream`
+    Returns:
+               - Output chunk
+               - New streaming states
+    """
+    layers = stream_layers(model)
+    reject_conditioned(layers, "forward_stream")
+    states_iter, new_states = iter(states), []
+    for layer in layers:
+        if isinstance(layer, StreamingModule):
+            x, state = layer.forward_stream(x, next(states_iter))
+            new_states.append(state)
+        else:
+            x = layer(x)
+    return x, new_states
+
+
+def flush_stream(model: nn.Module, states: list[Tensor]) -> Tensor | None:
+    """Yield the last output at the end of stream, which needs right padding of layers.
+
+    Returns:
+        - Output tail, None if no layer yields it
+    """
+    layers = stream_layers(model)
+    reject_conditioned(layers, "flush_stream")
+    x, states_iter = None, iter(states)
+    for layer in layers:
+        if isinstance(layer, StreamingModule):
+            state = next(states_iter)
+            o_head = None
+            if x is not None:
+                o_head, state = layer.forward_stream(x, state)
+            o_tail = layer.flush_stream(state)
+            x = o_tail if o_head is None else torch.cat([o_head, o_tail], dim=-1)
+        elif x is not None:
+            x = layer(x)
+    return x
+
+
+# Binary format of states (little endian, including tensor data)
+#   header :: magic 4B | version u16 | n_tensor u32
+#   tensor :: dtype u8 | ndim u8 | shape i64 * ndim | padding to 8B alignment | data
+_MAGIC = b"EXST"
+_VERSION = 1
+_HEADER = struct.Struct("<4sHI")
+_DTYPES = [torch.float32, torch.float64, torch.float16, torch.bfloat16, torch.int64, torch.int32, torch.int16, torch.int8, torch.uint8, torch.bool]
+
+
+def _align(offset: int) -> int:
+    return (offset + 7) // 8 * 8
+
+
+def _little_endian(data: Tensor, item_size: int) -> Tensor:
+    """Swap raw bytes (uint8) of `item_size`-byte items between native and little endian, as is on little endian host."""
+    if sys.byteorder == "little" or item_size == 1:
+        return data
+    return data.view(-1, item_size).flip(-1).flatten()
+
+
+def export_states(states: list[Tensor]) -> bytearray:
+    """Serialize streaming states into a compact versioned binary blob.
+
+    Each state is copied once, directly into the blob.
+    """
+    # Layout
+    layout, offset = [], _HEADER.size
+    for state in states:
+        if state.dtype not in _DTYPES:
+            raise RuntimeError(f"Not-supported state dtype: {state.dtype}")
+        meta = struct.pack(f"<BB{state.dim()}q", _DTYPES.index(state.dtype), state.dim(), *state.shape)
+        offset_data = _align(offset + len(meta))
+        layout.append((offset, meta, offset_data))
+        offset = offset_data + state.numel() * state.element_size()
+
+    # Write
+    blob = bytearray(offset)
+    _HEADER.pack_into(blob, 0, _MAGIC, _VERSION, len(states))
+    for state, (offset_meta, meta, offset_data) in zip(states, layout):
+        blob[offset_meta : offset_meta + len(meta)] = meta
+        if state.numel() > 0:
+            dst = torch.frombuffer(blob, dtype=torch.uint8, count=state.numel() * state.element_size(), offset=offset_data)
+            dst.copy_(_little_endian(state.detach().cpu().contiguous().flatten().view(torch.uint8), state.element_size()))
+    return blob
+
+
+def import_states(blob: bytes | bytearray | memoryview, device: torch.device | str | None = None) -> list[Tensor]:
+    """Deserialize streaming states from a binary blob of `export_states`.
+
+    States are zero-copy views of the blob if the blob is writable (e.g. bytearray), device is CPU and host is little endian, otherwise copied.
+    """
+    view = memoryview(blob)
+    if view.readonly:
+        view = memoryview(bytearray(view))
+    magic, version, n_tensor = _HEADER.unpack_from(view, 0)
+    if magic != _MAGIC:
+        raise RuntimeError("Not an extorch streaming state blob.")
+    if version != _VERSION:
+        raise RuntimeError(f"Not-supported streaming state version: {version} (supported: {_VERSION})")
+
+    states, offset = [], _HEADER.size
+    for _ in range(n_tensor):
+        dtype_idx, ndim = struct.unpack_from("<BB", view, offset)
+        shape = struct.unpack_from(f"<{ndim}q", view, offset + 2)
+        offset = _align(offset + 2 + 8 * ndim)
+        if dtype_idx >= len(_DTYPES):
+            raise RuntimeError(f"Not-supported state dtype index: {dtype_idx}")
+        dtype = _DTYPES[dtype_idx]
+        numel = 1
+        for size in shape:
+            numel *= size
+        if numel == 0:
+            state = torch.zeros(shape, dtype=dtype)
+        else:
+            data = torch.frombuffer(view, dtype=torch.uint8, count=numel * dtype.itemsize, offset=offset)
+            state = _little_endian(data, dtype.itemsize).view(dtype).view(shape)
+        states.append(state if device is None else state.to(device))
+        offset += numel * dtype.itemsize
+    return states
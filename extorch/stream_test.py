@@ -0,0 +1,139 @@
+"""Test of streaming execution"""
+
+import struct
+import sys
+
+import pytest
+import torch
+from torch import nn, tensor, equal, allclose, no_grad # pylint: disable=no-name-in-module
+
+from .conv1d import Conv1dEx
+from .convt1d import ConvT1dEx
+from .transpose import Transpose
+from .stream import init_states, forward_stream, export_states, import_states
+from .conftest import stream_chunked
+
+
+def test_conv1dex_forward_stream():
+    """Conv1dEx should yield identical output in streaming.
+
+    [causal] k3s1d1, kernel (2,3,5)
+    state      -         -
+    chunk0                         1
+    opt0                         0+0+5
+    chunk1                                   2         3
+    opt1                                  0+3+10    2+6+15
+    """
+
+    with no_grad():
+        conv = Conv1dEx(1, 1, 3, causal=True, padding="same", bias=False)
+        conv.weight[0][0] = tensor([2., 3., 5.])
+        state = conv.init_state()
+        opt0, state = conv.forward_stream(tensor([[[1.]]]),     state)
+        opt1, state = conv.forward_stream(tensor([[[2., 3.]]]), state)
+
+        assert equal(opt0, tensor([[[ 5.]]]))
+        assert equal(opt1, tensor([[[13., 23.]]]))
+        assert equal(state, tensor([[[2., 3.]]]))
+
+
+def test_forward_stream_equivalence():
+    """Streaming should yield output identical to the full-length forward, for various layers and chunkings."""
+
+    torch.manual_seed(0)
+    models = [
+        Conv1dEx(3, 4, 3, causal=True, padding="same"),
+        Conv1dEx(3, 4, 3, causal=True, padding="same", dilation=3),
+        Conv1dEx(3, 4, 5, causal=True, stride=3, padding="scale_ceil"),
+        Conv1dEx(3, 4, 4, causal=True, stride=2, padding="scale_drop"),
+        Conv1dEx(3, 4, 4,              stride=2, padding="scale_ceil"),
+        Conv1dEx(3, 4, 3,              padding="same"),
+        ConvT1dEx(3, 4, 4, causal=True, stride=2, padding="scale_drop"),
+        ConvT1dEx(3, 4, 5, causal=True, stride=2, padding="scale_drop", dilation=2),
+        ConvT1dEx(3, 4, 3, stride=2, padding="valid"),
+        nn.Sequential(
+            Conv1dEx(3, 8, 3, causal=True, padding="same"), nn.ReLU(),
+            Conv1dEx(8, 8, 4, causal=True, stride=2, padding="scale_ceil"), nn.Tanh(),
+            Transpose(1, 2), nn.Sequential(nn.LayerNorm(8)), Transpose(1, 2),
+            ConvT1dEx(8, 4, 4, causal=True, stride=2, padding="scale_drop"),
+            Conv1dEx(4, 2, 5, padding="same"),
+        ),
+    ]
+    with no_grad():
+        for model in models:
+            for length, chunk_sizes in ((12, [12]), (12, [1] * 12), (13, [5, 0, 3, 5]), (30, [7, 7, 7, 9])):
+                ipt = torch.randn(2, 3, length)
+                opt_gt = model(ipt)
+                opt = stream_chunked(model, ipt, chunk_sizes)
+                assert opt.shape == opt_gt.shape, f"{model}/L{length}/{chunk_sizes}"
+                assert allclose(opt, opt_gt, atol=1e-5), f"{model}/L{length}/{chunk_sizes}"
+
+
+def test_convt1dex_forward_stream_left_crop():
+    """ConvT1dEx with left padding^-1 should reject streaming."""
+
+    conv = ConvT1dEx(1, 1, 4, stride=2, padding="scale_drop")
+    with pytest.raises(RuntimeError):
+        conv.forward_stream(torch.zeros(1, 1, 2), conv.init_state())
+
+
+def test_export_import_states():
+    """Exported/imported states should continue the stream bit-exactly."""
+
+    torch.manual_seed(0)
+    model = nn.Sequential(
+        Conv1dEx(3, 8, 3, causal=True, padding="same"), nn.ReLU(),
+        Conv1dEx(8, 8, 4, causal=True, stride=2, padding="scale_ceil"),
+        ConvT1dEx(8, 4, 4, causal=True, stride=2, padding="scale_drop"),
+    )
+    ipt = torch.randn(2, 3, 20)
+    with no_grad():
+        states = init_states(model, 2)
+        _, states = forward_stream(model, ipt[..., :7], states)
+        opt_gt, _ = forward_stream(model, ipt[..., 7:], states)
+
+        for blob in (export_states(states), bytes(export_states(states))):
+            states_restored = import_states(blob)
+            assert all(equal(restored, state) for restored, state in zip(states_restored, states))
+            opt, _ = forward_stream(model, ipt[..., 7:], states_restored)
+            assert equal(opt, opt_gt)
+
+
+def test_import_states_zero_copy():
+    """import_states should make views of a writable blob."""
+
+    blob = export_states([torch.zeros(1, 2, 0, dtype=torch.float16), torch.arange(6.).view(1, 2, 3)])
+    states = import_states(blob)
+    blob[-4:] = bytes(4)
+
+    assert states[0].shape == (1, 2, 0) and states[0].dtype == torch.float16
+    assert states[1][0, 1, 2] == 0.
+
+
+def test_import_states_version():
+    """import_states should reject unknown blobs."""
+
+    blob = export_states([torch.zeros(1, 1, 1)])
+    with pytest.raises(RuntimeError):
+        import_states(b"XXXX" + bytes(blob[4:]))
+    blob_dtype = bytearray(blob)
+    blob_dtype[10] = 99
+    with pytest.raises(RuntimeError):
+        import_states(blob_dtype)
+    blob[4] = 99
+    with pytest.raises(RuntimeError):
+        import_states(blob)
+
+
+def test_export_states_little_endian(monkeypatch):
+    """export_states should write little endian data, also on big endian host."""
+
+    states = [torch.arange(6.).view(1, 2, 3), torch.tensor([[1.5]], dtype=torch.bfloat16)]
+    # header 10B | meta 2B + 3 * 8B | padding to 40B | data
+    assert export_states(states)[40:64] == struct.pack("<6f", *range(6))
+
+    # Emulated big endian host (on little endian one) swaps bytes on both export and import
+    monkeypatch.setattr(sys, "byteorder", "big")
+    blob = export_states(states)
+    assert blob[40:64] == struct.pack(">6f", *range(6))
+    assert all(equal(restored, state) for restored, state in zip(import_states(blob), states))
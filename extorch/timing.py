@@ -0,0 +1,17 @@
+"""Wall-clock timing utility."""
+
+from typing import Any, Callable
+import statistics
+import time
+
+
+def measure(fn: Callable[[], Any], n_warmup: int = 3, n_repeat: int = 10) -> float:
+    """Measure median wall-clock time [sec] of a `fn()` call."""
+    for _ in range(n_warmup):
+        fn()
+    times = []
+    for _ in range(n_repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
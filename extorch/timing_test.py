@@ -0,0 +1,8 @@
+"""Test of timing utility"""
+
+from .timing import measure
+
+
+def test_measure():
+    """`measure` should return non-negative time."""
+    assert measure(lambda: sum(range(100)), n_warmup=1, n_repeat=3) >= 0.
@@ -0,0 +1,164 @@
+"""Winograd fast convolution of Conv1dEx."""
+
+from functools import lru_cache
+from typing import Literal, Any
+import weakref
+
+import numpy as np
+import torch
+from torch import Tensor
+from torch import nn
+import torch.nn.functional as F
+
+from .conv1d import Conv1dEx
+from .precision import compute_dtype, accumulation_dtype
+
+
+# Transformed kernels `G g`, recomputed when the weight is replaced or modified in place
+_KERNELS: "weakref.WeakKeyDictionary[nn.Module, tuple[tuple[Any, ...], Tensor]]" = weakref.WeakKeyDictionary()
+
+# Interpolation points of Cook-Toom algorithm, small ones first for numerical accuracy (+ point at infinity)
+_POINTS = (0., 1., -1., 2., -2., 1/2, -1/2, 3., -3., 1/3, -1/3)
+
+
+def _evaluation(n_point: int, size: int) -> np.ndarray:
+    """Evaluation matrix of polynomial coefficients (`size`) at `n_point` points including infinity, (n_point, size)."""
+    points = np.array(_POINTS[: n_point - 1])
+    matrix = np.zeros((n_point, size))
+    matrix[:-1] = points[:, None] ** np.arange(size)[None, :]
+    # Point at infinity picks the leading coefficient
+    matrix[-1, -1] = 1.
+    return matrix
+
+
+def winograd_matrices(tile: int, kernel_size: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Transform matrices of Winograd F(m, r), `y = A^T [(G g) ⊙ (B^T d)]`.
+
+    F(m, r) yields `m` outputs of r-tap correlation from `n = m + r - 1` inputs with `n` multiplications (direct: `m * r`).
+    It is the transpose of Cook-Toom linear convolution `s = P_n^-1 [(P_r g) ⊙ (P_m h)]`, where P_k is the evaluation matrix.
+
+    Args:
+        tile        - Output tile size m
+        kernel_size - Kernel size r
+    Returns:
+                    - A^T (m, n), G (n, r), B^T (n, n)
+    """
+    n = tile + kernel_size - 1
+    if n > len(_POINTS) + 1:
+        raise RuntimeError(f"Winograd F({tile}, {kernel_size}) needs {n} points, but supported up to {len(_POINTS) + 1}.")
+    a_t = _evaluation(n, tile).T
+    g = _evaluation(n, kernel_size)
+    b_t = np.linalg.inv(_evaluation(n, n)).T
+    return a_t, g, b_t
+
+
+@lru_cache(maxsize=None)
+def _transforms(tile: int, kernel_size: int, dtype: torch.dtype, device: torch.device) -> tuple[Tensor, Tensor, Tensor]:
+    """A^T, G and B^T as constant tensors, out of module buffers so `module.to(dtype)` cannot round them."""
+    # Normal tensors even if first called in inference mode, so that they can be saved for backward later
+    with torch.inference_mode(False):
+        return tuple(torch.tensor(matrix, dtype=dtype, device=device) for matrix in winograd_matrices(tile, kernel_size))
+
+
+class WinogradConv1dEx(Conv1dEx):
+    """Conv1dEx with Winograd F(m, r) fast convolution, for small kernel stride-1 convolution on CPU.
+
+    Drop-in replacement of `Conv1dEx(..., stride=1, dilation=1, groups=1)`, including causal and `same` padding.
+    Output is tiled by `m`, and each tile is computed in the Winograd domain with `m + r - 1` (instead of `m * r`) channel-mixing matmuls.
+
+        input     |------n------|
+                          |------n------|
+        output    |--m--|--m--|--m--|        n = m + r - 1
+
+    Winograd transform amplifies rounding error as the tile grows, so output differs from the direct path in tolerance.
+    Transforms are applied in the accumulation dtype (fp32 for bf16/fp16), whatever dtype the module is cast to.
+    The kernel transform is cached while the weight is unchanged and autograd does not record it (e.g. inference).
+    """
+    def __init__(self,
+        in_channels:  int,
+        out_channels: int,
+        kernel_size:  int,
+        *args:        Any,
+        causal:       bool = False,
+        stride:       int  = 1,
+        padding:      Literal["same", "valid", "scale", "scale_drop", "scale_ceil"] | int | tuple[int] = 0,
+        dilation:     int  = 1,
+        groups:       int  = 1,
+        bias:         bool = True,
+        padding_mode: str  = "zeros",
+        tile:         int  = 4,
+        device             = None,
+        dtype              = None,
+    ):
+        """Arguments of `Conv1dEx`, and new option.
+
+        Args:
+            tile - Output tile size m of F(m, r)
+        """
+        if len(args) > 0:
+            raise RuntimeError("WinogradConv1dEx needs named arguments for stride and subsequents.")
+        if stride != 1 or dilation != 1 or groups != 1:
+            raise RuntimeError("WinogradConv1dEx support only `stride=1`, `dilation=1` and `groups=1`.")
+        if tile < 1:
+            raise RuntimeError(f"`tile` should be positive, but got {tile}.")
+        super().__init__(in_channels, out_channels, kernel_size, causal=causal, stride=stride, padding=padding, dilation=dilation,
+            groups=groups, bias=bias, padding_mode=padding_mode, device=device, dtype=dtype)
+        self.tile = tile
+        # Validate the tile eagerly, transforms themselves are built lazily per dtype/device
+        winograd_matrices(tile, kernel_size)
+
+    def forward(self, x: Tensor):
+        """Forward Conv1dEx with non-uniform padding, by Winograd convolution."""
+
+        # Non-zero padding needs padded input by nn.Conv1d, so fallback to the direct path
+        if self.padding_mode != "zeros":
+            return super().forward(x)
+
+        return self._forward_valid(F.pad(x, self._padding_total()))
+
+    def _kernel(self, transform_g: Tensor) -> Tensor:
+        """Transformed kernel `G g` :: (n, C_out, C_in), cached unless autograd records the weight.
+
+        Inference tensor weight (created in inference mode) has no version counter, so it is not cached either.
+        """
+        if (torch.is_grad_enabled() and self.weight.requires_grad) or self.weight.is_inference():
+            return torch.einsum("nr,oir->noi", transform_g, self.weight.to(transform_g.dtype))
+        version = (self.weight.data_ptr(), self.weight._version, transform_g.dtype, torch.is_inference_mode_enabled()) # pylint: disable=protected-access
+        cached = _KERNELS.get(self)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        u = torch.einsum("nr,oir->noi", transform_g, self.weight.to(transform_g.dtype))
+        _KERNELS[self] = (version, u)
+        return u
+
+    def _forward_valid(self, x: Tensor) -> Tensor:
+        """Forward convolution without any padding, by Winograd F(m, r)."""
+
+        unbatched = x.dim() == 2
+        x = x.unsqueeze(0) if unbatched else x
+        tile, kernel_size = self.tile, self.kernel_size[0]
+        n = tile + kernel_size - 1
+        len_o = x.size(-1) - kernel_size + 1
+        if len_o <= 0:
+            raise RuntimeError(f"Padded input length {x.size(-1)} is shorter than the effective kernel size.")
+
+        # Transforms in accumulation dtype (fp32 for reduced precision), matmul in compute dtype (autocast-able)
+        dtype = compute_dtype(self.weight)
+        acc_dtype = accumulation_dtype(dtype)
+        batch, n_tile = x.size(0), -(-len_o // tile)
+        transform_a_t, transform_g, transform_b_t = _transforms(tile, kernel_size, acc_dtype, x.device)
+
+        # Input tiles :: (B, C_in, T, n) -> Winograd domain (n, C_in, B*T)
+        x = F.pad(x.to(acc_dtype), (0, n_tile * tile + kernel_size - 1 - x.size(-1)))
+        v = torch.einsum("ut,bcjt->ucbj", transform_b_t, x.unfold(-1, n, tile)).reshape(n, self.in_channels, batch * n_tile)
+
+        # Element-wise product in Winograd domain = channel-mixing matmul per point, (n, C_out, B*T)
+        m = torch.bmm(self._kernel(transform_g), v).to(acc_dtype)
+
+        # Output tiles :: (m, C_out, B, T) -> (B, C_out, T*m)
+        o = torch.einsum("mu,uobj->bojm", transform_a_t, m.view(n, self.out_channels, batch, n_tile))
+        o = o.reshape(batch, self.out_channels, n_tile * tile)[..., :len_o]
+        if self.bias is not None:
+            o = o + self.bias.to(acc_dtype).unsqueeze(-1)
+        o = o.to(dtype)
+        return o.squeeze(0) if unbatched else o
@@ -0,0 +1,108 @@
+"""Test of Winograd Conv1dEx"""
+
+import numpy as np
+import pytest
+import torch
+from torch import allclose, no_grad # pylint: disable=no-name-in-module
+
+from .conv1d import Conv1dEx
+from . import winograd
+from .winograd import winograd_matrices, WinogradConv1dEx
+
+
+def test_winograd_matrices():
+    """Winograd F(m, r) transforms should yield the correlation of a tile."""
+
+    rng = np.random.default_rng(0)
+    for tile, kernel_size in ((2, 3), (4, 3), (6, 3), (2, 5), (4, 5)):
+        a_t, g, b_t = winograd_matrices(tile, kernel_size)
+        kernel, tile_i = rng.standard_normal(kernel_size), rng.standard_normal(tile + kernel_size - 1)
+        tile_o = a_t @ ((g @ kernel) * (b_t @ tile_i))
+        assert np.allclose(tile_o, np.correlate(tile_i, kernel, mode="valid"))
+
+
+def test_winograd_conv1dex_equivalence():
+    """WinogradConv1dEx should yield output identical to Conv1dEx in tolerance, including padding and streaming."""
+
+    torch.manual_seed(0)
+    with no_grad():
+        for causal, padding in ((True, "same"), (False, "same"), (True, "scale_drop"), (False, "valid"), (False, 2)):
+            for kernel_size, tile in ((3, 2), (3, 4), (3, 6), (5, 2), (5, 4)):
+                conv = Conv1dEx(6, 5, kernel_size, causal=causal, padding=padding)
+                conv_winograd = WinogradConv1dEx(6, 5, kernel_size, causal=causal, padding=padding, tile=tile)
+                conv_winograd.load_state_dict(conv.state_dict())
+                for length in (5, 17):
+                    ipt = torch.randn(2, 6, length)
+                    assert allclose(conv_winograd(ipt), conv(ipt), atol=1e-5)
+                assert allclose(conv_winograd(ipt[0]), conv(ipt[0]), atol=1e-5)
+
+                if causal:
+                    state = conv_winograd.init_state(2)
+                    opt0, state = conv_winograd.forward_stream(ipt[..., :7], state)
+                    opt1, state = conv_winograd.forward_stream(ipt[..., 7:], state)
+                    assert allclose(torch.cat([opt0, opt1, conv_winograd.flush_stream(state)], dim=-1), conv(ipt), atol=1e-5)
+
+
+def test_winograd_conv1dex_grad():
+    """WinogradConv1dEx should be differentiable as Conv1dEx."""
+
+    torch.manual_seed(0)
+    conv = Conv1dEx(3, 2, 3, causal=True, padding="same")
+    conv_winograd = WinogradConv1dEx(3, 2, 3, causal=True, padding="same")
+    conv_winograd.load_state_dict(conv.state_dict())
+    ipt = torch.randn(1, 3, 10)
+    conv(ipt).sum().backward()
+    conv_winograd(ipt).sum().backward()
+    assert allclose(conv_winograd.weight.grad, conv.weight.grad, atol=1e-5)
+
+
+def test_winograd_conv1dex_float64():
+    """WinogradConv1dEx should apply transforms in the weight dtype, so float64 conv keeps float64 accuracy."""
+
+    torch.manual_seed(0)
+    conv = Conv1dEx(4, 3, 5, causal=True, padding="same", dtype=torch.float64)
+    conv_winograd = WinogradConv1dEx(4, 3, 5, causal=True, padding="same", tile=6, dtype=torch.float64)
+    conv_winograd.load_state_dict(conv.state_dict())
+    ipt = torch.randn(2, 4, 30, dtype=torch.float64)
+    with torch.no_grad():
+        assert allclose(conv_winograd(ipt), conv(ipt), atol=1e-12)
+
+
+def test_winograd_conv1dex_unsupported():
+    """WinogradConv1dEx should reject strided/dilated/grouped conv."""
+
+    for kwargs in ({"stride": 2, "padding": "scale_drop"}, {"dilation": 2, "padding": "same"}, {"groups": 2, "padding": "same"}):
+        with pytest.raises(RuntimeError):
+            WinogradConv1dEx(4, 4, 3, causal=True, **kwargs)
+
+
+def test_winograd_conv1dex_bfloat16_cast():
+    """WinogradConv1dEx should keep fp32 transforms after `module.to(torch.bfloat16)`."""
+
+    torch.manual_seed(0)
+    conv = Conv1dEx(4, 3, 5, causal=True, padding="same")
+    conv_winograd = WinogradConv1dEx(4, 3, 5, causal=True, padding="same", tile=6)
+    conv_winograd.load_state_dict(conv.state_dict())
+    conv, conv_winograd = conv.to(torch.bfloat16), conv_winograd.to(torch.bfloat16)
+    assert len(list(conv_winograd.buffers())) == 0
+    ipt = torch.randn(2, 4, 30).to(torch.bfloat16)
+    with torch.no_grad():
+        assert allclose(conv_winograd(ipt).float(), conv(ipt).float(), atol=5e-2)
+
+
+def test_winograd_conv1dex_kernel_cache():
+    """WinogradConv1dEx should reuse the transformed kernel, and recompute it after in-place weight update."""
+
+    torch.manual_seed(0)
+    conv = Conv1dEx(3, 2, 3, causal=True, padding="same")
+    conv_winograd = WinogradConv1dEx(3, 2, 3, causal=True, padding="same")
+    conv_winograd.load_state_dict(conv.state_dict())
+    ipt = torch.randn(1, 3, 12)
+    with torch.no_grad():
+        conv_winograd(ipt)
+        kernel = winograd._KERNELS[conv_winograd][1] # pylint: disable=protected-access
+        conv_winograd(ipt)
+        assert winograd._KERNELS[conv_winograd][1] is kernel # pylint: disable=protected-access
+        conv.weight.mul_(2.)
+        conv_winograd.weight.mul_(2.)
+        assert allclose(conv_winograd(ipt), conv(ipt), atol=1e-5)